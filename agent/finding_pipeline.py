@@ -0,0 +1,324 @@
+"""
+Finding pipeline for the Judge Agent.
+Runs the expensive post-finding work (ASI analysis, Midnight proof, Unibase bounty)
+on background workers so message handlers return immediately.
+"""
+import os
+import sys
+import time
+import uuid
+import hashlib
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from pathlib import Path
+
+# Add agent directory to path for logger import
+sys.path.insert(0, str(Path(__file__).parent))
+from logger import log
+
+# Configuration
+JUDGE_PIPELINE_WORKERS = int(os.getenv("JUDGE_PIPELINE_WORKERS", "4"))
+JUDGE_PIPELINE_MAX_QUEUE = int(os.getenv("JUDGE_PIPELINE_MAX_QUEUE", "1000"))
+# When false, the bounty is recorded concurrently with analysis and proof submission
+JUDGE_BOUNTY_AFTER_PROOF = os.getenv("JUDGE_BOUNTY_AFTER_PROOF", "false").lower() == "true"
+
+# Repeated findings for the same (Red Team, Target, exploit) within this window are not re-processed
+JUDGE_IDEMPOTENCY_WINDOW = float(os.getenv("JUDGE_IDEMPOTENCY_WINDOW", "3600"))
+JUDGE_IDEMPOTENCY_MAX_ENTRIES = int(os.getenv("JUDGE_IDEMPOTENCY_MAX_ENTRIES", "10000"))
+
+# Number of finished findings kept for inspection
+RECENT_FINDINGS_LIMIT = 100
+
+
+@dataclass
+class Finding:
+    """A confirmed vulnerability waiting to be analyzed, proven and paid."""
+    red_team_address: str
+    exploit_payload: str
+    response_message: str
+    context: Any = None  # Handler context (used for its logger)
+    target_address: str = ""
+    finding_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    enqueued_at: float = field(default_factory=time.monotonic)
+    stage_timings: Dict[str, float] = field(default_factory=dict)  # stage -> seconds
+    analysis: Dict[str, Any] = field(default_factory=dict)
+    results: Dict[str, Any] = field(default_factory=dict)  # stage -> stage return value
+    errors: Dict[str, str] = field(default_factory=dict)  # stage -> error message
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "findingId": self.finding_id,
+            "redTeamAddress": self.red_team_address,
+            "exploitPayload": self.exploit_payload,
+            "stageTimings": dict(self.stage_timings),
+            "results": {k: v for k, v in self.results.items() if isinstance(v, (str, int, float, bool, type(None)))},
+            "errors": dict(self.errors),
+        }
+
+
+StageFn = Callable[[Finding], Awaitable[Any]]
+
+
+def normalize_exploit(exploit_payload: str) -> str:
+    """
+    Normalize an exploit payload so trivially different retransmissions compare equal.
+    
+    Args:
+        exploit_payload: The raw exploit payload
+        
+    Returns:
+        str: Payload with whitespace collapsed and case folded
+    """
+    return " ".join(exploit_payload.split()).casefold()
+
+
+class FindingIdempotencyCache:
+    """
+    Remembers processed findings by (Red Team, Target, normalized exploit).
+    
+    A duplicate seen within window_seconds maps to the original Finding, whether
+    it is still in flight or already finished, so ASI analysis, Midnight proof
+    submission and the Unibase bounty run once per distinct finding.
+    """
+    
+    def __init__(
+        self,
+        window_seconds: float = JUDGE_IDEMPOTENCY_WINDOW,
+        max_entries: int = JUDGE_IDEMPOTENCY_MAX_ENTRIES,
+    ):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        # key -> (first_seen, Finding); insertion order == age order
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def key_for(finding: Finding) -> str:
+        """Idempotency key of a finding."""
+        raw = "\x1f".join([
+            finding.red_team_address,
+            finding.target_address,
+            normalize_exploit(finding.exploit_payload),
+        ])
+        return hashlib.sha256(raw.encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[Finding]:
+        """
+        Look up the original finding for a key.
+        
+        Args:
+            key: Idempotency key from key_for()
+            
+        Returns:
+            Finding: The original finding, or None if unseen or outside the window
+        """
+        self._evict(time.monotonic())
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self.hits += 1
+        return entry[1]
+    
+    def put(self, key: str, finding: Finding) -> None:
+        """Remember a finding as the canonical result for its key."""
+        now = time.monotonic()
+        self._entries.pop(key, None)
+        self._entries[key] = (now, finding)
+        self._evict(now)
+    
+    def _evict(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._entries:
+            first_seen, _ = next(iter(self._entries.values()))
+            if first_seen >= cutoff and len(self._entries) <= self.max_entries:
+                break
+            self._entries.popitem(last=False)
+
+
+class FindingPipeline:
+    """
+    Bounded worker pool that processes findings off the message-handling path.
+
+    Each finding runs analysis -> proof submission, while the bounty stage runs
+    concurrently with that chain unless bounty_after_proof is set. Per-stage
+    timings (including time spent queued) are recorded on the finding and
+    aggregated for stats().
+    """
+
+    def __init__(
+        self,
+        analyze: StageFn,
+        submit_proof: StageFn,
+        award_bounty: StageFn,
+        workers: int = JUDGE_PIPELINE_WORKERS,
+        max_queue: int = JUDGE_PIPELINE_MAX_QUEUE,
+        bounty_after_proof: bool = JUDGE_BOUNTY_AFTER_PROOF,
+        idempotency: Optional[FindingIdempotencyCache] = None,
+    ):
+        self.analyze = analyze
+        self.submit_proof = submit_proof
+        self.award_bounty = award_bounty
+        self.workers = max(1, workers)
+        self.max_queue = max_queue
+        self.bounty_after_proof = bounty_after_proof
+        self.idempotency = idempotency
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._in_flight = 0
+        self._processed = 0
+        self._failed = 0
+        self._stage_totals: Dict[str, Dict[str, float]] = {}  # stage -> {count, total, max}
+        self._recent: List[Finding] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Spawn the worker tasks on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        log("Judge", f"Finding pipeline started with {self.workers} workers", "⚖️", "info")
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stop the workers.
+
+        Args:
+            drain: Wait for queued findings to finish before stopping
+        """
+        if not self.running:
+            return
+        if drain:
+            await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, finding: Finding) -> Finding:
+        """
+        Queue a finding for background processing.
+
+        Returns immediately unless the queue is full, in which case the caller
+        waits for room (backpressure instead of unbounded memory). With an
+        idempotency cache, a duplicate is not queued at all.
+
+        Args:
+            finding: The finding to process
+
+        Returns:
+            Finding: The queued finding (its timings fill in as stages complete),
+            or the original finding if this one is a duplicate
+        """
+        if self.idempotency is not None:
+            key = FindingIdempotencyCache.key_for(finding)
+            original = self.idempotency.get(key)
+            if original is not None:
+                return original
+            self.idempotency.put(key, finding)
+        
+        if not self.running:
+            self.start()
+        finding.enqueued_at = time.monotonic()
+        await self._queue.put(finding)
+        return finding
+
+    async def join(self) -> None:
+        """Wait until every queued finding has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Pipeline counters and per-stage timing aggregates.
+
+        Returns:
+            dict: Queue depth, in-flight and processed counts, stage timings in ms
+        """
+        stages = {
+            stage: {
+                "count": int(totals["count"]),
+                "avgMs": round(totals["total"] / totals["count"] * 1000, 2) if totals["count"] else 0.0,
+                "maxMs": round(totals["max"] * 1000, 2),
+            }
+            for stage, totals in self._stage_totals.items()
+        }
+        return {
+            "workers": self.workers,
+            "queueDepth": self._queue.qsize() if self._queue is not None else 0,
+            "inFlight": self._in_flight,
+            "processed": self._processed,
+            "failed": self._failed,
+            "bountyAfterProof": self.bounty_after_proof,
+            "duplicatesSkipped": self.idempotency.hits if self.idempotency is not None else 0,
+            "stages": stages,
+            "recent": [f.to_dict() for f in self._recent[-10:]],
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            finding = await self._queue.get()
+            self._in_flight += 1
+            try:
+                self._record_timing(finding, "queued", time.monotonic() - finding.enqueued_at)
+                await self._run(finding)
+                if finding.errors:
+                    self._failed += 1
+            except Exception as e:
+                self._failed += 1
+                log("Judge", f"Finding pipeline error: {str(e)}", "⚖️", "info")
+            finally:
+                self._in_flight -= 1
+                self._processed += 1
+                self._recent.append(finding)
+                if len(self._recent) > RECENT_FINDINGS_LIMIT:
+                    del self._recent[0]
+                self._queue.task_done()
+
+    async def _run(self, finding: Finding) -> None:
+        started = time.monotonic()
+
+        async def analysis_then_proof():
+            finding.analysis = await self._stage(finding, "analysis", self.analyze) or {}
+            await self._stage(finding, "proof", self.submit_proof)
+
+        if self.bounty_after_proof:
+            await analysis_then_proof()
+            await self._stage(finding, "bounty", self.award_bounty)
+        else:
+            await asyncio.gather(
+                analysis_then_proof(),
+                self._stage(finding, "bounty", self.award_bounty),
+            )
+
+        self._record_timing(finding, "total", time.monotonic() - started)
+
+    async def _stage(self, finding: Finding, name: str, fn: StageFn) -> Any:
+        started = time.monotonic()
+        try:
+            result = await fn(finding)
+            finding.results[name] = result
+            return result
+        except Exception as e:
+            finding.errors[name] = str(e)
+            log("Judge", f"Finding {finding.finding_id[:8]} stage '{name}' failed: {str(e)}", "⚖️", "info")
+            return None
+        finally:
+            self._record_timing(finding, name, time.monotonic() - started)
+
+    def _record_timing(self, finding: Finding, stage: str, seconds: float) -> None:
+        finding.stage_timings[stage] = round(seconds, 6)
+        totals = self._stage_totals.setdefault(stage, {"count": 0, "total": 0.0, "max": 0.0})
+        totals["count"] += 1
+        totals["total"] += seconds
+        totals["max"] = max(totals["max"], seconds)
@@ -15,19 +15,36 @@ from uagents_core.utils.registration import (  # pyright: ignore[reportMissingIm
 )
 import sys
 import os
+import time
+import uuid
+import hashlib
 import httpx  # pyright: ignore[reportMissingImports]
+from collections import OrderedDict, deque
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 # Add agent directory to path for logger import
 sys.path.insert(0, str(Path(__file__).parent))
 from logger import log
 from unibase import save_bounty_token
-from midnight_client import submit_audit_proof, generate_audit_id
+from midnight_client import (
+    submit_audit_proof,
+    generate_audit_id,
+    get_outbox,
+    get_submission_status,
+    proof_scheduler,
+    MIDNIGHT_OUTBOX_ENABLED
+)
+from finding_pipeline import Finding, FindingPipeline, FindingIdempotencyCache
+from secret_detector import create_detector
+from ledger_mirror import start_ledger_mirror, stop_ledger_mirror
 from proof_verifier import (
     verify_audit_proof,
     batch_verify,
+    verify_stream,
     get_verification_proof,
+    proof_cache,
     ProofVerificationResult
 )
 
@@ -42,16 +59,160 @@ AGENTVERSE_KEY = os.getenv("AGENTVERSE_KEY", "")
 class ResponseMessage(Model):
     status: str
     message: str
+    attack_id: Optional[str] = None
 
 
 class AttackMessage(Model):
     payload: str
+    attack_id: Optional[str] = None
+
+
+class BatchedAttack(Model):
+    attack_id: str
+    payload: str
+
+
+class AttackBatchMessage(Model):
+    batch_id: str
+    attacks: List[BatchedAttack]
+
+
+class BatchedVerdict(Model):
+    attack_id: str
+    status: str
+    message: str
+
+
+class ResponseBatchMessage(Model):
+    batch_id: str
+    verdicts: List[BatchedVerdict]
+
+
+class FindingEvent(Model):
+    red_team_address: str
+    attack_id: str
+    payload: str
+    status: str
+    message: str
+
+
+class TrafficDigest(Model):
+    period_start: str
+    period_end: str
+    denied_count: int
+    attackers: Dict[str, int]
+    payload_hashes: List[str]
+
+
+# Attack-response correlation: how long an attack waits for its verdict, and how many are tracked
+CORRELATION_TTL_SECONDS = float(os.getenv("JUDGE_CORRELATION_TTL", "300"))
+CORRELATION_MAX_ENTRIES = int(os.getenv("JUDGE_CORRELATION_MAX_ENTRIES", "10000"))
+
+
+# SUCCESS verdicts whose attack could not be attributed are kept for review (no bounty is paid)
+UNATTRIBUTED_FINDINGS_MAX = int(os.getenv("JUDGE_UNATTRIBUTED_FINDINGS_MAX", "100"))
+
+
+# Paged batchVerify streams not resumed within this many seconds are abandoned
+VERIFY_STREAM_TTL_SECONDS = 300
+
+# batchVerify pageSize used when the query's value is unusable, and the largest page served
+VERIFY_PAGE_SIZE_DEFAULT = 50
+VERIFY_PAGE_SIZE_MAX = 500
 
 
 # SECRET_KEY from target - use environment variable if available
 SECRET_KEY = os.getenv("TARGET_SECRET_KEY", "fetch_ai_2024")
 
 
+def parse_page_size(value: Any) -> int:
+    """
+    Parse a batchVerify pageSize from a query.
+    Falls back to VERIFY_PAGE_SIZE_DEFAULT for missing or non-numeric values
+    and clamps the result to 1..VERIFY_PAGE_SIZE_MAX.
+    """
+    try:
+        page_size = int(value)
+    except (TypeError, ValueError):
+        return VERIFY_PAGE_SIZE_DEFAULT
+    return min(max(page_size, 1), VERIFY_PAGE_SIZE_MAX)
+
+
+class AttackCorrelationTable:
+    """
+    Correlates Target responses with the Red Team attacks that caused them.
+    
+    Entries are keyed by attack ID, so inserts and lookups are O(1). Entries
+    expire after ttl_seconds, and the oldest are evicted beyond max_entries.
+    """
+    
+    def __init__(self, ttl_seconds: float = CORRELATION_TTL_SECONDS, max_entries: int = CORRELATION_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # attack_id -> (red_team_address, payload, recorded_at); insertion order == age order
+        self._entries: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def fallback_key(red_team_address: str, payload: str) -> str:
+        """
+        Key for attacks sent without an attack ID (Red Team address + payload hash).
+        """
+        return hashlib.sha256(f"{red_team_address}:{payload}".encode()).hexdigest()[:32]
+    
+    def record(self, attack_id: str, red_team_address: str, payload: str) -> None:
+        """
+        Track an attack until its verdict arrives.
+        
+        Args:
+            attack_id: Correlation ID carried by the attack and its response
+            red_team_address: Address of the Red Team that sent the attack
+            payload: The attack payload
+        """
+        now = time.monotonic()
+        self._entries.pop(attack_id, None)
+        self._entries[attack_id] = (red_team_address, payload, now)
+        self._evict(now)
+    
+    def resolve(self, attack_id: str) -> Optional[Tuple[str, str]]:
+        """
+        Pop the attack a response refers to.
+        
+        Args:
+            attack_id: Correlation ID from the response
+            
+        Returns:
+            tuple: (red_team_address, payload), or None if unknown or expired
+        """
+        self._evict(time.monotonic())
+        entry = self._entries.pop(attack_id, None)
+        return (entry[0], entry[1]) if entry else None
+    
+    def latest(self) -> Optional[Tuple[str, str]]:
+        """
+        Most recent live attack, for responses that carry no attack ID.
+        
+        Returns:
+            tuple: (red_team_address, payload), or None if the table is empty
+        """
+        self._evict(time.monotonic())
+        if not self._entries:
+            return None
+        red_team_address, payload, _ = self._entries[next(reversed(self._entries))]
+        return red_team_address, payload
+    
+    def _evict(self, now: float) -> None:
+        """Drop expired entries and enforce the memory bound, oldest first."""
+        cutoff = now - self.ttl_seconds
+        while self._entries:
+            _, _, recorded_at = next(iter(self._entries.values()))
+            if recorded_at >= cutoff and len(self._entries) <= self.max_entries:
+                break
+            self._entries.popitem(last=False)
+
+
 async def analyze_vulnerability_with_asi(exploit_payload: str, response_message: str) -> dict:
     """
     Use ASI.Cloud API to analyze vulnerability severity and generate risk assessment.
@@ -181,19 +342,40 @@ def create_judge_agent(port: int = None) -> Agent:
         # Agent will continue to function without chat protocol
 
     state = {
-        "monitored_attacks": {},  # Track attack flow: {red_team_address: last_payload}
-        "attack_flow": [],  # Track attack sequence: [(red_team_address, payload, timestamp)]
+        "correlation": AttackCorrelationTable(),  # attack_id -> (red_team_address, payload)
+        "secret_detector": create_detector(SECRET_KEY),  # per-target secrets and canaries
         "bounties_awarded": 0,
         "audit_proofs": {},  # audit_id -> proof_hash
         "verified_proofs": {},  # proof_id -> ProofVerificationResult
+        "verify_streams": {},  # cursor -> paged batchVerify stream
+        "unattributed_findings": deque(maxlen=UNATTRIBUTED_FINDINGS_MAX),  # leaks with no known attacker
+        "traffic_stats": {  # Aggregated from Target digests (digest mode)
+            "digests_received": 0,
+            "denied_attacks": 0,
+            "attackers": {},  # red_team_address -> denied attacks
+            "last_period_end": None,
+        },
     }
 
+    def record_landed_proof(audit_id: str, proof_hash: str):
+        """Replace a provisional proof hash once the outbox lands the real proof."""
+        state["audit_proofs"][audit_id] = proof_hash
+
     @judge.on_event("startup")
     async def introduce(ctx: Context):
         ctx.logger.info(f"Judge Agent started: {judge.address}")
         log("Judge", f"Judge Agent started: {judge.address}", "⚖️", "info")
         log("Judge", "Monitoring Red Team and Target communications...", "⚖️", "info")
         
+        # Mirror the AuditVerifier ledger locally (MIDNIGHT_LEDGER_MIRROR=true)
+        start_ledger_mirror()
+        
+        # Resume proof submissions left pending by a previous run
+        if MIDNIGHT_OUTBOX_ENABLED:
+            outbox = get_outbox()
+            outbox.add_listener(record_landed_proof)
+            outbox.start()
+        
         # Register with Agentverse
         try:
             agentverse_key = os.environ.get("AGENTVERSE_KEY") or AGENTVERSE_KEY
@@ -218,6 +400,150 @@ def create_judge_agent(port: int = None) -> Agent:
             ctx.logger.error(f"Failed to register with Agentverse: {str(e)}")
             log("Judge", f"Agentverse registration error: {str(e)}", "⚖️", "info")
 
+    @judge.on_event("shutdown")
+    async def drain_pipeline(ctx: Context):
+        # Let queued findings finish their proof and bounty before exiting
+        await pipeline.stop(drain=True)
+        await stop_ledger_mirror()
+        if MIDNIGHT_OUTBOX_ENABLED:
+            await get_outbox().stop()
+
+    def detect_leak(target_address: str, status: str, message: str):
+        """
+        Scan a SUCCESS response for any secret guarded by the responding Target.
+        Returns the first SecretMatch, or None if nothing registered leaked.
+        """
+        if status != "SUCCESS":
+            return None
+        leak = state["secret_detector"].first_leak(message, target_address)
+        if leak:
+            log("Judge", f"Secret '{leak.label}' of target {leak.target_address[:20]} leaked", "⚖️", "info")
+        return leak
+
+    def resolve_attacker(attack_id: Optional[str] = None) -> Optional[Tuple[str, str]]:
+        """
+        Find which Red Team sent the attack that triggered a SUCCESS.
+        The sender of a response is the Target, so attribution comes from the correlation table.
+        Returns None when the attack is unknown or expired; nobody is paid for it.
+        """
+        if attack_id:
+            attack = state["correlation"].resolve(attack_id)
+            if attack is None:
+                log("Judge", f"No monitored attack for ID {attack_id[:16]} (expired or never seen)", "⚖️", "info")
+            return attack
+        # Legacy response without an attack ID: use the most recent attack
+        return state["correlation"].latest()
+
+    def hold_unattributed(attack_id: Optional[str], target_address: str, response_message: str):
+        """Keep a leak nobody can be credited for, instead of paying a bounty."""
+        state["unattributed_findings"].append({
+            "attack_id": attack_id,
+            "target_address": target_address,
+            "response_message": response_message,
+            "received_at": datetime.now().isoformat(),
+        })
+        log("Judge", f"Leak from {target_address[:20]} could not be attributed to a Red Team; held without bounty", "⚖️", "info")
+
+    async def analyze_stage(finding: Finding) -> dict:
+        """Pipeline stage: use ASI API to analyze vulnerability severity."""
+        vulnerability_analysis = await analyze_vulnerability_with_asi(finding.exploit_payload, finding.response_message)
+        risk_score = vulnerability_analysis.get("risk_score", 98)
+        severity = vulnerability_analysis.get("severity", "CRITICAL")
+        recommendation = vulnerability_analysis.get("recommendation", "Immediate remediation required.")
+        
+        log("Judge", f"CRITICAL VULNERABILITY CONFIRMED. Risk Score: {risk_score}/100. Severity: {severity}", "⚖️", "vulnerability", is_vulnerability=True)
+        log("Judge", f"ASI Analysis: {recommendation}", "🧠", "info")
+        return vulnerability_analysis
+
+    async def proof_stage(finding: Finding) -> str:
+        """Pipeline stage: submit the ZK audit proof to Midnight."""
+        ctx = finding.context
+        risk_score = finding.analysis.get("risk_score", 98)
+        threshold = 90
+        
+        # Generate audit_id
+        timestamp = datetime.now().isoformat()
+        audit_id = generate_audit_id(finding.exploit_payload, timestamp)
+        
+        # Submit ZK proof to Midnight
+        try:
+            proof_hash = await submit_audit_proof(
+                audit_id=audit_id,
+                exploit_string=finding.exploit_payload,
+                risk_score=risk_score,
+                auditor_id=judge.address[:64] if len(judge.address) >= 64 else judge.address + "0" * (64 - len(judge.address)),
+                threshold=threshold
+            )
+            
+            if proof_hash:
+                state["audit_proofs"][audit_id] = proof_hash
+                ctx.logger.info(f"Audit proof submitted: {proof_hash}")
+            else:
+                ctx.logger.warning("Failed to submit audit proof to Midnight")
+            return proof_hash
+                
+        except Exception as e:
+            ctx.logger.error(f"Failed to submit audit proof: {str(e)}")
+            log("Judge", f"Error submitting audit proof: {str(e)}", "⚖️", "info")
+            raise
+
+    async def bounty_stage(finding: Finding) -> str:
+        """Pipeline stage: trigger Unibase transaction for bounty token."""
+        ctx = finding.context
+        red_team_address = finding.red_team_address
+        try:
+            # Pass None to auto-detect Membase usage based on MEMBASE_ENABLED
+            transaction_hash = await save_bounty_token(
+                recipient_address=red_team_address,
+                exploit_string=finding.exploit_payload,
+                use_mcp=None
+            )
+            
+            state["bounties_awarded"] += 1
+            log("Judge", f"Bounty Token awarded to {red_team_address[:20]}...", "⚖️", "info")
+            log("Judge", f"Transaction: {transaction_hash}", "⚖️", "info")
+            ctx.logger.info(f"Bounty Token transaction: {transaction_hash}")
+            return transaction_hash
+            
+        except Exception as e:
+            ctx.logger.error(f"Failed to save bounty token: {str(e)}")
+            log("Judge", f"Error saving bounty token: {str(e)}", "⚖️", "info")
+            raise
+
+    pipeline = FindingPipeline(
+        analyze=analyze_stage,
+        submit_proof=proof_stage,
+        award_bounty=bounty_stage,
+        idempotency=FindingIdempotencyCache(),
+    )
+
+    async def process_finding(
+        ctx: Context,
+        red_team_address: str,
+        exploit_payload: str,
+        response_message: str,
+        target_address: str = "",
+    ) -> Finding:
+        """
+        Hand a confirmed vulnerability to the background pipeline (analysis, proof, bounty).
+        Returns as soon as the finding is queued. A replayed or retransmitted finding
+        short-circuits to the original one without touching ASI, Midnight or Unibase.
+        """
+        ctx.logger.info("CRITICAL VULNERABILITY CONFIRMED!")
+        new_finding = Finding(
+            red_team_address=red_team_address,
+            exploit_payload=exploit_payload,
+            response_message=response_message,
+            context=ctx,
+            target_address=target_address,
+        )
+        finding = await pipeline.submit(new_finding)
+        if finding is not new_finding:
+            log("Judge", f"Duplicate finding from {red_team_address[:20]}... already handled as {finding.finding_id[:8]}, skipping", "⚖️", "info")
+        else:
+            log("Judge", f"Finding {finding.finding_id[:8]} queued for analysis, proof and bounty", "⚖️", "info")
+        return finding
+
     @judge.on_message(model=AttackMessage)
     async def handle_attack_message(ctx: Context, sender: str, msg: AttackMessage):
         """
@@ -227,106 +553,145 @@ def create_judge_agent(port: int = None) -> Agent:
         log("Judge", f"Monitoring attack: {sender} → Target (payload: '{msg.payload}')", "⚖️", "info")
         
         # Track the attack for later correlation with response
-        state["monitored_attacks"][sender] = msg.payload
-        state["attack_flow"].append((sender, msg.payload, datetime.now().isoformat()))
-        
-        # Keep only last 10 attacks to prevent memory growth
-        if len(state["attack_flow"]) > 10:
-            state["attack_flow"] = state["attack_flow"][-10:]
+        attack_id = msg.attack_id or AttackCorrelationTable.fallback_key(sender, msg.payload)
+        state["correlation"].record(attack_id, sender, msg.payload)
 
     @judge.on_message(model=ResponseMessage)
     async def handle_target_response(ctx: Context, sender: str, msg: ResponseMessage):
         """
-        Monitor Target responses. If SUCCESS with SECRET_KEY, trigger Unibase bounty transaction.
+        Monitor Target responses. If SUCCESS leaks a registered secret, trigger Unibase bounty transaction.
         """
         ctx.logger.info(f"Judge intercepted response from {sender}: {msg.status}")
         log("Judge", "INTERCEPTION. Analyzing Target response against risk matrix.", "⚖️", "info")
         
-        # Check if this is a SUCCESS response with SECRET_KEY
-        if msg.status == "SUCCESS" and SECRET_KEY in msg.message:
-            # Find which Red Team sent the attack (sender is Target, need to find Red Team)
-            # In a real scenario, we'd track this better, but for now we'll use the sender context
-            red_team_address = None
-            exploit_payload = None
-            
-            # Find which Red Team sent the attack that triggered this SUCCESS
-            # The sender here is the Target, so we need to find the Red Team from attack flow
-            red_team_address = None
-            exploit_payload = None
-            
-            if state["attack_flow"]:
-                # Get the most recent attack (assumes responses come in order)
-                red_team_address, exploit_payload, _ = state["attack_flow"][-1]
-            elif state["monitored_attacks"]:
-                # Fallback: use most recent monitored attack
-                red_team_address = list(state["monitored_attacks"].keys())[-1]
-                exploit_payload = state["monitored_attacks"][red_team_address]
-            else:
-                # Final fallback: use placeholder
-                red_team_address = "agent1qf2mssnkhf29fk7vj2fy8ekmhdfke0ptu4k9dyvfcuk7tt6easatge9z96d"
-                exploit_payload = SECRET_KEY
-            
-            ctx.logger.info("CRITICAL VULNERABILITY CONFIRMED!")
-            
-            # Use ASI API to analyze vulnerability severity
-            vulnerability_analysis = await analyze_vulnerability_with_asi(exploit_payload, msg.message)
-            risk_score = vulnerability_analysis.get("risk_score", 98)
-            severity = vulnerability_analysis.get("severity", "CRITICAL")
-            recommendation = vulnerability_analysis.get("recommendation", "Immediate remediation required.")
-            
-            log("Judge", f"CRITICAL VULNERABILITY CONFIRMED. Risk Score: {risk_score}/100. Severity: {severity}", "⚖️", "vulnerability", is_vulnerability=True)
-            log("Judge", f"ASI Analysis: {recommendation}", "🧠", "info")
-            
-            threshold = 90
-            
-            # Generate audit_id
-            timestamp = datetime.now().isoformat()
-            audit_id = generate_audit_id(exploit_payload, timestamp)
-            
-            # Submit ZK proof to Midnight
-            try:
-                proof_hash = await submit_audit_proof(
-                    audit_id=audit_id,
-                    exploit_string=exploit_payload,
-                    risk_score=risk_score,
-                    auditor_id=judge.address[:64] if len(judge.address) >= 64 else judge.address + "0" * (64 - len(judge.address)),
-                    threshold=threshold
-                )
-                
-                if proof_hash:
-                    state["audit_proofs"][audit_id] = proof_hash
-                    ctx.logger.info(f"Audit proof submitted: {proof_hash}")
-                else:
-                    ctx.logger.warning("Failed to submit audit proof to Midnight")
-                    
-            except Exception as e:
-                ctx.logger.error(f"Failed to submit audit proof: {str(e)}")
-                log("Judge", f"Error submitting audit proof: {str(e)}", "⚖️", "info")
-            
-            # Trigger Unibase transaction for bounty token
-            try:
-                # Pass None to auto-detect Membase usage based on MEMBASE_ENABLED
-                transaction_hash = await save_bounty_token(
-                    recipient_address=red_team_address,
-                    exploit_string=exploit_payload,
-                    use_mcp=None
-                )
-                
-                state["bounties_awarded"] += 1
-                log("Judge", f"Bounty Token awarded to {red_team_address[:20]}...", "⚖️", "info")
-                log("Judge", f"Transaction: {transaction_hash}", "⚖️", "info")
-                ctx.logger.info(f"Bounty Token transaction: {transaction_hash}")
-                
-            except Exception as e:
-                ctx.logger.error(f"Failed to save bounty token: {str(e)}")
-                log("Judge", f"Error saving bounty token: {str(e)}", "⚖️", "info")
+        # Check if this is a SUCCESS response leaking a registered secret
+        if detect_leak(sender, msg.status, msg.message):
+            attack = resolve_attacker(msg.attack_id)
+            if attack is None:
+                hold_unattributed(msg.attack_id, sender, msg.message)
+                return
+            red_team_address, exploit_payload = attack
+            await process_finding(ctx, red_team_address, exploit_payload, msg.message, target_address=sender)
         else:
+            if msg.attack_id:
+                state["correlation"].resolve(msg.attack_id)
             log("Judge", f"Response analyzed: {msg.status} - No vulnerability detected.", "⚖️", "info")
 
+    @judge.on_message(model=AttackBatchMessage)
+    async def handle_attack_batch(ctx: Context, sender: str, msg: AttackBatchMessage):
+        """
+        Track every attack of a batch by its attack ID for exact correlation with verdicts.
+        """
+        ctx.logger.info(f"Judge intercepted attack batch {msg.batch_id} from {sender}: {len(msg.attacks)} payloads")
+        log("Judge", f"Monitoring attack batch: {sender} → Target ({len(msg.attacks)} payloads)", "⚖️", "info")
+        
+        for attack in msg.attacks:
+            state["correlation"].record(attack.attack_id, sender, attack.payload)
+
+    @judge.on_message(model=ResponseBatchMessage)
+    async def handle_response_batch(ctx: Context, sender: str, msg: ResponseBatchMessage):
+        """
+        Evaluate every verdict of a batch in one pass; findings are attributed by attack ID.
+        """
+        ctx.logger.info(f"Judge intercepted response batch {msg.batch_id} from {sender}: {len(msg.verdicts)} verdicts")
+        log("Judge", f"INTERCEPTION. Analyzing {len(msg.verdicts)} Target responses against risk matrix.", "⚖️", "info")
+        
+        findings = 0
+        for verdict in msg.verdicts:
+            if not detect_leak(sender, verdict.status, verdict.message):
+                state["correlation"].resolve(verdict.attack_id)
+                continue
+            
+            findings += 1
+            attack = resolve_attacker(verdict.attack_id)
+            if attack is None:
+                hold_unattributed(verdict.attack_id, sender, verdict.message)
+                continue
+            red_team_address, exploit_payload = attack
+            await process_finding(ctx, red_team_address, exploit_payload, verdict.message, target_address=sender)
+        
+        if not findings:
+            log("Judge", f"Batch analyzed: {len(msg.verdicts)} responses - No vulnerability detected.", "⚖️", "info")
+
+    @judge.on_message(model=FindingEvent)
+    async def handle_finding_event(ctx: Context, sender: str, msg: FindingEvent):
+        """
+        Digest mode: the Target reports a SUCCESS directly, with full attribution.
+        """
+        ctx.logger.info(f"Judge received finding from {sender}: {msg.status} (Red Team {msg.red_team_address})")
+        log("Judge", "INTERCEPTION. Analyzing reported finding against risk matrix.", "⚖️", "info")
+        
+        if detect_leak(sender, msg.status, msg.message):
+            await process_finding(ctx, msg.red_team_address, msg.payload, msg.message, target_address=sender)
+        else:
+            log("Judge", f"Finding rejected: {msg.status} - No vulnerability detected.", "⚖️", "info")
+
+    @judge.on_message(model=TrafficDigest)
+    async def handle_traffic_digest(ctx: Context, sender: str, msg: TrafficDigest):
+        """
+        Digest mode: fold a periodic summary of DENIED traffic into the monitoring stats.
+        """
+        stats = state["traffic_stats"]
+        stats["digests_received"] += 1
+        stats["denied_attacks"] += msg.denied_count
+        stats["last_period_end"] = msg.period_end
+        for red_team_address, count in msg.attackers.items():
+            stats["attackers"][red_team_address] = stats["attackers"].get(red_team_address, 0) + count
+        
+        ctx.logger.info(f"Judge received traffic digest from {sender}: {msg.denied_count} denied")
+        log("Judge", f"Traffic digest: {msg.denied_count} attacks denied from {len(msg.attackers)} Red Team(s), {len(msg.payload_hashes)} distinct payloads", "⚖️", "info")
+
     # ============================================================================
     # Proof Verification Methods
     # ============================================================================
     
+    async def next_verify_page(proof_ids: List[str], auditor_id: Optional[str], cursor: Optional[str], page_size: int) -> dict:
+        """
+        Return the next page of a streamed batch verification.
+        The first call (no cursor) starts the stream; later calls pass the returned cursor.
+        Results come in completion order and carry their index into proofIds.
+        """
+        streams = state["verify_streams"]
+        now = time.monotonic()
+        for stale in [c for c, e in streams.items() if now - e["touched"] > VERIFY_STREAM_TTL_SECONDS]:
+            await streams.pop(stale)["stream"].aclose()
+        
+        if cursor:
+            entry = streams.get(cursor)
+            if entry is None:
+                return {"error": "Unknown or expired cursor"}
+        else:
+            if not proof_ids:
+                return {"error": "proofIds array is required"}
+            cursor = uuid.uuid4().hex
+            entry = {"stream": verify_stream(proof_ids, auditor_id), "proof_ids": proof_ids, "returned": 0}
+            streams[cursor] = entry
+        entry["touched"] = now
+        
+        page = []
+        done = False
+        while len(page) < max(1, page_size):
+            try:
+                index, result = await entry["stream"].__anext__()
+            except StopAsyncIteration:
+                done = True
+                break
+            page.append({"index": index, "proofId": entry["proof_ids"][index], **result.to_dict()})
+        
+        entry["returned"] += len(page)
+        if entry["returned"] >= len(entry["proof_ids"]):
+            done = True
+        if done:
+            streams.pop(cursor, None)
+            await entry["stream"].aclose()
+        
+        return {
+            "cursor": None if done else cursor,
+            "results": page,
+            "done": done,
+            "total": len(entry["proof_ids"]),
+        }
+    
     @judge.on_query()
     async def verify_audit_proof_handler(ctx: Context, query: dict):
         """
@@ -348,6 +713,11 @@ def create_judge_agent(port: int = None) -> Agent:
         elif query.get("method") == "batchVerify":
             proof_ids = query.get("proofIds", [])
             auditor_id = query.get("auditorId")
+            page_size = query.get("pageSize")
+            cursor = query.get("cursor")
+            
+            if cursor or page_size:
+                return await next_verify_page(proof_ids, auditor_id, cursor, parse_page_size(page_size))
             
             if not proof_ids:
                 return {"error": "proofIds array is required"}
@@ -368,12 +738,31 @@ def create_judge_agent(port: int = None) -> Agent:
             else:
                 return {"error": "Proof not found"}
         
+        elif query.get("method") == "pipelineStats":
+            return pipeline.stats()
+        
+        elif query.get("method") == "trafficStats":
+            return state["traffic_stats"]
+        
+        elif query.get("method") == "unattributedFindings":
+            return {"findings": list(state["unattributed_findings"])}
+        
+        elif query.get("method") == "proofCacheStats":
+            return proof_cache.stats()
+        
+        elif query.get("method") == "submissionStatus":
+            audit_id = query.get("auditId")
+            if not audit_id:
+                return {**get_outbox().stats(), "scheduler": proof_scheduler.stats()}
+            return get_submission_status(audit_id) or {"error": "Unknown audit"}
+        
         return {"error": "Unknown method"}
     
     # Add verification methods as class methods for direct access
     judge.verify_audit_proof = lambda proof_id, auditor_id=None: verify_audit_proof(proof_id, auditor_id)
     judge.batch_verify = lambda proof_ids, auditor_id=None: batch_verify(proof_ids, auditor_id)
     judge.get_verification_proof = lambda proof_id, format="json": get_verification_proof(proof_id, format)
+    judge.finding_pipeline = pipeline
 
     return judge
 
@@ -0,0 +1,436 @@
+"""
+Local mirror of the AuditVerifier ledger.
+Streams changes to the contract's public maps (proofs, is_verified, auditor_id) into
+an in-memory table persisted to disk, so proof verification and audit queries become
+local lookups instead of HTTP GraphQL polls. Changes come from the Midnight API's
+incremental /api/ledger/changes feed, or from an indexer WebSocket subscription
+(graphql-transport-ws).
+"""
+import os
+import sys
+import json
+import uuid
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Optional
+from pathlib import Path
+
+import httpx
+
+# Add agent directory to path for logger import
+sys.path.insert(0, str(Path(__file__).parent))
+from logger import log
+
+# Try to import the WebSocket client (installed with uvicorn[standard])
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    websockets = None
+    WEBSOCKETS_AVAILABLE = False
+
+# Configuration
+MIDNIGHT_LEDGER_MIRROR = os.getenv("MIDNIGHT_LEDGER_MIRROR", "false").lower() == "true"
+MIDNIGHT_INDEXER_WS = os.getenv("MIDNIGHT_INDEXER_WS", "ws://localhost:6300/graphql/ws")
+MIDNIGHT_CONTRACT_ADDRESS = os.getenv("MIDNIGHT_CONTRACT_ADDRESS", "")
+MIDNIGHT_LEDGER_MIRROR_PATH = os.getenv(
+    "MIDNIGHT_LEDGER_MIRROR_PATH", str(Path(__file__).parent / "ledger_mirror.json")
+)
+MIDNIGHT_LEDGER_MIRROR_FLUSH_SECONDS = float(os.getenv("MIDNIGHT_LEDGER_MIRROR_FLUSH_SECONDS", "1.0"))
+# "api" polls the Midnight API change feed, "indexer" subscribes to MIDNIGHT_INDEXER_WS
+MIDNIGHT_LEDGER_MIRROR_SOURCE = os.getenv("MIDNIGHT_LEDGER_MIRROR_SOURCE", "api").lower()
+MIDNIGHT_API_URL = os.getenv("MIDNIGHT_API_URL", "http://localhost:8000")
+MIDNIGHT_LEDGER_MIRROR_POLL_SECONDS = float(os.getenv("MIDNIGHT_LEDGER_MIRROR_POLL_SECONDS", "5.0"))
+MIDNIGHT_LEDGER_MIRROR_PAGE_SIZE = int(os.getenv("MIDNIGHT_LEDGER_MIRROR_PAGE_SIZE", "1000"))
+
+# Reconnect backoff (seconds)
+RECONNECT_INITIAL_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
+# Ledger maps of the AuditVerifier contract and the proof-data field each one feeds
+LEDGER_MAPS = {
+    "proofs": "proof_hash",
+    "is_verified": "is_verified",
+    "auditor_id": "auditor_id",
+}
+
+GRAPHQL_WS_PROTOCOL = "graphql-transport-ws"
+
+SUBSCRIPTION_QUERY = """
+subscription AuditVerifierChanges($contractAddress: String!, $fromBlock: Int) {
+    auditVerifierChanges(address: $contractAddress, fromBlock: $fromBlock) {
+        blockHeight
+        blockTimestamp
+        map
+        key
+        value
+    }
+}
+"""
+
+
+class LedgerMirror:
+    """
+    In-memory and on-disk copy of the AuditVerifier ledger maps.
+
+    Changes are applied idempotently, so on reconnect the subscription resumes
+    from the last applied block (inclusive) without losing a partially applied
+    block. Lookups only answer for audits whose entries in all three maps have
+    been mirrored; callers fall back to the bridge or indexer for anything else.
+    """
+
+    def __init__(
+        self,
+        contract_address: str = MIDNIGHT_CONTRACT_ADDRESS,
+        ws_url: str = MIDNIGHT_INDEXER_WS,
+        path: Optional[str] = MIDNIGHT_LEDGER_MIRROR_PATH,
+        flush_seconds: float = MIDNIGHT_LEDGER_MIRROR_FLUSH_SECONDS,
+    ):
+        self.contract_address = contract_address
+        self.ws_url = ws_url
+        self.path = path
+        self.flush_seconds = flush_seconds
+        self.last_block = 0
+        self.changes_applied = 0
+        self.connected = False
+        self._audits: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._last_flush = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._audits)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def get(self, audit_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an audit in the mirror.
+
+        Args:
+            audit_id: The audit ID
+
+        Returns:
+            dict: Proof data in the proof_verifier shape, or None if not (fully) mirrored
+        """
+        record = self._audits.get(audit_id)
+        if record is None or any(field not in record for field in LEDGER_MAPS.values()):
+            return None  # Not every map has been seen yet (e.g. mid-block)
+        return dict(record)
+
+    def apply(self, change: Dict[str, Any]) -> None:
+        """
+        Apply one ledger map change.
+
+        Args:
+            change: {"blockHeight", "blockTimestamp", "map", "key", "value"}
+        """
+        field_name = LEDGER_MAPS.get(change.get("map"))
+        if field_name is None:
+            return
+        audit_id = change["key"]
+        block_height = int(change.get("blockHeight") or 0)
+
+        record = self._audits.get(audit_id)
+        if record is None:
+            record = {
+                "audit_id": audit_id,
+                "proof_timestamp": change.get("blockTimestamp") or datetime.now().isoformat(),
+                "block_height": block_height,
+            }
+            self._audits[audit_id] = record
+        record[field_name] = change.get("value")
+
+        self.last_block = max(self.last_block, block_height)
+        self.changes_applied += 1
+        self._dirty = True
+
+    def load(self) -> int:
+        """
+        Load the mirror from disk.
+
+        Returns:
+            int: Number of audits loaded
+        """
+        if not self.path or not os.path.exists(self.path):
+            return 0
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            log("LedgerMirror", f"Could not load mirror from {self.path}: {str(e)}", "⚠️", "warn")
+            return 0
+
+        if data.get("contractAddress", "") != self.contract_address:
+            log("LedgerMirror", "Mirror on disk belongs to another contract, starting fresh", "⚠️", "warn")
+            return 0
+
+        self._audits = data.get("audits", {})
+        self.last_block = int(data.get("lastBlock", 0))
+        self._restore(data)
+        return len(self._audits)
+
+    def _restore(self, data: Dict[str, Any]) -> None:
+        """Hook for subclasses to read their own sync position from disk."""
+
+    def save(self) -> None:
+        """Write the mirror to disk atomically."""
+        if not self.path:
+            return
+        data = {
+            "contractAddress": self.contract_address,
+            "lastBlock": self.last_block,
+            "audits": self._audits,
+            **self._extra_state(),
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def _extra_state(self) -> Dict[str, Any]:
+        """Hook for subclasses to persist their own sync position."""
+        return {}
+
+    def _maybe_flush(self, now: float) -> None:
+        if self._dirty and now - self._last_flush >= self.flush_seconds:
+            self.save()
+            self._last_flush = now
+
+    def start(self) -> None:
+        """Load the on-disk mirror and start the background subscriber."""
+        if self.running:
+            return
+        if not WEBSOCKETS_AVAILABLE:
+            log("LedgerMirror", "websockets package not installed, ledger mirror disabled", "⚠️", "warn")
+            return
+        loaded = self.load()
+        log("LedgerMirror", f"Loaded {loaded} audits, resuming from block {self.last_block}", "🪞", "info")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the subscriber and flush the mirror to disk."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._dirty:
+            self.save()
+
+    def stats(self) -> Dict[str, Any]:
+        """Mirror size and sync position."""
+        return {
+            "audits": len(self._audits),
+            "lastBlock": self.last_block,
+            "changesApplied": self.changes_applied,
+            "connected": self.connected,
+        }
+
+    async def _run(self) -> None:
+        delay = RECONNECT_INITIAL_DELAY
+        while True:
+            try:
+                await self._subscribe()
+                delay = RECONNECT_INITIAL_DELAY
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log("LedgerMirror", f"Indexer subscription lost: {str(e)}", "⚠️", "warn")
+            finally:
+                self.connected = False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    async def _subscribe(self) -> None:
+        """Run one subscription until the connection closes."""
+        loop = asyncio.get_running_loop()
+        async with websockets.connect(self.ws_url, subprotocols=[GRAPHQL_WS_PROTOCOL]) as ws:
+            await ws.send(json.dumps({"type": "connection_init", "payload": {}}))
+            ack = json.loads(await ws.recv())
+            if ack.get("type") != "connection_ack":
+                raise ConnectionError(f"Unexpected indexer handshake: {ack.get('type')}")
+
+            subscription_id = uuid.uuid4().hex
+            await ws.send(json.dumps({
+                "id": subscription_id,
+                "type": "subscribe",
+                "payload": {
+                    "query": SUBSCRIPTION_QUERY,
+                    "variables": {
+                        "contractAddress": self.contract_address,
+                        "fromBlock": self.last_block,
+                    },
+                },
+            }))
+            self.connected = True
+            log("LedgerMirror", f"Subscribed to indexer from block {self.last_block}", "🪞", "info")
+
+            async for raw in ws:
+                message = json.loads(raw)
+                message_type = message.get("type")
+                if message_type == "next":
+                    change = message["payload"].get("data", {}).get("auditVerifierChanges")
+                    if change:
+                        self.apply(change)
+                        self._maybe_flush(loop.time())
+                elif message_type == "ping":
+                    await ws.send(json.dumps({"type": "pong"}))
+                elif message_type == "error":
+                    raise ConnectionError(f"Indexer subscription error: {message.get('payload')}")
+                elif message_type == "complete":
+                    return
+
+            if self._dirty:
+                self.save()
+
+
+class ApiLedgerMirror(LedgerMirror):
+    """
+    Ledger mirror fed by the Midnight API's /api/ledger/changes feed.
+
+    The first sync asks for changes since the last mirrored block, then follows
+    the feed's continuation cursor, which is persisted with the mirror so a
+    restart picks up exactly where it stopped. Responses are gzip-compressed
+    by the API.
+    """
+
+    def __init__(
+        self,
+        contract_address: str = MIDNIGHT_CONTRACT_ADDRESS,
+        api_url: str = MIDNIGHT_API_URL,
+        path: Optional[str] = MIDNIGHT_LEDGER_MIRROR_PATH,
+        flush_seconds: float = MIDNIGHT_LEDGER_MIRROR_FLUSH_SECONDS,
+        poll_seconds: float = MIDNIGHT_LEDGER_MIRROR_POLL_SECONDS,
+    ):
+        super().__init__(contract_address, "", path, flush_seconds)
+        self.api_url = api_url.rstrip("/")
+        self.poll_seconds = poll_seconds
+        self.cursor: Optional[str] = None
+
+    def _restore(self, data: Dict[str, Any]) -> None:
+        self.cursor = data.get("changesCursor")
+
+    def _extra_state(self) -> Dict[str, Any]:
+        return {"changesCursor": self.cursor}
+
+    def apply_change(self, change: Dict[str, Any]) -> None:
+        """
+        Apply one audit change from the API feed.
+
+        Args:
+            change: {"block_height", "block_timestamp", "audit_id", "proof_hash", "is_verified", "auditor_id"}
+        """
+        for map_name, field_name in LEDGER_MAPS.items():
+            if change.get(field_name) is None:
+                continue
+            self.apply({
+                "blockHeight": change.get("block_height"),
+                "blockTimestamp": change.get("block_timestamp"),
+                "map": map_name,
+                "key": change["audit_id"],
+                "value": change[field_name],
+            })
+
+    async def sync_once(self, client: httpx.AsyncClient) -> int:
+        """
+        Fetch and apply every change the API has beyond the current position.
+
+        Args:
+            client: HTTP client for the Midnight API
+
+        Returns:
+            int: Number of changes applied
+        """
+        applied = 0
+        while True:
+            params: Dict[str, Any] = {"limit": MIDNIGHT_LEDGER_MIRROR_PAGE_SIZE}
+            if self.cursor is not None:
+                params["cursor"] = self.cursor
+            elif self.last_block > 0:
+                params["since"] = self.last_block - 1  # the last block may be partial
+            response = await client.get(f"{self.api_url}/api/ledger/changes", params=params)
+            response.raise_for_status()
+            page = response.json()
+
+            for change in page.get("changes", []):
+                self.apply_change(change)
+            applied += len(page.get("changes", []))
+            if page.get("next_cursor") != self.cursor:
+                self.cursor = page.get("next_cursor")
+                self._dirty = True
+            if not page.get("has_more"):
+                return applied
+
+    def start(self) -> None:
+        """Load the on-disk mirror and start polling the API."""
+        if self.running:
+            return
+        loaded = self.load()
+        log("LedgerMirror", f"Loaded {loaded} audits, syncing from {self.api_url}", "🪞", "info")
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        delay = self.poll_seconds
+        loop = asyncio.get_running_loop()
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            while True:
+                try:
+                    await self.sync_once(client)
+                    self.connected = True
+                    delay = self.poll_seconds
+                    self._maybe_flush(loop.time())
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # Keep polling whatever went wrong (bad page, unexpected payload)
+                    if self.connected:
+                        log("LedgerMirror", f"Ledger change feed unavailable: {str(e)}", "⚠️", "warn")
+                    self.connected = False
+                    delay = min(max(delay * 2, RECONNECT_INITIAL_DELAY), RECONNECT_MAX_DELAY)
+                await asyncio.sleep(delay)
+
+
+# Shared mirror (only created when MIDNIGHT_LEDGER_MIRROR is enabled)
+_ledger_mirror: Optional[LedgerMirror] = None
+
+
+def get_ledger_mirror() -> Optional[LedgerMirror]:
+    """
+    Get the shared ledger mirror, if one has been started.
+
+    Returns:
+        LedgerMirror or None
+    """
+    return _ledger_mirror
+
+
+def start_ledger_mirror() -> Optional[LedgerMirror]:
+    """
+    Create and start the shared ledger mirror when MIDNIGHT_LEDGER_MIRROR is enabled.
+
+    Returns:
+        LedgerMirror or None if disabled or not configured
+    """
+    global _ledger_mirror
+
+    if not MIDNIGHT_LEDGER_MIRROR:
+        return None
+    if not MIDNIGHT_CONTRACT_ADDRESS:
+        log("LedgerMirror", "MIDNIGHT_CONTRACT_ADDRESS not set, ledger mirror disabled", "⚠️", "warn")
+        return None
+    if _ledger_mirror is None:
+        if MIDNIGHT_LEDGER_MIRROR_SOURCE == "indexer":
+            _ledger_mirror = LedgerMirror()
+        else:
+            _ledger_mirror = ApiLedgerMirror()
+    _ledger_mirror.start()
+    return _ledger_mirror
+
+
+async def stop_ledger_mirror() -> None:
+    """Stop the shared ledger mirror and flush it to disk."""
+    if _ledger_mirror is not None:
+        await _ledger_mirror.stop()
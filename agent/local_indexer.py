@@ -0,0 +1,179 @@
+"""
+Local stand-in for the Midnight indexer.
+Serves the AuditVerifier change feed over WebSocket (graphql-transport-ws) for the
+ledger mirror, and the contractState HTTP GraphQL queries used by proof_verifier.
+Audits are written through POST /admin/submit-audit, each one in a new block.
+
+Run:
+    python local_indexer.py --port 6300
+"""
+import sys
+import asyncio
+import hashlib
+import argparse
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+from pathlib import Path
+
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from pydantic import BaseModel
+import uvicorn
+
+# Add agent directory to path for logger import
+sys.path.insert(0, str(Path(__file__).parent))
+from logger import log
+from ledger_mirror import GRAPHQL_WS_PROTOCOL, LEDGER_MAPS
+
+
+class SubmitAuditRequest(BaseModel):
+    audit_id: str
+    auditor_id: str = ""
+    proof_hash: Optional[str] = None
+
+
+class LocalIndexer:
+    """
+    In-memory AuditVerifier ledger with a change log.
+
+    Every change is kept so subscribers can replay from any block, then
+    receive live changes as audits are submitted.
+    """
+
+    def __init__(self):
+        self.block_height = 0
+        self.changes: List[Dict[str, Any]] = []
+        self.state: Dict[str, Dict[str, Any]] = {m: {} for m in LEDGER_MAPS}
+        self.subscriptions_from: List[int] = []  # fromBlock of every subscription (for tests)
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    def submit_audit(self, audit_id: str, auditor_id: str = "", proof_hash: Optional[str] = None) -> int:
+        """
+        Record an audit in a new block, as submitAudit would.
+
+        Args:
+            audit_id: Audit identifier
+            auditor_id: Auditor identifier
+            proof_hash: Proof hash (derived from the audit ID if omitted)
+
+        Returns:
+            int: Block height the audit was written in
+        """
+        self.block_height += 1
+        timestamp = datetime.now().isoformat()
+        proof_hash = proof_hash or hashlib.sha256(audit_id.encode()).hexdigest()
+        for map_name, value in (("proofs", proof_hash), ("is_verified", True), ("auditor_id", auditor_id)):
+            self.state[map_name][audit_id] = value
+            change = {
+                "blockHeight": self.block_height,
+                "blockTimestamp": timestamp,
+                "map": map_name,
+                "key": audit_id,
+                "value": value,
+            }
+            self.changes.append(change)
+            for queue in self._subscribers:
+                queue.put_nowait(change)
+        return self.block_height
+
+    def contract_state(self, audit_id: str) -> Optional[Dict[str, Any]]:
+        """contractState selection for one audit, or None if unknown."""
+        if audit_id not in self.state["proofs"]:
+            return None
+        return {
+            "is_verified": self.state["is_verified"].get(audit_id, False),
+            "auditor_id": self.state["auditor_id"].get(audit_id, ""),
+            "proof_timestamp": next(
+                c["blockTimestamp"] for c in self.changes if c["key"] == audit_id
+            ),
+        }
+
+    async def stream(self, websocket: WebSocket, subscription_id: str, from_block: int) -> None:
+        """Replay changes from from_block, then forward live changes."""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.add(queue)
+        self.subscriptions_from.append(from_block)
+        try:
+            for change in [c for c in self.changes if c["blockHeight"] >= from_block]:
+                await self._send_change(websocket, subscription_id, change)
+            while True:
+                change = await queue.get()
+                await self._send_change(websocket, subscription_id, change)
+        finally:
+            self._subscribers.discard(queue)
+
+    @staticmethod
+    async def _send_change(websocket: WebSocket, subscription_id: str, change: Dict[str, Any]) -> None:
+        await websocket.send_json({
+            "id": subscription_id,
+            "type": "next",
+            "payload": {"data": {"auditVerifierChanges": change}},
+        })
+
+
+def create_app(indexer: Optional[LocalIndexer] = None) -> FastAPI:
+    """
+    Build the stand-in indexer app.
+
+    Args:
+        indexer: Ledger to serve (a fresh one if omitted)
+
+    Returns:
+        FastAPI: App with /graphql, /graphql/ws and /admin/submit-audit
+    """
+    indexer = indexer or LocalIndexer()
+    app = FastAPI(title="Local Midnight Indexer")
+    app.state.indexer = indexer
+
+    @app.post("/graphql")
+    async def graphql(request: Dict[str, Any]):
+        variables = request.get("variables", {})
+        if "auditId" in variables:
+            return {"data": {"contractState": indexer.contract_state(variables["auditId"])}}
+        # Aliased batch query: a0, a1, ... carry the audit IDs
+        aliases = {k: v for k, v in variables.items() if k.startswith("a") and k[1:].isdigit()}
+        return {"data": {alias: indexer.contract_state(audit_id) for alias, audit_id in aliases.items()}}
+
+    @app.post("/admin/submit-audit")
+    async def submit_audit(request: SubmitAuditRequest):
+        block_height = indexer.submit_audit(request.audit_id, request.auditor_id, request.proof_hash)
+        return {"success": True, "blockHeight": block_height}
+
+    @app.websocket("/graphql/ws")
+    async def graphql_ws(websocket: WebSocket):
+        await websocket.accept(subprotocol=GRAPHQL_WS_PROTOCOL)
+        streams: Dict[str, asyncio.Task] = {}
+        try:
+            while True:
+                message = await websocket.receive_json()
+                message_type = message.get("type")
+                if message_type == "connection_init":
+                    await websocket.send_json({"type": "connection_ack"})
+                elif message_type == "ping":
+                    await websocket.send_json({"type": "pong"})
+                elif message_type == "subscribe":
+                    variables = message["payload"].get("variables", {})
+                    from_block = int(variables.get("fromBlock") or 0)
+                    streams[message["id"]] = asyncio.create_task(
+                        indexer.stream(websocket, message["id"], from_block)
+                    )
+                elif message_type == "complete":
+                    task = streams.pop(message.get("id"), None)
+                    if task:
+                        task.cancel()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            for task in streams.values():
+                task.cancel()
+
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in Midnight indexer")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6300)
+    args = parser.parse_args()
+
+    log("LocalIndexer", f"Serving on http://{args.host}:{args.port}/graphql", "🪞", "info")
+    uvicorn.run(create_app(), host=args.host, port=args.port)
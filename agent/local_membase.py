@@ -0,0 +1,203 @@
+"""
+Local stand-in for the Membase hub.
+Stores conversation messages in SQLite and serves the MultiMemory operations used
+by mcp_helper (add a message to a conversation, get a conversation's recent
+messages) over HTTP, with configurable latency and failure injection, so the
+exploit and bounty memory path can be load-tested offline.
+
+Point the agent at it with MEMBASE_URL (see mcp_helper.RemoteMultiMemory).
+
+Run:
+    python local_membase.py --port 8765 --latency 0.05 --failure-rate 0.01
+"""
+import sys
+import json
+import time
+import random
+import asyncio
+import sqlite3
+import argparse
+from collections import deque
+from typing import Any, Dict, List, Optional
+from pathlib import Path
+
+from fastapi import FastAPI, HTTPException, Query
+from pydantic import BaseModel, Field
+import uvicorn
+
+# Add agent directory to path for logger import
+sys.path.insert(0, str(Path(__file__).parent))
+from logger import log
+
+LOCAL_MEMBASE_PATH = str(Path(__file__).parent / "local_membase.db")
+
+
+class MessageRequest(BaseModel):
+    name: str = ""
+    content: str
+    role: str = "assistant"
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class FaultConfig(BaseModel):
+    latency: float = 0.0  # mean seconds per request
+    jitter: float = 0.0  # +/- seconds, uniform
+    failure_rate: float = 0.0  # share of requests answered with 503
+
+
+class LocalMembase:
+    """
+    SQLite-backed conversation store.
+
+    Messages are appended per conversation and read back newest last, like
+    MultiMemory.get_messages. Every request first goes through the configured
+    latency and failure injection.
+    """
+
+    def __init__(self, path: str = LOCAL_MEMBASE_PATH, faults: Optional[FaultConfig] = None,
+                 seed: Optional[int] = None):
+        self.path = path
+        self.faults = faults or FaultConfig()
+        self.requests = 0
+        self.failures = 0
+        self.latencies: deque = deque(maxlen=1000)
+        self._random = random.Random(seed)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                conversation_id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                content TEXT NOT NULL,
+                role TEXT NOT NULL,
+                metadata TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS messages_conversation ON messages (conversation_id, id)"
+        )
+        self._db.commit()
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+    async def inject_faults(self) -> None:
+        """
+        Delay the request and fail it at the configured rate.
+
+        Raises:
+            HTTPException: 503 for an injected failure
+        """
+        self.requests += 1
+        delay = max(0.0, self.faults.latency + self._random.uniform(-self.faults.jitter, self.faults.jitter))
+        if delay:
+            await asyncio.sleep(delay)
+        self.latencies.append(delay)
+        if self._random.random() < self.faults.failure_rate:
+            self.failures += 1
+            raise HTTPException(status_code=503, detail="Injected Membase failure")
+
+    def add(self, conversation_id: str, message: MessageRequest) -> int:
+        """
+        Append a message to a conversation.
+
+        Returns:
+            int: Message ID
+        """
+        cursor = self._db.execute(
+            "INSERT INTO messages (conversation_id, name, content, role, metadata, created_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (conversation_id, message.name, message.content, message.role,
+             json.dumps(message.metadata), time.time()),
+        )
+        self._db.commit()
+        return cursor.lastrowid
+
+    def get_messages(self, conversation_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Most recent messages of a conversation, oldest first.
+
+        Args:
+            conversation_id: Conversation ID
+            limit: Number of recent messages (all if None)
+        """
+        rows = self._db.execute(
+            "SELECT * FROM (SELECT id, name, content, role, metadata, created_at FROM messages"
+            " WHERE conversation_id = ? ORDER BY id DESC LIMIT ?) ORDER BY id",
+            (conversation_id, -1 if limit is None else limit),
+        ).fetchall()
+        return [
+            {"id": row[0], "name": row[1], "content": row[2], "role": row[3],
+             "metadata": json.loads(row[4]), "created_at": row[5]}
+            for row in rows
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """Request counters and stored message counts."""
+        conversations = dict(self._db.execute(
+            "SELECT conversation_id, COUNT(*) FROM messages GROUP BY conversation_id"
+        ).fetchall())
+        latencies = list(self.latencies)
+        return {
+            "conversations": conversations,
+            "requests": self.requests,
+            "injected_failures": self.failures,
+            "average_latency": sum(latencies) / len(latencies) if latencies else None,
+            "faults": self.faults.model_dump(),
+        }
+
+
+def create_app(membase: Optional[LocalMembase] = None) -> FastAPI:
+    """
+    Build the stand-in Membase app.
+
+    Args:
+        membase: Store to serve (one at LOCAL_MEMBASE_PATH if omitted)
+
+    Returns:
+        FastAPI: App with the conversation endpoints, /health and /admin/config
+    """
+    membase = membase or LocalMembase()
+    app = FastAPI(title="Local Membase")
+    app.state.membase = membase
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy", **membase.stats()}
+
+    @app.post("/conversations/{conversation_id}/messages")
+    async def add_message(conversation_id: str, message: MessageRequest):
+        await membase.inject_faults()
+        return {"success": True, "id": membase.add(conversation_id, message)}
+
+    @app.get("/conversations/{conversation_id}/messages")
+    async def get_messages(conversation_id: str, limit: Optional[int] = Query(None, ge=1)):
+        await membase.inject_faults()
+        return {"messages": membase.get_messages(conversation_id, limit)}
+
+    @app.post("/admin/config")
+    async def update_faults(faults: FaultConfig):
+        """Change latency or failure rate of a running service."""
+        membase.faults = faults
+        return membase.stats()
+
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in Membase hub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--path", default=LOCAL_MEMBASE_PATH, help="SQLite file for messages")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- seconds per request")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of requests failed with 503 (0-1)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible runs")
+    args = parser.parse_args()
+
+    faults = FaultConfig(latency=args.latency, jitter=args.jitter, failure_rate=args.failure_rate)
+    log("LocalMembase", f"Serving Membase stand-in on http://{args.host}:{args.port}", "💾", "info")
+    uvicorn.run(create_app(LocalMembase(args.path, faults, args.seed)), host=args.host, port=args.port)
@@ -0,0 +1,469 @@
+"""
+Local stand-in for the Midnight FastAPI server.
+Implements the API used by midnight_client, proof_verifier and the ledger mirror
+(/api/submit-audit, /api/submit-audits, /api/jobs, /api/query-audit, /api/ledger,
+/api/ledger/changes, /health) against an in-memory AuditVerifier ledger, so the
+agent pipeline can be load-tested without a devnet.
+
+submitAudit follows AuditVerifier.compact: the witness risk score must reach the
+threshold, and proofs, is_verified and auditor_id are written (insert replaces).
+Proof generation and block production are simulated with configurable latency,
+proof server concurrency, failure rate and block time.
+
+Run:
+    python local_midnight.py --port 8000 --proof-latency 2 --block-time 6
+"""
+import sys
+import time
+import random
+import asyncio
+import hashlib
+import argparse
+from collections import deque
+from datetime import datetime, timezone
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+
+from fastapi import FastAPI, HTTPException, Query, Response
+from pydantic import BaseModel
+import uvicorn
+
+# Add agent directory to path for logger import
+sys.path.insert(0, str(Path(__file__).parent))
+from logger import log
+
+CONTRACT_ADDRESS = "local_audit_verifier"
+LEDGER_MAPS = ("proofs", "is_verified", "auditor_id")
+TERMINAL_STATES = ("succeeded", "failed")
+JOB_MAX_WAIT = 60.0
+
+
+class SubmitAuditRequest(BaseModel):
+    audit_id: str
+    auditor_addr: str
+    threshold: int
+    witness: Dict[str, Any]
+
+
+class SubmitAuditsRequest(BaseModel):
+    audits: List[SubmitAuditRequest]
+
+
+class QueryAuditRequest(BaseModel):
+    audit_id: Optional[str] = None
+    auditId: Optional[str] = None  # bridge-style body used by proof_verifier
+
+
+class QueryAuditsRequest(BaseModel):
+    auditIds: List[str]
+
+
+class SimulatorConfig(BaseModel):
+    proof_latency: float = 2.0  # mean seconds per proof
+    proof_jitter: float = 0.5  # +/- seconds, uniform
+    proof_concurrency: int = 2  # proofs generated at once
+    failure_rate: float = 0.0  # share of proofs that fail
+    block_time: float = 6.0  # seconds between blocks (0: a block per transaction)
+
+
+def _witness_bytes(value: Any) -> bytes:
+    """Exploit string witness as 64 bytes, from a byte list, hex string or text."""
+    if isinstance(value, list):
+        raw = bytes(value)
+    elif isinstance(value, str):
+        try:
+            raw = bytes.fromhex(value)
+        except ValueError:
+            raw = value.encode()
+    else:
+        raw = b""
+    return raw[:64].ljust(64, b"\x00")
+
+
+class LocalMidnight:
+    """
+    In-memory AuditVerifier contract behind a simulated proof server and chain.
+
+    Proofs queue for a fixed number of proof server slots, then wait for the next
+    block; every transaction in a block is applied to the ledger together. Every
+    ledger change is logged with its block height for the change feed.
+    """
+
+    def __init__(self, config: Optional[SimulatorConfig] = None, seed: Optional[int] = None):
+        self.config = config or SimulatorConfig()
+        self.block_height = 0
+        self.block_timestamp = int(time.time() * 1000)
+        self.ledger: Dict[str, Dict[str, Any]] = {name: {} for name in LEDGER_MAPS}
+        self.changes: List[Dict[str, Any]] = []
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.submitted = 0
+        self.failed = 0
+        self.proof_latencies: deque = deque(maxlen=1000)
+        self._random = random.Random(seed)
+        self._proof_slots: Optional[asyncio.Semaphore] = None
+        self._proof_waiting = 0
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._block_task: Optional[asyncio.Task] = None
+        self._job_tasks: Dict[str, asyncio.Task] = {}
+        self._job_done: Dict[str, asyncio.Event] = {}
+
+    # ------------------------------------------------------------------
+    # Chain
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start producing blocks."""
+        self._proof_slots = asyncio.Semaphore(max(1, self.config.proof_concurrency))
+        if self.config.block_time > 0 and self._block_task is None:
+            self._block_task = asyncio.create_task(self._produce_blocks())
+
+    async def stop(self) -> None:
+        """Stop block production and cancel running jobs."""
+        tasks = list(self._job_tasks.values())
+        if self._block_task is not None:
+            tasks.append(self._block_task)
+            self._block_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _produce_blocks(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.block_time)
+            self._seal_block()
+
+    def _seal_block(self) -> None:
+        """Apply every pending transaction in one new block."""
+        self.block_height += 1
+        self.block_timestamp = int(time.time() * 1000)
+        pending, self._pending = self._pending, []
+        for tx, future in pending:
+            for map_name in LEDGER_MAPS:
+                self.ledger[map_name][tx["audit_id"]] = tx[map_name]
+            self.changes.append({
+                "block_height": self.block_height,
+                "block_timestamp": datetime.fromtimestamp(self.block_timestamp / 1000, tz=timezone.utc).isoformat(),
+                "audit_id": tx["audit_id"],
+                "proof_hash": tx["proofs"],
+                "is_verified": tx["is_verified"],
+                "auditor_id": tx["auditor_id"],
+            })
+            if not future.done():
+                future.set_result(self.block_height)
+
+    async def _include(self, tx: Dict[str, Any]) -> int:
+        """Wait for a transaction to land; returns its block height."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((tx, future))
+        if self._block_task is None:
+            self._seal_block()
+        return await future
+
+    # ------------------------------------------------------------------
+    # Contract
+    # ------------------------------------------------------------------
+
+    async def _prove(self) -> Optional[str]:
+        """Hold a proof server slot for the simulated latency; returns an error or None."""
+        if self._proof_slots is None:
+            self._proof_slots = asyncio.Semaphore(max(1, self.config.proof_concurrency))
+        slots = self._proof_slots  # /admin/config may swap in a new semaphore meanwhile
+        self._proof_waiting += 1
+        try:
+            await slots.acquire()
+        finally:
+            self._proof_waiting -= 1
+        try:
+            latency = max(0.0, self.config.proof_latency + self._random.uniform(
+                -self.config.proof_jitter, self.config.proof_jitter
+            ))
+            await asyncio.sleep(latency)
+            self.proof_latencies.append(latency)
+        finally:
+            slots.release()
+        if self._random.random() < self.config.failure_rate:
+            return "Simulated proof server failure"
+        return None
+
+    async def submit_audit(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run submitAudit: check the witness, prove, and wait for the block.
+
+        Args:
+            request: /api/submit-audit body
+
+        Returns:
+            dict: SubmitAuditResponse body
+        """
+        audit_id = request["audit_id"]
+        witness = request.get("witness", {})
+        risk_score = int(witness.get("riskScore", witness.get("risk_score", 0)))
+        exploit = _witness_bytes(witness.get("exploitString", witness.get("exploit_string")))
+
+        if risk_score < int(request["threshold"]):
+            self.failed += 1
+            return {"success": False, "error": "risk_score < threshold", "ledger_state": {}}
+
+        error = await self._prove()
+        if error:
+            self.failed += 1
+            return {"success": False, "error": error, "ledger_state": {}}
+
+        proof_hash = hashlib.sha256(audit_id.encode() + exploit).hexdigest()
+        block_height = await self._include({
+            "audit_id": audit_id,
+            "proofs": proof_hash,
+            "is_verified": True,
+            "auditor_id": request["auditor_addr"],
+        })
+        self.submitted += 1
+        return {
+            "success": True,
+            "transaction_id": hashlib.sha256(f"{audit_id}:{block_height}".encode()).hexdigest(),
+            "block_height": block_height,
+            "ledger_state": {},
+        }
+
+    async def submit_audits(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Submit a batch, one transaction per audit as the contract requires.
+
+        Returns:
+            dict: SubmitAuditsResponse body
+        """
+        results = []
+        for audit in request["audits"]:
+            result = await self.submit_audit(audit)
+            results.append({
+                "audit_id": audit["audit_id"],
+                "success": result["success"],
+                "transaction_id": result.get("transaction_id"),
+                "block_height": result.get("block_height"),
+                "error": result.get("error"),
+            })
+        submitted = sum(1 for result in results if result["success"])
+        return {
+            "success": True,
+            "submitted": submitted,
+            "failed": len(results) - submitted,
+            "results": results,
+            "ledger_state": {},
+        }
+
+    def query_audit(self, audit_id: str) -> Dict[str, Any]:
+        """QueryAuditResponse body, with the bridge's camelCase fields alongside."""
+        if audit_id not in self.ledger["proofs"]:
+            return {"found": False, "audit_id": audit_id, "auditId": audit_id}
+        block_height = next(
+            change["block_height"] for change in reversed(self.changes) if change["audit_id"] == audit_id
+        )
+        record = {
+            "audit_id": audit_id,
+            "proof_hash": self.ledger["proofs"][audit_id],
+            "is_verified": self.ledger["is_verified"][audit_id],
+            "auditor_id": self.ledger["auditor_id"][audit_id],
+            "block_height": block_height,
+        }
+        return {
+            "found": True,
+            **record,
+            "auditId": audit_id,
+            "proofHash": record["proof_hash"],
+            "isVerified": record["is_verified"],
+            "auditorId": record["auditor_id"],
+            "blockHeight": block_height,
+        }
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    def submit_job(self, operation: str, key: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Start a job, or return the existing one for the same work unless it failed."""
+        job_id = hashlib.sha256(f"{operation}:{key}".encode()).hexdigest()[:32]
+        job = self.jobs.get(job_id)
+        if job is not None and job["status"] != "failed":
+            return job
+
+        now = time.time()
+        job = {
+            "job_id": job_id,
+            "operation": operation,
+            "status": "running",
+            "result": None,
+            "error": None,
+            "attempts": (job["attempts"] if job else 0) + 1,
+            "created_at": job["created_at"] if job else now,
+            "updated_at": now,
+        }
+        self.jobs[job_id] = job
+        handler = self.submit_audit if operation == "submit_audit" else self.submit_audits
+        self._job_tasks[job_id] = asyncio.create_task(self._run_job(job, handler(request)))
+        return job
+
+    async def _run_job(self, job: Dict[str, Any], work) -> None:
+        try:
+            result = await work
+            job["result"] = result
+            job["status"] = "failed" if result.get("success") is False else "succeeded"
+            job["error"] = result.get("error")
+        except Exception as e:
+            job["status"] = "failed"
+            job["error"] = str(e)
+        job["updated_at"] = time.time()
+        self._job_tasks.pop(job["job_id"], None)
+        event = self._job_done.pop(job["job_id"], None)
+        if event is not None:
+            event.set()
+
+    async def wait_job(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """Wait up to timeout seconds for a job to finish."""
+        job = self.jobs.get(job_id)
+        if job is None or job["status"] in TERMINAL_STATES or timeout <= 0:
+            return job
+        event = self._job_done.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), min(timeout, JOB_MAX_WAIT))
+        except asyncio.TimeoutError:
+            pass
+        return self.jobs[job_id]
+
+    def stats(self) -> Dict[str, Any]:
+        """Simulator counters."""
+        latencies = list(self.proof_latencies)
+        return {
+            "block_height": self.block_height,
+            "audits": len(self.ledger["proofs"]),
+            "submitted": self.submitted,
+            "failed": self.failed,
+            "proofs_waiting": self._proof_waiting,
+            "pending_transactions": len(self._pending),
+            "running_jobs": len(self._job_tasks),
+            "average_proof_latency": sum(latencies) / len(latencies) if latencies else None,
+            "config": self.config.model_dump(),
+        }
+
+
+def create_app(midnight: Optional[LocalMidnight] = None) -> FastAPI:
+    """
+    Build the stand-in Midnight API app.
+
+    Args:
+        midnight: Simulator to serve (a fresh one if omitted)
+
+    Returns:
+        FastAPI: App with the Midnight API endpoints plus /admin/config
+    """
+    midnight = midnight or LocalMidnight()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        midnight.start()
+        yield
+        await midnight.stop()
+
+    app = FastAPI(title="Local Midnight API", lifespan=lifespan)
+    app.state.midnight = midnight
+
+    async def job_response(job: Dict[str, Any], response: Response, wait: float) -> Dict[str, Any]:
+        job = await midnight.wait_job(job["job_id"], wait)
+        response.status_code = 200 if job["status"] in TERMINAL_STATES else 202
+        response.headers["Location"] = f"/api/jobs/{job['job_id']}"
+        return job
+
+    @app.get("/health")
+    async def health():
+        return {
+            "status": "healthy",
+            "initialized": True,
+            "contract_address": CONTRACT_ADDRESS,
+            "simulator": midnight.stats(),
+        }
+
+    @app.post("/api/init")
+    async def init(request: Dict[str, Any]):
+        return {"success": True, "contract_address": request.get("contract_address") or CONTRACT_ADDRESS}
+
+    @app.post("/api/submit-audit", status_code=202)
+    async def submit_audit(request: SubmitAuditRequest, response: Response, wait: float = Query(0, ge=0)):
+        job = midnight.submit_job("submit_audit", request.audit_id, request.model_dump())
+        return await job_response(job, response, wait)
+
+    @app.post("/api/submit-audits", status_code=202)
+    async def submit_audits(request: SubmitAuditsRequest, response: Response, wait: float = Query(0, ge=0)):
+        key = ",".join(sorted(audit.audit_id for audit in request.audits))
+        job = midnight.submit_job("submit_audits", key, request.model_dump())
+        return await job_response(job, response, wait)
+
+    @app.get("/api/jobs/{job_id}")
+    async def get_job(job_id: str, response: Response, wait: float = Query(0, ge=0)):
+        if job_id not in midnight.jobs:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return await job_response(midnight.jobs[job_id], response, wait)
+
+    @app.post("/api/query-audit")
+    async def query_audit(request: QueryAuditRequest):
+        audit_id = request.audit_id or request.auditId
+        if not audit_id:
+            raise HTTPException(status_code=422, detail="audit_id is required")
+        return midnight.query_audit(audit_id)
+
+    @app.post("/api/query-audits")
+    async def query_audits(request: QueryAuditsRequest):
+        return {"audits": [midnight.query_audit(audit_id) for audit_id in request.auditIds]}
+
+    @app.get("/api/ledger")
+    async def ledger():
+        return {"success": True, "ledger_state": midnight.ledger}
+
+    @app.get("/api/ledger/changes")
+    async def ledger_changes(
+        since: Optional[int] = Query(None, ge=0),
+        cursor: Optional[str] = Query(None),
+        limit: int = Query(500, ge=1, le=5000),
+    ):
+        start = int(cursor) if cursor else 0
+        matching = [
+            (seq, change) for seq, change in enumerate(midnight.changes[start:], start=start + 1)
+            if since is None or change["block_height"] > since
+        ]
+        page = matching[:limit]
+        return {
+            "changes": [change for _, change in page],
+            "next_cursor": str(page[-1][0] if page else max(start, len(midnight.changes))),
+            "has_more": len(matching) > limit,
+            "synced_height": midnight.block_height,
+        }
+
+    @app.post("/admin/config")
+    async def update_config(config: SimulatorConfig):
+        """Change latency, failure rate or concurrency of a running simulator."""
+        midnight.config = config
+        midnight._proof_slots = asyncio.Semaphore(max(1, config.proof_concurrency))
+        return midnight.stats()
+
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in Midnight API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--proof-latency", type=float, default=2.0, help="Mean seconds per proof")
+    parser.add_argument("--proof-jitter", type=float, default=0.5, help="+/- seconds per proof")
+    parser.add_argument("--proof-concurrency", type=int, default=2, help="Proofs generated at once")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of proofs that fail (0-1)")
+    parser.add_argument("--block-time", type=float, default=6.0, help="Seconds per block (0: one per tx)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible runs")
+    args = parser.parse_args()
+
+    config = SimulatorConfig(
+        proof_latency=args.proof_latency,
+        proof_jitter=args.proof_jitter,
+        proof_concurrency=args.proof_concurrency,
+        failure_rate=args.failure_rate,
+        block_time=args.block_time,
+    )
+    log("LocalMidnight", f"Serving simulated Midnight API on http://{args.host}:{args.port}", "🛡️", "info")
+    uvicorn.run(create_app(LocalMidnight(config, seed=args.seed)), host=args.host, port=args.port)
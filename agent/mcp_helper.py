@@ -4,8 +4,11 @@ Provides functions to interact with Membase for persistent memory storage.
 """
 import os
 import json
+import asyncio
 from typing import List, Dict, Any, Optional
 
+import httpx
+
 # Try to import Membase SDK
 try:
     from membase.memory.multi_memory import MultiMemory
@@ -19,31 +22,89 @@ except ImportError:
     class MultiMemory:
         pass
     class Message:
-        pass
+        """Minimal message used with a remote Membase (MEMBASE_URL) when the SDK is missing."""
+        def __init__(self, name: str, content: str, role: str = "assistant", metadata: Optional[Dict[str, Any]] = None):
+            self.name = name
+            self.content = content
+            self.role = role
+            self.metadata = metadata or {}
 
 # Membase configuration from environment
 MEMBASE_ID = os.getenv("MEMBASE_ID", "")
 MEMBASE_ACCOUNT = os.getenv("MEMBASE_ACCOUNT", "default")
 MEMBASE_SECRET_KEY = os.getenv("MEMBASE_SECRET_KEY", "")
 MEMBASE_ENABLED = os.getenv("USE_MEMBASE", "false").lower() == "true"
+# Base URL of a Membase HTTP service such as local_membase.py; used instead of the SDK
+MEMBASE_URL = os.getenv("MEMBASE_URL", "")
+MEMBASE_TIMEOUT = float(os.getenv("MEMBASE_TIMEOUT", "10"))
 
 # Global MultiMemory instance (lazy initialized)
 _membase_instance: Optional[MultiMemory] = None
 
 
+class RemoteMultiMemory:
+    """
+    MultiMemory surface (get_messages, add) backed by a Membase HTTP service.
+    
+    Calls are synchronous like the SDK's, over one pooled connection; the
+    async helpers below run them in a worker thread so the event loop keeps
+    going. Failures raise, and the helpers turn them into the same fallbacks
+    as an unavailable hub.
+    """
+    
+    def __init__(self, base_url: str = MEMBASE_URL, timeout: float = MEMBASE_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self._client = httpx.Client(timeout=timeout)
+    
+    def get_messages(self, conversation_id: str, limit: Optional[int] = None) -> List[Message]:
+        """Most recent messages of a conversation, oldest first."""
+        params = {"limit": limit} if limit else {}
+        response = self._client.get(f"{self.base_url}/conversations/{conversation_id}/messages", params=params)
+        response.raise_for_status()
+        return [
+            Message(name=m.get("name", ""), content=m["content"], role=m.get("role", "assistant"),
+                    metadata=m.get("metadata", {}))
+            for m in response.json().get("messages", [])
+        ]
+    
+    def add(self, msg: Message, conversation_id: str) -> None:
+        """Append a message to a conversation."""
+        response = self._client.post(
+            f"{self.base_url}/conversations/{conversation_id}/messages",
+            json={
+                "name": getattr(msg, "name", ""),
+                "content": msg.content,
+                "role": getattr(msg, "role", "assistant"),
+                "metadata": getattr(msg, "metadata", None) or {},
+            },
+        )
+        response.raise_for_status()
+    
+    def close(self) -> None:
+        self._client.close()
+
+
 def get_membase_instance() -> Optional[MultiMemory]:
     """
     Get or create Membase MultiMemory instance.
     
+    With MEMBASE_URL set, this is a RemoteMultiMemory for that service instead
+    of the SDK's hub-backed MultiMemory.
+    
     Returns:
         MultiMemory instance if configured, None otherwise
     """
     global _membase_instance
     
-    if not MEMBASE_AVAILABLE:
+    if not MEMBASE_ENABLED:
         return None
     
-    if not MEMBASE_ENABLED:
+    if MEMBASE_URL:
+        if _membase_instance is None:
+            _membase_instance = RemoteMultiMemory(MEMBASE_URL)
+        return _membase_instance
+    
+    if not MEMBASE_AVAILABLE:
         return None
     
     if _membase_instance is None:
@@ -70,7 +131,7 @@ async def get_mcp_messages(recent_n: int = 50) -> List[Dict[str, Any]]:
     Returns:
         List of message dictionaries
     """
-    if not MEMBASE_AVAILABLE or not MEMBASE_ENABLED:
+    if not (MEMBASE_AVAILABLE or MEMBASE_URL) or not MEMBASE_ENABLED:
         return []
     
     mm = get_membase_instance()
@@ -81,8 +142,8 @@ async def get_mcp_messages(recent_n: int = 50) -> List[Dict[str, Any]]:
         # Use a default conversation ID for exploit storage
         conversation_id = "0xguard_exploits"
         
-        # Get messages from Membase
-        messages = mm.get_messages(conversation_id, limit=recent_n)
+        # Get messages from Membase (blocking I/O, off the event loop)
+        messages = await asyncio.to_thread(mm.get_messages, conversation_id, limit=recent_n)
         
         # Convert to dictionary format
         result = []
@@ -111,7 +172,7 @@ async def save_mcp_message(content: str, msg_type: str = "assistant", conversati
     Returns:
         bool: True if saved successfully
     """
-    if not MEMBASE_AVAILABLE or not MEMBASE_ENABLED:
+    if not (MEMBASE_AVAILABLE or MEMBASE_URL) or not MEMBASE_ENABLED:
         return False
     
     mm = get_membase_instance()
@@ -127,8 +188,8 @@ async def save_mcp_message(content: str, msg_type: str = "assistant", conversati
             metadata={"source": "0xguard", "type": "exploit" if "EXPLOIT:" in content else "bounty"}
         )
         
-        # Add to Membase
-        mm.add(msg, conversation_id)
+        # Add to Membase (blocking I/O, off the event loop)
+        await asyncio.to_thread(mm.add, msg, conversation_id)
         
         return True
     except Exception as e:
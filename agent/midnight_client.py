@@ -3,9 +3,13 @@ Midnight client module for interacting with Midnight devnet.
 Provides functions to submit ZK proofs to the AuditVerifier contract.
 """
 import os
+import time
+import heapq
+import asyncio
 import hashlib
+import itertools
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pathlib import Path
 import sys
 import httpx
@@ -13,12 +17,158 @@ import httpx
 # Add agent directory to path for logger import
 sys.path.insert(0, str(Path(__file__).parent))
 from logger import log
+from ledger_mirror import get_ledger_mirror
+from proof_outbox import ProofOutbox, SubmissionError
 
 # Configuration
 MIDNIGHT_DEVNET_URL = os.getenv("MIDNIGHT_DEVNET_URL", "http://localhost:6300")
 MIDNIGHT_BRIDGE_URL = os.getenv("MIDNIGHT_BRIDGE_URL", "http://localhost:3000")
 MIDNIGHT_API_URL = os.getenv("MIDNIGHT_API_URL", "http://localhost:8000")  # FastAPI server
 MIDNIGHT_CONTRACT_ADDRESS = os.getenv("MIDNIGHT_CONTRACT_ADDRESS", "")
+# Queue submissions in the durable outbox instead of calling the API inline
+MIDNIGHT_OUTBOX_ENABLED = os.getenv("MIDNIGHT_OUTBOX_ENABLED", "true").lower() == "true"
+# How long submit_audit_proof waits for the first attempt before returning a provisional hash
+MIDNIGHT_OUTBOX_WAIT_SECONDS = float(os.getenv("MIDNIGHT_OUTBOX_WAIT_SECONDS", "30"))
+
+# Submissions run as API jobs; how long to follow one and how long each long-poll lasts
+MIDNIGHT_JOB_TIMEOUT = float(os.getenv("MIDNIGHT_JOB_TIMEOUT", "600"))
+MIDNIGHT_JOB_POLL_SECONDS = float(os.getenv("MIDNIGHT_JOB_POLL_SECONDS", "20"))
+
+# Send each outbox flush to the bulk /api/submit-audits endpoint
+MIDNIGHT_OUTBOX_BULK = os.getenv("MIDNIGHT_OUTBOX_BULK", "true").lower() == "true"
+
+# Proofs generated concurrently by the proof server
+MIDNIGHT_PROOF_CONCURRENCY = int(os.getenv("MIDNIGHT_PROOF_CONCURRENCY", "2"))
+
+# Shared outbox (lazily opened)
+_outbox: Optional[ProofOutbox] = None
+# Cleared when the API has no bulk endpoint
+_bulk_supported = True
+
+
+class ProofScheduler:
+    """
+    Priority queue in front of the proof server.
+    
+    Requests with a higher risk score go first, then older ones. At most
+    `concurrency` proofs are generated at once, and duplicate requests for
+    an audit already queued or in flight share its result. A bulk submission
+    (submit_batch) is queued at its highest risk score and holds one slot.
+    """
+    
+    def __init__(self, send, concurrency: int = MIDNIGHT_PROOF_CONCURRENCY):
+        self.send = send
+        self.concurrency = max(1, concurrency)
+        self._heap: list = []  # (-risk_score, enqueued_at, seq, audit_id)
+        self._jobs: Dict[str, Dict[str, Any]] = {}  # audit_id -> {request, future, enqueued_at}
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._completed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._ready: Optional[asyncio.Condition] = None
+        self._workers: list = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def submit(self, request_data: Dict[str, Any]) -> str:
+        """
+        Queue a proof request and wait for its result.
+        
+        Args:
+            request_data: Request body for /api/submit-audit
+            
+        Returns:
+            str: Proof hash
+        """
+        self._ensure_workers()
+        audit_id = request_data["audit_id"]
+        job = self._jobs.get(audit_id)
+        if job is None:
+            risk_score = request_data.get("witness", {}).get("riskScore", 0)
+            enqueued_at = time.monotonic()
+            job = {"request": request_data, "future": self._loop.create_future(), "enqueued_at": enqueued_at}
+            self._jobs[audit_id] = job
+            heapq.heappush(self._heap, (-risk_score, enqueued_at, next(self._seq), audit_id))
+            async with self._ready:
+                self._ready.notify()
+        return await asyncio.shield(job["future"])
+    
+    async def submit_batch(self, requests: List[Dict[str, Any]], send) -> Any:
+        """
+        Queue a bulk submission as one job and wait for its result.
+        
+        Args:
+            requests: Request bodies for /api/submit-audit
+            send: Coroutine function sending the whole list
+            
+        Returns:
+            Whatever send returns
+        """
+        self._ensure_workers()
+        risk_score = max((r.get("witness", {}).get("riskScore", 0) for r in requests), default=0)
+        enqueued_at = time.monotonic()
+        key = f"batch:{next(self._seq)}"
+        job = {"request": requests, "send": send, "future": self._loop.create_future(), "enqueued_at": enqueued_at}
+        self._jobs[key] = job
+        heapq.heappush(self._heap, (-risk_score, enqueued_at, next(self._seq), key))
+        async with self._ready:
+            self._ready.notify()
+        return await asyncio.shield(job["future"])
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Queue depth, in-flight proofs and wait times.
+        
+        Returns:
+            dict: queueDepth, inFlight, concurrency, completed, avgWaitMs, maxWaitMs, oldestWaitMs
+        """
+        now = time.monotonic()
+        queued = [job for job in self._jobs.values() if not job.get("started")]
+        return {
+            "queueDepth": len(queued),
+            "inFlight": self._in_flight,
+            "concurrency": self.concurrency,
+            "completed": self._completed,
+            "avgWaitMs": round(self._wait_total / self._completed * 1000, 2) if self._completed else 0.0,
+            "maxWaitMs": round(self._wait_max * 1000, 2),
+            "oldestWaitMs": round(max((now - job["enqueued_at"] for job in queued), default=0.0) * 1000, 2),
+        }
+    
+    def _ensure_workers(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and all(not worker.done() for worker in self._workers):
+            return
+        # First use, or a new event loop: pending jobs belong to the old loop
+        self._heap.clear()
+        self._jobs.clear()
+        self._loop = loop
+        self._ready = asyncio.Condition()
+        self._workers = [loop.create_task(self._worker()) for _ in range(self.concurrency)]
+    
+    async def _worker(self) -> None:
+        while True:
+            async with self._ready:
+                await self._ready.wait_for(lambda: bool(self._heap))
+                _, enqueued_at, _, audit_id = heapq.heappop(self._heap)
+            job = self._jobs[audit_id]
+            job["started"] = True
+            waited = time.monotonic() - enqueued_at
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+            self._in_flight += 1
+            try:
+                job["future"].set_result(await job.get("send", self.send)(job["request"]))
+            except Exception as e:
+                job["future"].set_exception(e)
+                job["future"].exception()  # mark retrieved when nobody else was waiting
+            finally:
+                self._in_flight -= 1
+                self._completed += 1
+                del self._jobs[audit_id]
+
+
+# Shared proof scheduler (looks up _send_submission at call time)
+proof_scheduler = ProofScheduler(lambda request_data: _send_submission(request_data))
 
 
 def generate_audit_id(exploit_string: str, timestamp: str) -> str:
@@ -71,6 +221,12 @@ async def submit_audit_proof(
     """
     Submit an audit proof to Midnight devnet via FastAPI server.
     
+    With the outbox enabled, the submission is recorded durably first and sent by
+    the background flusher, which retries until the API accepts it. This call
+    waits for the first attempt (up to MIDNIGHT_OUTBOX_WAIT_SECONDS); if that
+    attempt does not land, it returns the provisional simulated hash while the
+    real proof stays queued (see get_submission_status).
+    
     Args:
         audit_id: Unique audit identifier (32 bytes hex string)
         exploit_string: The exploit payload
@@ -95,36 +251,24 @@ async def submit_audit_proof(
             "witness": witness
         }
         
-        # Call Midnight FastAPI server
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(
-                    f"{MIDNIGHT_API_URL}/api/submit-audit",
-                    json=request_data,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("success"):
-                        # Extract proof hash from transaction_id or generate from audit_id
-                        proof_hash = data.get("transaction_id") or f"zk_{audit_id[:16]}"
-                        log("Midnight", f"Proof Minted. Hash: {proof_hash} (Verified)", "🛡️", "info")
-                        return proof_hash
-                    else:
-                        error_msg = data.get("error", "Unknown error")
-                        log("Midnight", f"Midnight API returned error: {error_msg}", "🛡️", "info")
-                        # Fall back to simulation if API fails
-                        return _simulate_proof_generation(audit_id, exploit_string, risk_score)
-                else:
-                    log("Midnight", f"Midnight API returned status {response.status_code}, falling back to simulation", "🛡️", "info")
-                    # Fall back to simulation if API is unavailable
-                    return _simulate_proof_generation(audit_id, exploit_string, risk_score)
-                    
-            except (httpx.ConnectError, httpx.TimeoutException) as e:
-                log("Midnight", f"Midnight API unavailable ({type(e).__name__}), falling back to simulation", "🛡️", "info")
-                # Fall back to simulation if API is unavailable
-                return _simulate_proof_generation(audit_id, exploit_string, risk_score)
+        if MIDNIGHT_OUTBOX_ENABLED:
+            outbox = get_outbox()
+            outbox.enqueue(audit_id, request_data, priority=risk_score)
+            outbox.start()
+            proof_hash = await outbox.wait_for_attempt(audit_id, MIDNIGHT_OUTBOX_WAIT_SECONDS)
+            if proof_hash:
+                return proof_hash
+            log("Midnight", f"Proof for {audit_id[:16]} queued in outbox, using provisional hash until it lands", "🛡️", "info")
+            return _simulate_proof_generation(audit_id, exploit_string, risk_score)
+        
+        try:
+            proof_hash = await proof_scheduler.submit(request_data)
+            log("Midnight", f"Proof Minted. Hash: {proof_hash} (Verified)", "🛡️", "info")
+            return proof_hash
+        except SubmissionError as e:
+            log("Midnight", f"{str(e)}, falling back to simulation", "🛡️", "info")
+            # Fall back to simulation if API is unavailable
+            return _simulate_proof_generation(audit_id, exploit_string, risk_score)
         
     except Exception as e:
         log("Midnight", f"Error submitting audit proof: {str(e)}, falling back to simulation", "🛡️", "info")
@@ -132,6 +276,198 @@ async def submit_audit_proof(
         return _simulate_proof_generation(audit_id, exploit_string, risk_score)
 
 
+async def _await_job(
+    client: httpx.AsyncClient, response: httpx.Response, job_timeout: float = MIDNIGHT_JOB_TIMEOUT
+) -> Dict[str, Any]:
+    """
+    Follow a submission job until it finishes.
+    
+    Args:
+        client: Client to long-poll /api/jobs/{id} with
+        response: Response of the submit call
+        job_timeout: How long to follow the job (seconds)
+        
+    Returns:
+        dict: The job's result (a submit response body)
+        
+    Raises:
+        SubmissionError: the job failed without a result, or is still running at job_timeout
+    """
+    job = response.json()
+    deadline = time.monotonic() + job_timeout
+    while job["status"] not in ("succeeded", "failed"):
+        if time.monotonic() >= deadline:
+            # Resubmitting the same audits attaches to this job again
+            raise SubmissionError(f"Midnight job {job['job_id']} still {job['status']}")
+        try:
+            poll = await client.get(
+                f"{MIDNIGHT_API_URL}/api/jobs/{job['job_id']}",
+                params={"wait": MIDNIGHT_JOB_POLL_SECONDS}
+            )
+        except (httpx.ConnectError, httpx.TimeoutException) as e:
+            raise SubmissionError(f"Midnight API unavailable ({type(e).__name__})")
+        if poll.status_code not in (200, 202):
+            raise SubmissionError(f"Midnight API returned status {poll.status_code} for job {job['job_id']}")
+        job = poll.json()
+    
+    if job.get("result") is None:
+        raise SubmissionError(f"Midnight job failed: {job.get('error', 'Unknown error')}")
+    return job["result"]
+
+
+async def _post_submission(
+    path: str, body: Dict[str, Any], timeout: float, job_timeout: float = MIDNIGHT_JOB_TIMEOUT
+) -> Optional[Dict[str, Any]]:
+    """
+    POST to a submit endpoint and wait for the submission job's result.
+    
+    Args:
+        path: Submit endpoint
+        body: Request body
+        timeout: HTTP timeout for the submit call (seconds)
+        job_timeout: How long to follow the submission job (seconds)
+    
+    Returns:
+        dict: Submit response body; None if the endpoint does not exist
+    """
+    async with httpx.AsyncClient(timeout=timeout + MIDNIGHT_JOB_POLL_SECONDS) as client:
+        try:
+            response = await client.post(
+                f"{MIDNIGHT_API_URL}{path}",
+                json=body,
+                headers={"Content-Type": "application/json"}
+            )
+        except (httpx.ConnectError, httpx.TimeoutException) as e:
+            raise SubmissionError(f"Midnight API unavailable ({type(e).__name__})")
+        
+        if response.status_code in (404, 405):
+            return None
+        if response.status_code not in (200, 202):
+            # 400 means the contract is not initialized yet; only a malformed request (422) is final
+            raise SubmissionError(
+                f"Midnight API returned status {response.status_code}",
+                retryable=response.status_code != 422
+            )
+        if "job_id" in response.json():
+            return await _await_job(client, response, job_timeout)
+        return response.json()  # API without the job model
+
+
+async def _send_submission(request_data: Dict[str, Any]) -> str:
+    """
+    Send one submit-audit request to the Midnight FastAPI server and wait for its job.
+    
+    Args:
+        request_data: Request body for /api/submit-audit
+        
+    Returns:
+        str: Proof hash (transaction ID)
+        
+    Raises:
+        SubmissionError: retryable unless the API rejected the request itself
+    """
+    audit_id = request_data["audit_id"]
+    data = await _post_submission("/api/submit-audit", request_data, 30.0)
+    if data is None:
+        raise SubmissionError("Midnight API returned status 404")
+    if not data.get("success"):
+        raise SubmissionError(f"Midnight API returned error: {data.get('error', 'Unknown error')}", retryable=False)
+    # Extract proof hash from transaction_id or generate from audit_id
+    return data.get("transaction_id") or f"zk_{audit_id[:16]}"
+
+
+async def _send_bulk(requests: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Send many submit-audit requests in one /api/submit-audits call.
+    
+    The API runs the audits of a bulk job one after another, so the job is
+    followed for MIDNIGHT_JOB_TIMEOUT per audit. Giving up earlier would let
+    the outbox regroup the rows into a new job that submits them again.
+    
+    Returns:
+        dict: audit_id -> proof hash, or the SubmissionError it failed with;
+            None if the API has no bulk endpoint
+    """
+    data = await _post_submission(
+        "/api/submit-audits", {"audits": requests}, 30.0 * len(requests), MIDNIGHT_JOB_TIMEOUT * len(requests)
+    )
+    if data is None:
+        return None
+    if not data.get("success"):
+        raise SubmissionError(f"Midnight API returned error: {data.get('error', 'Unknown error')}")
+    outcomes: Dict[str, Any] = {}
+    for result in data.get("results", []):
+        audit_id = result["audit_id"]
+        if result.get("success"):
+            outcomes[audit_id] = result.get("transaction_id") or f"zk_{audit_id[:16]}"
+        else:
+            outcomes[audit_id] = SubmissionError(
+                f"Midnight API returned error: {result.get('error', 'Unknown error')}", retryable=False
+            )
+    return outcomes
+
+
+async def _send_submissions(requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Send many submit-audit requests in one /api/submit-audits call.
+    
+    The call goes through the proof scheduler like single submissions, ordered
+    by its highest risk score and holding one proof slot. Falls back to
+    individual submissions when the API has no bulk endpoint.
+    
+    Args:
+        requests: Request bodies for /api/submit-audit
+        
+    Returns:
+        dict: audit_id -> proof hash, or the SubmissionError it failed with
+        
+    Raises:
+        SubmissionError: the whole request failed
+    """
+    global _bulk_supported
+    if _bulk_supported:
+        outcomes = await proof_scheduler.submit_batch(requests, _send_bulk)
+        if outcomes is not None:
+            return outcomes
+        log("Midnight", "Midnight API has no bulk submit endpoint, submitting individually", "🛡️", "info")
+        _bulk_supported = False
+    
+    results = await asyncio.gather(
+        *(proof_scheduler.submit(request_data) for request_data in requests),
+        return_exceptions=True
+    )
+    return {request_data["audit_id"]: result for request_data, result in zip(requests, results)}
+
+
+def get_outbox() -> ProofOutbox:
+    """
+    Get the shared proof submission outbox.
+    
+    Returns:
+        ProofOutbox: Outbox backed by MIDNIGHT_OUTBOX_PATH
+    """
+    global _outbox
+    if _outbox is None:
+        _outbox = ProofOutbox(
+            proof_scheduler.submit,
+            submit_batch=_send_submissions if MIDNIGHT_OUTBOX_BULK else None
+        )
+    return _outbox
+
+
+def get_submission_status(audit_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Submission status of an audit proof in the outbox.
+    
+    Args:
+        audit_id: Audit identifier
+        
+    Returns:
+        dict: status (pending/submitted/failed), attempts, proofHash, lastError; None if unknown
+    """
+    return get_outbox().status(audit_id)
+
+
 def _simulate_proof_generation(audit_id: str, exploit_string: str, risk_score: int) -> str:
     """
     Simulate proof generation (for development/testing).
@@ -163,6 +499,17 @@ async def verify_audit_status(audit_id: str) -> Optional[Dict[str, Any]]:
         None if audit not found or error
     """
     try:
+        # Local ledger mirror answers without a network round trip
+        mirror = get_ledger_mirror()
+        if mirror is not None:
+            mirrored = mirror.get(audit_id)
+            if mirrored:
+                return {
+                    "is_verified": mirrored.get("is_verified", False),
+                    "audit_id": audit_id,
+                    "proof_hash": mirrored.get("proof_hash")
+                }
+        
         # Prepare request to Midnight FastAPI
         request_data = {
             "audit_id": audit_id
@@ -0,0 +1,223 @@
+"""
+Compact binary encoding for exported audit proofs.
+
+File layout:
+    header:  magic b"0XGP" | version u8
+    record:  body length u32 | body | crc32(body) u32
+
+Record body:
+    flags u8           bit0 is_verified, bit1 has timestamp, bit2 has block height
+    audit_id           field
+    proof_hash         field
+    auditor_id         field
+    timestamp i64      microseconds since the epoch (if bit1)
+    block_height u64   (if bit2)
+
+A field is tag u8 0 followed by 32 raw bytes for a 64-character lowercase hex
+string, or tag u8 1 followed by a u16 length and UTF-8 bytes otherwise.
+All integers are big-endian.
+"""
+import struct
+import zlib
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterator, Optional
+
+MAGIC = b"0XGP"
+VERSION = 1
+
+FLAG_VERIFIED = 0x01
+FLAG_TIMESTAMP = 0x02
+FLAG_BLOCK_HEIGHT = 0x04
+
+TAG_HEX32 = 0
+TAG_TEXT = 1
+
+_HEADER = struct.Struct(">4sB")
+_U32 = struct.Struct(">I")
+_U16 = struct.Struct(">H")
+_I64 = struct.Struct(">q")
+_U64 = struct.Struct(">Q")
+
+_HEX_DIGITS = set("0123456789abcdef")
+
+
+class ProofChecksumError(ValueError):
+    """A record failed its integrity check."""
+
+
+def _encode_field(value: str) -> bytes:
+    if len(value) == 64 and set(value) <= _HEX_DIGITS:
+        return bytes([TAG_HEX32]) + bytes.fromhex(value)
+    raw = value.encode("utf-8")
+    return bytes([TAG_TEXT]) + _U16.pack(len(raw)) + raw
+
+
+def _decode_field(body: bytes, offset: int) -> tuple:
+    tag = body[offset]
+    offset += 1
+    if tag == TAG_HEX32:
+        return body[offset:offset + 32].hex(), offset + 32
+    if tag == TAG_TEXT:
+        (length,) = _U16.unpack_from(body, offset)
+        offset += _U16.size
+        return body[offset:offset + length].decode("utf-8"), offset + length
+    raise ValueError(f"Unknown field tag {tag}")
+
+
+def _timestamp_micros(value: Any) -> Optional[int]:
+    try:
+        moment = datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+    # Naive timestamps are local time, as produced by datetime.now()
+    return round(moment.timestamp() * 1_000_000)
+
+
+def encode_proof(proof_data: Dict[str, Any]) -> bytes:
+    """
+    Encode one proof as a compact record body (without length or checksum).
+
+    Args:
+        proof_data: Proof data as returned by proof_verifier
+
+    Returns:
+        bytes: Record body
+    """
+    flags = FLAG_VERIFIED if proof_data.get("is_verified") else 0
+    timestamp = _timestamp_micros(proof_data.get("proof_timestamp", ""))
+    block_height = proof_data.get("block_height")
+    if timestamp is not None:
+        flags |= FLAG_TIMESTAMP
+    if block_height is not None:
+        flags |= FLAG_BLOCK_HEIGHT
+
+    parts = [
+        bytes([flags]),
+        _encode_field(str(proof_data.get("audit_id", ""))),
+        _encode_field(str(proof_data.get("proof_hash", ""))),
+        _encode_field(str(proof_data.get("auditor_id", ""))),
+    ]
+    if timestamp is not None:
+        parts.append(_I64.pack(timestamp))
+    if block_height is not None:
+        parts.append(_U64.pack(int(block_height)))
+    return b"".join(parts)
+
+
+def decode_proof(body: bytes) -> Dict[str, Any]:
+    """
+    Decode a record body produced by encode_proof.
+
+    Args:
+        body: Record body
+
+    Returns:
+        dict: Proof data
+    """
+    flags = body[0]
+    audit_id, offset = _decode_field(body, 1)
+    proof_hash, offset = _decode_field(body, offset)
+    auditor_id, offset = _decode_field(body, offset)
+
+    proof_data: Dict[str, Any] = {
+        "audit_id": audit_id,
+        "is_verified": bool(flags & FLAG_VERIFIED),
+        "auditor_id": auditor_id,
+        "proof_hash": proof_hash,
+    }
+    if flags & FLAG_TIMESTAMP:
+        (micros,) = _I64.unpack_from(body, offset)
+        offset += _I64.size
+        proof_data["proof_timestamp"] = datetime.fromtimestamp(micros / 1_000_000).isoformat()
+    if flags & FLAG_BLOCK_HEIGHT:
+        (block_height,) = _U64.unpack_from(body, offset)
+        proof_data["block_height"] = block_height
+    return proof_data
+
+
+def frame_record(body: bytes) -> bytes:
+    """Prefix a record body with its length and append its CRC32."""
+    return _U32.pack(len(body)) + body + _U32.pack(zlib.crc32(body))
+
+
+def unframe_record(record: bytes) -> Dict[str, Any]:
+    """
+    Decode a single framed record (as returned by frame_record), checking its CRC32.
+
+    Raises:
+        ValueError: Truncated record
+        ProofChecksumError: Checksum does not match
+    """
+    if len(record) < 2 * _U32.size:
+        raise ValueError("Truncated record")
+    (length,) = _U32.unpack_from(record, 0)
+    body = record[_U32.size:_U32.size + length]
+    if len(body) != length or len(record) != length + 2 * _U32.size:
+        raise ValueError("Truncated record")
+    (checksum,) = _U32.unpack_from(record, _U32.size + length)
+    if zlib.crc32(body) != checksum:
+        raise ProofChecksumError("Checksum mismatch")
+    return decode_proof(body)
+
+
+def write_header(stream: BinaryIO) -> None:
+    """Write the file header."""
+    stream.write(_HEADER.pack(MAGIC, VERSION))
+
+
+def write_proof(stream: BinaryIO, proof_data: Dict[str, Any]) -> int:
+    """
+    Append one framed proof record.
+
+    Returns:
+        int: Bytes written
+    """
+    record = frame_record(encode_proof(proof_data))
+    stream.write(record)
+    return len(record)
+
+
+def iter_proofs(stream: BinaryIO, skip_corrupt: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Read proofs from a compact export, verifying each record's checksum.
+
+    Args:
+        stream: Binary stream positioned at the file header
+        skip_corrupt: Skip records with a bad checksum instead of raising
+
+    Yields:
+        dict: Proof data per record
+
+    Raises:
+        ValueError: Bad header or truncated file
+        ProofChecksumError: A record's checksum does not match (unless skip_corrupt)
+    """
+    header = stream.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        raise ValueError("Not a compact proof export: missing header")
+    magic, version = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Not a compact proof export: bad magic")
+    if version != VERSION:
+        raise ValueError(f"Unsupported compact proof export version {version}")
+
+    index = 0
+    while True:
+        prefix = stream.read(_U32.size)
+        if not prefix:
+            return
+        if len(prefix) != _U32.size:
+            raise ValueError(f"Truncated record {index}")
+        (length,) = _U32.unpack(prefix)
+        body = stream.read(length)
+        trailer = stream.read(_U32.size)
+        if len(body) != length or len(trailer) != _U32.size:
+            raise ValueError(f"Truncated record {index}")
+
+        (checksum,) = _U32.unpack(trailer)
+        if zlib.crc32(body) != checksum:
+            if not skip_corrupt:
+                raise ProofChecksumError(f"Checksum mismatch in record {index}")
+        else:
+            yield decode_proof(body)
+        index += 1
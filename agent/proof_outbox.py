@@ -0,0 +1,359 @@
+"""
+Durable outbox for Midnight proof submissions.
+Pending submissions are stored in SQLite before anything is sent, and a background
+flusher drains them in batches with retry and exponential backoff, so a proof is
+never lost because the Midnight API was briefly unreachable.
+"""
+import os
+import sys
+import json
+import time
+import sqlite3
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from pathlib import Path
+
+# Add agent directory to path for logger import
+sys.path.insert(0, str(Path(__file__).parent))
+from logger import log
+
+# Configuration
+MIDNIGHT_OUTBOX_PATH = os.getenv("MIDNIGHT_OUTBOX_PATH", str(Path(__file__).parent / "proof_outbox.db"))
+MIDNIGHT_OUTBOX_BATCH_SIZE = int(os.getenv("MIDNIGHT_OUTBOX_BATCH_SIZE", "20"))
+MIDNIGHT_OUTBOX_FLUSH_INTERVAL = float(os.getenv("MIDNIGHT_OUTBOX_FLUSH_INTERVAL", "5"))  # seconds between idle polls
+MIDNIGHT_OUTBOX_RETRY_BASE = float(os.getenv("MIDNIGHT_OUTBOX_RETRY_BASE", "2"))  # first retry delay (seconds)
+MIDNIGHT_OUTBOX_RETRY_MAX = float(os.getenv("MIDNIGHT_OUTBOX_RETRY_MAX", "300"))  # backoff cap (seconds)
+# Rejections by the API (not connectivity failures) give up after this many attempts
+MIDNIGHT_OUTBOX_MAX_REJECTIONS = int(os.getenv("MIDNIGHT_OUTBOX_MAX_REJECTIONS", "5"))
+
+# Submission states
+STATUS_PENDING = "pending"
+STATUS_SUBMITTED = "submitted"
+STATUS_FAILED = "failed"
+
+
+class SubmissionError(Exception):
+    """A submission attempt failed."""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+# Sends one submission request and returns the proof hash, raising SubmissionError on failure
+SubmitFn = Callable[[Dict[str, Any]], Awaitable[str]]
+# Sends many requests at once; maps each audit_id to its proof hash or the exception it failed with
+SubmitBatchFn = Callable[[List[Dict[str, Any]]], Awaitable[Dict[str, Any]]]
+
+
+class ProofOutbox:
+    """
+    SQLite-backed queue of proof submissions with per-audit status.
+
+    Connectivity failures are retried with exponential backoff until the API is
+    reachable again. Requests the API rejects are retried up to max_rejections
+    times and then marked failed. Enqueueing the same audit twice is a no-op.
+    With submit_batch, each flush sends its due submissions in one request.
+
+    The background flusher hands due submissions off without waiting for them,
+    so a new high-priority submission is passed on while earlier ones are still
+    in flight; ordering and concurrency are left to the submit function (the
+    ProofScheduler in midnight_client). At most batch_size are in flight at once.
+    """
+
+    def __init__(
+        self,
+        submit: SubmitFn,
+        path: str = MIDNIGHT_OUTBOX_PATH,
+        batch_size: int = MIDNIGHT_OUTBOX_BATCH_SIZE,
+        flush_interval: float = MIDNIGHT_OUTBOX_FLUSH_INTERVAL,
+        retry_base: float = MIDNIGHT_OUTBOX_RETRY_BASE,
+        retry_max: float = MIDNIGHT_OUTBOX_RETRY_MAX,
+        max_rejections: int = MIDNIGHT_OUTBOX_MAX_REJECTIONS,
+        submit_batch: Optional[SubmitBatchFn] = None,
+    ):
+        self.submit = submit
+        self.submit_batch = submit_batch
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.max_rejections = max_rejections
+
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbox (
+                audit_id TEXT PRIMARY KEY,
+                request TEXT NOT NULL,
+                status TEXT NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                rejections INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                last_error TEXT,
+                proof_hash TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        columns = {row["name"] for row in self._db.execute("PRAGMA table_info(outbox)")}
+        if "priority" not in columns:
+            self._db.execute("ALTER TABLE outbox ADD COLUMN priority INTEGER NOT NULL DEFAULT 0")
+        self._db.execute("CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at)")
+        self._db.commit()
+
+        self._listeners: List[Callable[[str, str], None]] = []
+        self._attempt_waiters: Dict[str, List[asyncio.Future]] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._in_flight: Set[str] = set()
+        self._attempt_tasks: Set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def add_listener(self, callback: Callable[[str, str], None]) -> None:
+        """Call callback(audit_id, proof_hash) whenever a submission lands."""
+        self._listeners.append(callback)
+
+    def enqueue(self, audit_id: str, request: Dict[str, Any], priority: int = 0) -> str:
+        """
+        Durably record a submission before it is sent.
+
+        Args:
+            audit_id: Audit identifier (one submission per audit)
+            request: Body for the submit-audit endpoint
+            priority: Higher values are flushed first (e.g. the risk score)
+
+        Returns:
+            str: Current status of the audit's submission
+        """
+        now = time.time()
+        self._db.execute(
+            "INSERT OR IGNORE INTO outbox (audit_id, request, status, priority, next_attempt_at, created_at, updated_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (audit_id, json.dumps(request), STATUS_PENDING, priority, now, now, now),
+        )
+        self._db.commit()
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return self.status(audit_id)["status"]
+
+    def status(self, audit_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Submission status of one audit.
+
+        Returns:
+            dict: status, attempts, proofHash, lastError, nextAttemptAt; None if unknown
+        """
+        row = self._db.execute("SELECT * FROM outbox WHERE audit_id = ?", (audit_id,)).fetchone()
+        if row is None:
+            return None
+        return {
+            "auditId": row["audit_id"],
+            "status": row["status"],
+            "attempts": row["attempts"],
+            "proofHash": row["proof_hash"],
+            "lastError": row["last_error"],
+            "nextAttemptAt": row["next_attempt_at"] if row["status"] == STATUS_PENDING else None,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Submission counts by status."""
+        counts = {STATUS_PENDING: 0, STATUS_SUBMITTED: 0, STATUS_FAILED: 0}
+        for row in self._db.execute("SELECT status, COUNT(*) AS n FROM outbox GROUP BY status"):
+            counts[row["status"]] = row["n"]
+        return {**counts, "inFlight": len(self._in_flight), "flusherRunning": self.running}
+
+    async def wait_for_attempt(self, audit_id: str, timeout: float) -> Optional[str]:
+        """
+        Wait for the next submission attempt of an audit to finish.
+
+        Args:
+            audit_id: Audit identifier
+            timeout: Seconds to wait
+
+        Returns:
+            str: Proof hash if the audit is submitted, None if the attempt failed or timed out
+        """
+        current = self.status(audit_id)
+        if current and current["status"] != STATUS_PENDING:
+            return current["proofHash"]
+
+        future = asyncio.get_running_loop().create_future()
+        self._attempt_waiters.setdefault(audit_id, []).append(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            waiters = self._attempt_waiters.get(audit_id, [])
+            if future in waiters:
+                waiters.remove(future)
+            if not waiters:
+                self._attempt_waiters.pop(audit_id, None)
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        if self.running:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        pending = self.stats()[STATUS_PENDING]
+        if pending:
+            log("Midnight", f"Proof outbox resuming with {pending} pending submissions", "🛡️", "info")
+
+    async def stop(self) -> None:
+        """Stop the flusher; pending submissions stay in the outbox for the next run."""
+        tasks = list(self._attempt_tasks)
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._in_flight.clear()
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+    def dispatch(self) -> List[asyncio.Task]:
+        """
+        Start attempts for due submissions that are not already in flight,
+        highest priority (then oldest) first, without waiting for them: in a
+        single submit_batch call if set, otherwise one task each.
+
+        Returns:
+            list: The started attempt tasks
+        """
+        capacity = self.batch_size - len(self._in_flight)
+        if capacity <= 0:
+            return []
+        in_flight = list(self._in_flight)
+        rows = self._db.execute(
+            "SELECT audit_id, request, attempts, rejections FROM outbox"
+            " WHERE status = ? AND next_attempt_at <= ?"
+            f" AND audit_id NOT IN ({', '.join('?' for _ in in_flight)})"
+            " ORDER BY priority DESC, created_at LIMIT ?",
+            (STATUS_PENDING, time.time(), *in_flight, capacity),
+        ).fetchall()
+        if len(rows) > 1 and self.submit_batch is not None:
+            attempts = [(rows, self._attempt_batch(rows))]
+        else:
+            attempts = [([row], self._attempt(row)) for row in rows]
+
+        tasks = []
+        for batch, coro in attempts:
+            ids = [row["audit_id"] for row in batch]
+            self._in_flight.update(ids)
+            task = asyncio.create_task(coro)
+            task.add_done_callback(lambda t, ids=ids: self._attempt_done(t, ids))
+            self._attempt_tasks.add(task)
+            tasks.append(task)
+        return tasks
+
+    def _attempt_done(self, task: asyncio.Task, audit_ids: List[str]) -> None:
+        self._attempt_tasks.discard(task)
+        self._in_flight.difference_update(audit_ids)
+        if not task.cancelled() and task.exception() is not None:
+            log("Midnight", f"Proof outbox attempt error: {str(task.exception())}", "🛡️", "info")
+        if self._wakeup is not None:
+            self._wakeup.set()  # A slot is free and retries may be scheduled
+
+    async def flush(self) -> int:
+        """
+        Submit one batch of due submissions and wait for the attempts (see dispatch).
+
+        Returns:
+            int: Number of submissions attempted
+        """
+        in_flight = len(self._in_flight)
+        tasks = self.dispatch()
+        attempted = len(self._in_flight) - in_flight
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return attempted
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                self.dispatch()
+            except Exception as e:
+                log("Midnight", f"Proof outbox flush error: {str(e)}", "🛡️", "info")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._next_delay())
+            except asyncio.TimeoutError:
+                pass
+
+    def _next_delay(self) -> float:
+        row = self._db.execute(
+            "SELECT MIN(next_attempt_at) AS due FROM outbox WHERE status = ?", (STATUS_PENDING,)
+        ).fetchone()
+        if row["due"] is None:
+            return self.flush_interval
+        return min(self.flush_interval, max(0.0, row["due"] - time.time()))
+
+    async def _attempt(self, row: sqlite3.Row) -> None:
+        try:
+            proof_hash = await self.submit(json.loads(row["request"]))
+        except Exception as e:
+            self._record(row, None, e)
+        else:
+            self._record(row, proof_hash, None)
+
+    async def _attempt_batch(self, rows: List[sqlite3.Row]) -> None:
+        try:
+            outcomes = await self.submit_batch([json.loads(row["request"]) for row in rows])
+        except Exception as e:
+            outcomes = {row["audit_id"]: e for row in rows}
+        for row in rows:
+            outcome = outcomes.get(row["audit_id"], SubmissionError("No result for submission"))
+            if isinstance(outcome, Exception):
+                self._record(row, None, outcome)
+            else:
+                self._record(row, outcome, None)
+
+    def _record(self, row: sqlite3.Row, proof_hash: Optional[str], error: Optional[Exception]) -> None:
+        audit_id = row["audit_id"]
+        attempts = row["attempts"] + 1
+        now = time.time()
+        if error is None:
+            self._db.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, proof_hash = ?, last_error = NULL, updated_at = ?"
+                " WHERE audit_id = ?",
+                (STATUS_SUBMITTED, attempts, proof_hash, now, audit_id),
+            )
+            log("Midnight", f"Proof Minted. Hash: {proof_hash} (Verified)", "🛡️", "info")
+        else:
+            retryable = getattr(error, "retryable", True)
+            rejections = row["rejections"] + (0 if retryable else 1)
+            delay = min(self.retry_base * (2 ** (attempts - 1)), self.retry_max)
+            status = STATUS_FAILED if rejections >= self.max_rejections else STATUS_PENDING
+            self._db.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, rejections = ?, next_attempt_at = ?,"
+                " last_error = ?, updated_at = ? WHERE audit_id = ?",
+                (status, attempts, rejections, now + delay, str(error), now, audit_id),
+            )
+            if status == STATUS_FAILED:
+                log("Midnight", f"Proof submission for {audit_id[:16]} failed permanently: {str(error)}", "🛡️", "info")
+            else:
+                log("Midnight", f"Proof submission for {audit_id[:16]} failed ({str(error)}), retrying in {delay:.0f}s", "🛡️", "info")
+        self._db.commit()
+
+        for future in self._attempt_waiters.get(audit_id, []):
+            if not future.done():
+                future.set_result(proof_hash)
+        if proof_hash:
+            for callback in self._listeners:
+                try:
+                    callback(audit_id, proof_hash)
+                except Exception as e:
+                    log("Midnight", f"Proof outbox listener error: {str(e)}", "🛡️", "info")
@@ -6,15 +6,18 @@ import os
 import httpx
 import json
 import hashlib
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 import sys
 import asyncio
+from collections import OrderedDict
 
 # Add agent directory to path for logger import
 sys.path.insert(0, str(Path(__file__).parent))
 from logger import log
+from ledger_mirror import get_ledger_mirror
+import proof_codec
 
 # Configuration
 MIDNIGHT_DEVNET_URL = os.getenv("MIDNIGHT_DEVNET_URL", "http://localhost:6300")
@@ -23,6 +26,129 @@ MIDNIGHT_CONTRACT_ADDRESS = os.getenv("MIDNIGHT_CONTRACT_ADDRESS", "")
 MIDNIGHT_INDEXER = os.getenv("MIDNIGHT_INDEXER", "http://localhost:6300/graphql")
 MIDNIGHT_INDEXER_WS = os.getenv("MIDNIGHT_INDEXER_WS", "ws://localhost:6300/graphql/ws")
 MIDNIGHT_PROOF_EXPIRY_HOURS = int(os.getenv("MIDNIGHT_PROOF_EXPIRY_HOURS", "24"))
+MIDNIGHT_VERIFY_BATCH_SIZE = int(os.getenv("MIDNIGHT_VERIFY_BATCH_SIZE", "100"))  # audit IDs per request
+MIDNIGHT_VERIFY_MAX_CONCURRENCY = int(os.getenv("MIDNIGHT_VERIFY_MAX_CONCURRENCY", "4"))  # chunks in flight
+MIDNIGHT_VERIFY_PROOF_TIMEOUT = float(os.getenv("MIDNIGHT_VERIFY_PROOF_TIMEOUT", "10"))  # seconds per proof
+MIDNIGHT_VERIFY_BATCH_TIMEOUT = float(os.getenv("MIDNIGHT_VERIFY_BATCH_TIMEOUT", "30"))  # seconds per batch
+MIDNIGHT_PROOF_CACHE_SIZE = int(os.getenv("MIDNIGHT_PROOF_CACHE_SIZE", "10000"))  # proofs kept in memory
+
+# Shared connection-pooled HTTP client (lazily created per event loop)
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Flipped off the first time the bridge answers the batch endpoint with 404/405
+_bridge_batch_supported = True
+
+
+class ProofCache:
+    """
+    LRU cache of fetched proof data keyed by proof ID.
+    
+    On-chain audit records are immutable once written, so an entry stays valid
+    until the proof itself expires (proof_timestamp + MIDNIGHT_PROOF_EXPIRY_HOURS).
+    Missing proofs are never cached, since the record may be written later.
+    Concurrent lookups for the same ID share a single fetch.
+    """
+    
+    def __init__(self, max_entries: int = MIDNIGHT_PROOF_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # proof_id -> (expires_at, proof_data); order == recency
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, proof_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached proof data.
+        
+        Args:
+            proof_id: The audit ID or proof hash
+            
+        Returns:
+            dict: Proof data, or None if not cached or expired
+        """
+        entry = self._entries.get(proof_id)
+        if entry is None:
+            return None
+        expires_at, proof_data = entry
+        if datetime.now() >= expires_at:
+            del self._entries[proof_id]
+            return None
+        self._entries.move_to_end(proof_id)
+        return proof_data
+    
+    def put(self, proof_id: str, proof_data: Optional[Dict[str, Any]]) -> None:
+        """Cache proof data until the proof expires (no-op for missing or expired proofs)."""
+        if not proof_data:
+            return
+        expires_at = _proof_expires_at(proof_data)
+        if datetime.now() >= expires_at:
+            return
+        self._entries[proof_id] = (expires_at, proof_data)
+        self._entries.move_to_end(proof_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    async def get_or_fetch(self, proof_id: str, fetch) -> Optional[Dict[str, Any]]:
+        """
+        Return cached proof data, fetching it once if absent.
+        
+        Args:
+            proof_id: The audit ID or proof hash
+            fetch: Coroutine function proof_id -> proof data (or None)
+            
+        Returns:
+            dict: Proof data, or None if not found
+        """
+        proof_data = self.get(proof_id)
+        if proof_data is not None:
+            self.hits += 1
+            return proof_data
+        
+        in_flight = self._in_flight.get(proof_id)
+        if in_flight is not None:
+            self.hits += 1
+            return await asyncio.shield(in_flight)
+        
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[proof_id] = future
+        try:
+            proof_data = await fetch(proof_id)
+            self.put(proof_id, proof_data)
+            future.set_result(proof_data)
+            return proof_data
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # mark retrieved when nobody else was waiting
+            raise
+        finally:
+            del self._in_flight[proof_id]
+    
+    def clear(self) -> None:
+        """Drop every cached proof."""
+        self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "maxEntries": self.max_entries,
+            "inFlight": len(self._in_flight),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Shared cache used by verify_audit_proof, get_verification_proof and batch_verify
+proof_cache = ProofCache()
 
 
 class ProofVerificationResult:
@@ -56,7 +182,11 @@ class ProofVerificationResult:
         }
 
 
-async def verify_audit_proof(proof_id: str, expected_auditor_id: Optional[str] = None) -> ProofVerificationResult:
+async def verify_audit_proof(
+    proof_id: str,
+    expected_auditor_id: Optional[str] = None,
+    proof_data: Optional[Dict[str, Any]] = None
+) -> ProofVerificationResult:
     """
     Verify an audit proof from Midnight contract.
     
@@ -70,6 +200,8 @@ async def verify_audit_proof(proof_id: str, expected_auditor_id: Optional[str] =
     Args:
         proof_id: The audit ID or proof hash to verify
         expected_auditor_id: Optional auditor ID to verify against
+        proof_data: Proof data already fetched (e.g. by batch_verify); an empty
+            dict means the proof is known not to exist. Fetched if None.
         
     Returns:
         ProofVerificationResult: Verification result with all details
@@ -78,7 +210,8 @@ async def verify_audit_proof(proof_id: str, expected_auditor_id: Optional[str] =
         log("ProofVerifier", f"Verifying proof: {proof_id[:16]}...", "🔍", "info")
         
         # Step 1: Fetch proof from Midnight contract
-        proof_data = await _fetch_proof_from_contract(proof_id)
+        if proof_data is None:
+            proof_data = await proof_cache.get_or_fetch(proof_id, _fetch_proof_from_contract)
         if not proof_data:
             return ProofVerificationResult(
                 isValid=False,
@@ -118,7 +251,7 @@ async def verify_audit_proof(proof_id: str, expected_auditor_id: Optional[str] =
             )
         
         # Step 5: Check for expired proofs
-        proof_timestamp = datetime.fromisoformat(proof_data.get("proof_timestamp", datetime.now().isoformat()))
+        proof_timestamp = _parse_proof_timestamp(proof_data.get("proof_timestamp", datetime.now().isoformat()))
         if _is_proof_expired(proof_timestamp):
             return ProofVerificationResult(
                 isValid=True,
@@ -161,14 +294,22 @@ async def verify_audit_proof(proof_id: str, expected_auditor_id: Optional[str] =
         )
 
 
-async def batch_verify(proof_ids: List[str], expected_auditor_id: Optional[str] = None) -> List[ProofVerificationResult]:
+async def batch_verify(
+    proof_ids: List[str],
+    expected_auditor_id: Optional[str] = None,
+    proof_timeout: float = MIDNIGHT_VERIFY_PROOF_TIMEOUT,
+    total_timeout: float = MIDNIGHT_VERIFY_BATCH_TIMEOUT
+) -> List[ProofVerificationResult]:
     """
     Verify multiple proofs in parallel.
-    Optimized for gas efficiency by batching requests.
+    Collects verify_stream() in input order: a slow proof only times out
+    itself, and proofs finished before the batch budget keep their results.
     
     Args:
         proof_ids: List of proof IDs to verify
         expected_auditor_id: Optional auditor ID to verify against
+        proof_timeout: Deadline for each proof (seconds)
+        total_timeout: Budget for the whole batch (seconds)
         
     Returns:
         List[ProofVerificationResult]: List of verification results
@@ -176,61 +317,91 @@ async def batch_verify(proof_ids: List[str], expected_auditor_id: Optional[str]
     try:
         log("ProofVerifier", f"Batch verifying {len(proof_ids)} proofs...", "🔍", "info")
         
-        # Create tasks for parallel verification
-        tasks = [verify_audit_proof(proof_id, expected_auditor_id) for proof_id in proof_ids]
-        
-        # Execute in parallel with timeout
-        results = await asyncio.wait_for(
-            asyncio.gather(*tasks, return_exceptions=True),
-            timeout=30.0  # 30 second timeout for batch
-        )
-        
-        # Convert exceptions to error results
-        verification_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                verification_results.append(ProofVerificationResult(
-                    isValid=False,
-                    isHighSeverity=False,
-                    auditorId="",
-                    timestamp=datetime.now(),
-                    proofData={},
-                    error=f"Exception: {str(result)}"
-                ))
-            else:
-                verification_results.append(result)
+        verification_results: List[Optional[ProofVerificationResult]] = [None] * len(proof_ids)
+        async for index, result in verify_stream(proof_ids, expected_auditor_id, proof_timeout, total_timeout):
+            verification_results[index] = result
         
         valid_count = sum(1 for r in verification_results if r.isValid)
         log("ProofVerifier", f"Batch verification complete: {valid_count}/{len(proof_ids)} valid", "✅", "info")
         
         return verification_results
         
-    except asyncio.TimeoutError:
-        log("ProofVerifier", "Batch verification timeout", "⚠️", "warn")
-        return [
-            ProofVerificationResult(
-                isValid=False,
-                isHighSeverity=False,
-                auditorId="",
-                timestamp=datetime.now(),
-                proofData={},
-                error="Batch verification timeout"
-            )
-            for _ in proof_ids
-        ]
     except Exception as e:
         log("ProofVerifier", f"Batch verification error: {str(e)}", "❌", "error")
-        return [
-            ProofVerificationResult(
-                isValid=False,
-                isHighSeverity=False,
-                auditorId="",
-                timestamp=datetime.now(),
-                proofData={},
-                error=str(e)
-            )
-            for _ in proof_ids
-        ]
+        return [_failed_result(str(e)) for _ in proof_ids]
+
+
+async def verify_stream(
+    proof_ids: List[str],
+    expected_auditor_id: Optional[str] = None,
+    proof_timeout: float = MIDNIGHT_VERIFY_PROOF_TIMEOUT,
+    total_timeout: float = MIDNIGHT_VERIFY_BATCH_TIMEOUT
+) -> AsyncIterator[Tuple[int, ProofVerificationResult]]:
+    """
+    Verify multiple proofs, yielding each result as soon as it completes.
+    
+    Proof data is fetched in chunks of MIDNIGHT_VERIFY_BATCH_SIZE audit IDs per
+    request over a shared pooled client, with at most MIDNIGHT_VERIFY_MAX_CONCURRENCY
+    chunks in flight; each proof is then checked locally. A proof that misses
+    its deadline yields a timeout result without affecting the others. When the
+    batch budget runs out, proofs already finished still yield their results
+    and every unfinished proof yields a timeout result.
+    
+    Args:
+        proof_ids: List of proof IDs to verify
+        expected_auditor_id: Optional auditor ID to verify against
+        proof_timeout: Deadline for each proof (seconds)
+        total_timeout: Budget for the whole batch (seconds)
+        
+    Yields:
+        (index, ProofVerificationResult): Index into proof_ids and its result,
+        in completion order
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + total_timeout
+    prefetch = _start_prefetch(proof_ids)
+    
+    async def verify_one(proof_id: str) -> ProofVerificationResult:
+        # Shield the shared chunk so one proof's deadline does not cancel it for the rest
+        prefetched = await asyncio.shield(prefetch[proof_id])
+        return await verify_audit_proof(proof_id, expected_auditor_id, prefetched.get(proof_id))
+    
+    async def run(index: int, proof_id: str) -> Tuple[int, ProofVerificationResult]:
+        try:
+            return index, await asyncio.wait_for(verify_one(proof_id), timeout=proof_timeout)
+        except asyncio.TimeoutError:
+            log("ProofVerifier", f"Proof verification timeout: {proof_id[:16]}...", "⚠️", "warn")
+            return index, _failed_result("Proof verification timeout")
+        except Exception as e:
+            return index, _failed_result(f"Exception: {str(e)}")
+    
+    tasks = {asyncio.create_task(run(i, proof_id)): i for i, proof_id in enumerate(proof_ids)}
+    pending = set(tasks)
+    try:
+        while pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+        
+        # Proofs that finished while the consumer was away still keep their results
+        for task in sorted((t for t in pending if t.done()), key=tasks.get):
+            pending.discard(task)
+            yield task.result()
+        
+        if pending:
+            log("ProofVerifier", f"Batch verification timeout: {len(pending)} proofs unfinished", "⚠️", "warn")
+            for task in sorted(pending, key=tasks.get):
+                task.cancel()
+                yield tasks[task], _failed_result("Batch verification timeout")
+            pending = set()
+    finally:
+        for task in pending:
+            task.cancel()
+        for chunk_task in set(prefetch.values()):
+            chunk_task.cancel()
 
 
 async def get_verification_proof(proof_id: str, format: str = "json") -> Optional[str]:
@@ -239,7 +410,8 @@ async def get_verification_proof(proof_id: str, format: str = "json") -> Optiona
     
     Args:
         proof_id: The proof ID to export
-        format: Export format - "json" or "hex"
+        format: Export format - "json", "hex" (hex-encoded JSON) or "compact"
+            (hex-encoded checksummed binary record, see proof_codec)
         
     Returns:
         str: Proof in requested format, or None if not found
@@ -248,13 +420,15 @@ async def get_verification_proof(proof_id: str, format: str = "json") -> Optiona
         log("ProofVerifier", f"Exporting proof: {proof_id[:16]}...", "📤", "info")
         
         # Fetch proof data
-        proof_data = await _fetch_proof_from_contract(proof_id)
+        proof_data = await proof_cache.get_or_fetch(proof_id, _fetch_proof_from_contract)
         if not proof_data:
             log("ProofVerifier", f"Proof not found: {proof_id[:16]}...", "⚠️", "warn")
             return None
         
         # Format proof based on requested format
-        if format.lower() == "hex":
+        if format.lower() == "compact":
+            return proof_codec.frame_record(proof_codec.encode_proof(proof_data)).hex()
+        elif format.lower() == "hex":
             # Convert to hex string
             proof_json = json.dumps(proof_data, default=str)
             proof_hex = proof_json.encode('utf-8').hex()
@@ -268,6 +442,68 @@ async def get_verification_proof(proof_id: str, format: str = "json") -> Optiona
         return None
 
 
+async def export_proofs(proof_ids: List[str], path: str) -> int:
+    """
+    Bulk-export proofs into one compact binary file for off-chain verification.
+    
+    Proof data is fetched with the same chunked requests as batch_verify and
+    each record is written as soon as its chunk arrives, so memory stays flat
+    for large exports. Proofs that are not found are skipped.
+    
+    Args:
+        proof_ids: Proof IDs to export
+        path: Output file path
+        
+    Returns:
+        int: Number of proofs written
+    """
+    log("ProofVerifier", f"Exporting {len(proof_ids)} proofs to {path}...", "📤", "info")
+    prefetch = _start_prefetch(proof_ids)
+    written = 0
+    
+    try:
+        with open(path, "wb") as f:
+            proof_codec.write_header(f)
+            for chunk in asyncio.as_completed(set(prefetch.values())):
+                for proof_id, proof_data in (await chunk).items():
+                    if proof_data:
+                        proof_codec.write_proof(f, proof_data)
+                        written += 1
+            
+            # IDs from failed chunks are fetched individually
+            exported = {pid for fut in set(prefetch.values()) for pid in fut.result()}
+            for proof_id in dict.fromkeys(proof_ids):
+                if proof_id not in exported:
+                    proof_data = await proof_cache.get_or_fetch(proof_id, _fetch_proof_from_contract)
+                    if proof_data:
+                        proof_codec.write_proof(f, proof_data)
+                        written += 1
+    finally:
+        for chunk_task in set(prefetch.values()):
+            chunk_task.cancel()
+    
+    log("ProofVerifier", f"Exported {written}/{len(proof_ids)} proofs to {path}", "✅", "info")
+    return written
+
+
+def load_proofs(path: str, skip_corrupt: bool = False) -> List[Dict[str, Any]]:
+    """
+    Load proofs from a compact export, verifying each record's checksum.
+    
+    Args:
+        path: File written by export_proofs
+        skip_corrupt: Drop records with a bad checksum instead of raising
+        
+    Returns:
+        List[dict]: Proof data in file order
+        
+    Raises:
+        proof_codec.ProofChecksumError: A record is corrupt (unless skip_corrupt)
+    """
+    with open(path, "rb") as f:
+        return list(proof_codec.iter_proofs(f, skip_corrupt=skip_corrupt))
+
+
 # ============================================================================
 # Internal Helper Functions
 # ============================================================================
@@ -283,24 +519,24 @@ async def _fetch_proof_from_contract(proof_id: str) -> Optional[Dict[str, Any]]:
         dict: Proof data or None if not found
     """
     try:
+        # Local ledger mirror answers without a network round trip
+        mirror = get_ledger_mirror()
+        if mirror is not None:
+            proof_data = mirror.get(proof_id)
+            if proof_data:
+                return proof_data
+        
         # Try to fetch from bridge service first
         if MIDNIGHT_BRIDGE_URL:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    f"{MIDNIGHT_BRIDGE_URL}/api/query-audit",
-                    json={"auditId": proof_id}
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("found"):
-                        return {
-                            "audit_id": proof_id,
-                            "is_verified": data.get("isVerified", False),
-                            "auditor_id": data.get("auditorId", ""),
-                            "proof_hash": data.get("proofHash", ""),
-                            "proof_timestamp": data.get("timestamp", datetime.now().isoformat()),
-                            "block_height": data.get("blockHeight"),
-                        }
+            client = _get_http_client()
+            response = await client.post(
+                f"{MIDNIGHT_BRIDGE_URL}/api/query-audit",
+                json={"auditId": proof_id}
+            )
+            if response.status_code == 200:
+                data = response.json()
+                if data.get("found"):
+                    return _proof_from_bridge_record(proof_id, data)
         
         # Fallback: Query contract directly via indexer
         if MIDNIGHT_CONTRACT_ADDRESS and MIDNIGHT_INDEXER:
@@ -335,28 +571,22 @@ async def _query_contract_via_indexer(proof_id: str) -> Optional[Dict[str, Any]]
         }
         """
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                MIDNIGHT_INDEXER,
-                json={
-                    "query": query,
-                    "variables": {
-                        "contractAddress": MIDNIGHT_CONTRACT_ADDRESS,
-                        "auditId": proof_id
-                    }
+        client = _get_http_client()
+        response = await client.post(
+            MIDNIGHT_INDEXER,
+            json={
+                "query": query,
+                "variables": {
+                    "contractAddress": MIDNIGHT_CONTRACT_ADDRESS,
+                    "auditId": proof_id
                 }
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("data"):
-                    contract_state = data["data"].get("contractState", {})
-                    return {
-                        "audit_id": proof_id,
-                        "is_verified": contract_state.get("is_verified", False),
-                        "auditor_id": contract_state.get("auditor_id", ""),
-                        "proof_timestamp": contract_state.get("proof_timestamp", datetime.now().isoformat()),
-                    }
+            }
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            if data.get("data"):
+                return _proof_from_contract_state(proof_id, data["data"].get("contractState", {}))
         
         return None
         
@@ -365,6 +595,213 @@ async def _query_contract_via_indexer(proof_id: str) -> Optional[Dict[str, Any]]
         return None
 
 
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared connection-pooled HTTP client for bridge and indexer calls.
+    A new client is created if the event loop changed (clients are loop-bound).
+    
+    Returns:
+        httpx.AsyncClient: Pooled client
+    """
+    global _http_client, _http_client_loop
+    
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_connections=MIDNIGHT_VERIFY_MAX_CONCURRENCY * 2,
+                max_keepalive_connections=MIDNIGHT_VERIFY_MAX_CONCURRENCY,
+            ),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (call on shutdown)."""
+    global _http_client, _http_client_loop
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+
+def _proof_from_bridge_record(proof_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a bridge query-audit record into proof data."""
+    return {
+        "audit_id": proof_id,
+        "is_verified": data.get("isVerified", False),
+        "auditor_id": data.get("auditorId", ""),
+        "proof_hash": data.get("proofHash", ""),
+        "proof_timestamp": data.get("timestamp", datetime.now().isoformat()),
+        "block_height": data.get("blockHeight"),
+    }
+
+
+def _proof_from_contract_state(proof_id: str, contract_state: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize an indexer contractState selection into proof data."""
+    return {
+        "audit_id": proof_id,
+        "is_verified": contract_state.get("is_verified", False),
+        "auditor_id": contract_state.get("auditor_id", ""),
+        "proof_timestamp": contract_state.get("proof_timestamp", datetime.now().isoformat()),
+    }
+
+
+def _start_prefetch(proof_ids: List[str]) -> Dict[str, "asyncio.Future"]:
+    """
+    Start fetching proof data for many audit IDs with chunked requests.
+    
+    Cached proofs are served from proof_cache; the rest are split into
+    chunks of MIDNIGHT_VERIFY_BATCH_SIZE and at most
+    MIDNIGHT_VERIFY_MAX_CONCURRENCY chunks are in flight. A failed chunk
+    resolves to {}, so callers fall back to fetching its IDs individually.
+    
+    Args:
+        proof_ids: Audit IDs to fetch
+        
+    Returns:
+        dict: proof_id -> future resolving to {proof_id: proof data} for its chunk
+            ({} as proof data if the proof does not exist)
+    """
+    loop = asyncio.get_running_loop()
+    futures: Dict[str, asyncio.Future] = {}
+    
+    cached: Dict[str, Dict[str, Any]] = {}
+    unique_ids = []
+    for proof_id in dict.fromkeys(proof_ids):
+        proof_data = proof_cache.get(proof_id)
+        if proof_data is not None:
+            proof_cache.hits += 1
+            cached[proof_id] = proof_data
+        else:
+            unique_ids.append(proof_id)
+    
+    if cached:
+        cached_future = loop.create_future()
+        cached_future.set_result(cached)
+        for proof_id in cached:
+            futures[proof_id] = cached_future
+    
+    chunk_size = max(1, MIDNIGHT_VERIFY_BATCH_SIZE)
+    semaphore = asyncio.Semaphore(max(1, MIDNIGHT_VERIFY_MAX_CONCURRENCY))
+    
+    async def run(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+        try:
+            async with semaphore:
+                result = await _fetch_proof_chunk(chunk)
+        except Exception as e:
+            log("ProofVerifier", f"Batch fetch chunk failed: {str(e)}", "⚠️", "warn")
+            return {}
+        for proof_id, proof_data in result.items():
+            proof_cache.misses += 1
+            proof_cache.put(proof_id, proof_data)
+        return result
+    
+    for i in range(0, len(unique_ids), chunk_size):
+        chunk = unique_ids[i:i + chunk_size]
+        chunk_task = asyncio.create_task(run(chunk))
+        for proof_id in chunk:
+            futures[proof_id] = chunk_task
+    
+    return futures
+
+
+async def _fetch_proof_chunk(proof_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch one chunk of proofs with a single bridge or indexer request.
+    Mirrors _fetch_proof_from_contract: ledger mirror, bridge, indexer, then simulation.
+    
+    Args:
+        proof_ids: Audit IDs in this chunk
+        
+    Returns:
+        dict: proof_id -> proof data ({} if the proof does not exist)
+    """
+    global _bridge_batch_supported
+    
+    found: Dict[str, Dict[str, Any]] = {}
+    client = _get_http_client()
+    
+    mirror = get_ledger_mirror()
+    if mirror is not None:
+        for proof_id in proof_ids:
+            proof_data = mirror.get(proof_id)
+            if proof_data:
+                found[proof_id] = proof_data
+        if len(found) == len(proof_ids):
+            return found
+    
+    if MIDNIGHT_BRIDGE_URL and _bridge_batch_supported:
+        try:
+            pending = [proof_id for proof_id in proof_ids if proof_id not in found]
+            response = await client.post(
+                f"{MIDNIGHT_BRIDGE_URL}/api/query-audits",
+                json={"auditIds": pending}
+            )
+            if response.status_code == 200:
+                for record in response.json().get("audits", []):
+                    audit_id = record.get("auditId")
+                    if audit_id in pending and record.get("found"):
+                        found[audit_id] = _proof_from_bridge_record(audit_id, record)
+            elif response.status_code in (404, 405):
+                log("ProofVerifier", "Bridge has no batch query endpoint, using indexer batches", "🔍", "info")
+                _bridge_batch_supported = False
+        except httpx.RequestError as e:
+            log("ProofVerifier", f"Bridge batch query failed: {str(e)}", "⚠️", "warn")
+    
+    missing = [proof_id for proof_id in proof_ids if proof_id not in found]
+    if not missing:
+        return found
+    
+    # Fallback: Query contract directly via indexer, one aliased query per chunk
+    if MIDNIGHT_CONTRACT_ADDRESS and MIDNIGHT_INDEXER:
+        found.update(await _query_contracts_batch_via_indexer(missing))
+        return found
+    
+    # Final fallback: Simulate for development
+    for proof_id in missing:
+        found[proof_id] = _simulate_proof_fetch(proof_id) or {}
+    return found
+
+
+async def _query_contracts_batch_via_indexer(proof_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Query contract state for many audit IDs with one aliased GraphQL query.
+    
+    Args:
+        proof_ids: Audit IDs to query
+        
+    Returns:
+        dict: proof_id -> proof data ({} if the indexer has no data for it)
+    """
+    variables: Dict[str, Any] = {"contractAddress": MIDNIGHT_CONTRACT_ADDRESS}
+    params = ["$contractAddress: String!"]
+    selections = []
+    for i, proof_id in enumerate(proof_ids):
+        variables[f"a{i}"] = proof_id
+        params.append(f"$a{i}: String!")
+        selections.append(
+            f"a{i}: contractState(address: $contractAddress) {{ "
+            f"is_verified(auditId: $a{i}) auditor_id(auditId: $a{i}) proof_timestamp(auditId: $a{i}) }}"
+        )
+    query = f"query GetAudits({', '.join(params)}) {{ {' '.join(selections)} }}"
+    
+    client = _get_http_client()
+    response = await client.post(MIDNIGHT_INDEXER, json={"query": query, "variables": variables})
+    
+    results: Dict[str, Dict[str, Any]] = {}
+    if response.status_code == 200:
+        data = response.json().get("data") or {}
+        for i, proof_id in enumerate(proof_ids):
+            contract_state = data.get(f"a{i}")
+            results[proof_id] = _proof_from_contract_state(proof_id, contract_state) if contract_state else {}
+    else:
+        log("ProofVerifier", f"Indexer batch query returned status {response.status_code}", "⚠️", "warn")
+    return results
+
+
 async def _verify_zk_proof(proof_data: Dict[str, Any]) -> bool:
     """
     Verify that the ZK proof is cryptographically valid.
@@ -400,6 +837,54 @@ async def _verify_zk_proof(proof_data: Dict[str, Any]) -> bool:
         return False
 
 
+def _failed_result(error: str) -> ProofVerificationResult:
+    """Build an invalid verification result carrying an error."""
+    return ProofVerificationResult(
+        isValid=False,
+        isHighSeverity=False,
+        auditorId="",
+        timestamp=datetime.now(),
+        proofData={},
+        error=error
+    )
+
+
+def _proof_expires_at(proof_data: Dict[str, Any]) -> datetime:
+    """
+    When a proof expires, from its proof_timestamp.
+    
+    Args:
+        proof_data: Proof data from contract
+        
+    Returns:
+        datetime: Expiry time (MIDNIGHT_PROOF_EXPIRY_HOURS from now if the timestamp is unusable)
+    """
+    try:
+        proof_timestamp = _parse_proof_timestamp(proof_data["proof_timestamp"])
+    except (KeyError, ValueError):
+        proof_timestamp = datetime.now()
+    return proof_timestamp + timedelta(hours=MIDNIGHT_PROOF_EXPIRY_HOURS)
+
+
+def _parse_proof_timestamp(value: Any) -> datetime:
+    """
+    Parse a proof_timestamp into naive local time.
+    
+    Ledger block timestamps carry a UTC offset while simulated proofs use naive
+    local time; both are compared against datetime.now().
+    
+    Args:
+        value: ISO 8601 timestamp
+        
+    Returns:
+        datetime: Naive local time
+    """
+    proof_timestamp = datetime.fromisoformat(str(value))
+    if proof_timestamp.tzinfo is not None:
+        proof_timestamp = proof_timestamp.astimezone().replace(tzinfo=None)
+    return proof_timestamp
+
+
 def _is_proof_expired(proof_timestamp: datetime) -> bool:
     """
     Check if proof has expired based on timestamp.
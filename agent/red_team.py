@@ -13,8 +13,12 @@ from uagents_core.utils.registration import (  # pyright: ignore[reportMissingIm
 )
 import sys
 import os
+import time
+import uuid
+import asyncio
 import httpx  # pyright: ignore[reportMissingImports]
 from pathlib import Path
+from typing import List, Optional
 
 # Add agent directory to path for logger import
 sys.path.insert(0, str(Path(__file__).parent))
@@ -28,14 +32,46 @@ ASI_API_URL = os.getenv("ASI_API_URL", "https://api.asi.cloud/v1/chat/completion
 # AgentVerse API Configuration
 AGENTVERSE_KEY = os.getenv("AGENTVERSE_KEY", "")
 
+# In Judge digest mode the Target reports to the Judge, so attacks are not mirrored
+JUDGE_DIGEST_MODE = os.getenv("JUDGE_DIGEST_MODE", "false").lower() == "true"
+
+# Number of payloads carried per envelope (1 = classic one-message-per-attack mode)
+ATTACK_BATCH_SIZE = max(1, int(os.getenv("ATTACK_BATCH_SIZE", "1")))
+
+# Attacks without a verdict after this many seconds are forgotten (same default as the Judge's correlation TTL)
+PENDING_ATTACK_TTL_SECONDS = float(os.getenv("RED_TEAM_PENDING_TTL", os.getenv("JUDGE_CORRELATION_TTL", "300")))
+
 
 class AttackMessage(Model):
     payload: str
+    attack_id: Optional[str] = None
 
 
 class ResponseMessage(Model):
     status: str
     message: str
+    attack_id: Optional[str] = None
+
+
+class BatchedAttack(Model):
+    attack_id: str
+    payload: str
+
+
+class AttackBatchMessage(Model):
+    batch_id: str
+    attacks: List[BatchedAttack]
+
+
+class BatchedVerdict(Model):
+    attack_id: str
+    status: str
+    message: str
+
+
+class ResponseBatchMessage(Model):
+    batch_id: str
+    verdicts: List[BatchedVerdict]
 
 
 async def generate_attack() -> str:
@@ -149,8 +185,27 @@ def create_red_team_agent(
         "max_attacks": 50,  # Limit to prevent infinite loops
         "known_exploits": set(),  # Set of known exploit strings from Unibase
         "last_payload": None,  # Track last sent payload to save on SUCCESS
+        "pending_attacks": {},  # attack_id -> (payload, sent_at) awaiting a verdict, oldest first
     }
 
+    def track_attack(attack_id: str, payload: str):
+        """Remember an attack until its verdict arrives; drop ones that never got an answer."""
+        now = time.monotonic()
+        pending = state["pending_attacks"]
+        while pending:
+            oldest = next(iter(pending))
+            if now - pending[oldest][1] <= PENDING_ATTACK_TTL_SECONDS:
+                break
+            del pending[oldest]
+        pending[attack_id] = (payload, now)
+
+    def take_attack(attack_id: Optional[str]) -> Optional[str]:
+        """Payload of the attack a verdict answers, or None if unknown or expired."""
+        entry = state["pending_attacks"].pop(attack_id, None) if attack_id else None
+        if entry is None or time.monotonic() - entry[1] > PENDING_ATTACK_TTL_SECONDS:
+            return None
+        return entry[0]
+
     @red_team.on_event("startup")
     async def introduce(ctx: Context):
         ctx.logger.info(f"Red Team Agent started: {red_team.address}")
@@ -199,16 +254,64 @@ def create_red_team_agent(
             log("Unibase", f"Error loading exploits: {str(e)}", "💾", "info")
             state["known_exploits"] = set()
 
+    async def record_success(ctx: Context, successful_payload: str):
+        """Save a payload that compromised the Target to Unibase (once)."""
+        ctx.logger.info("SUCCESS! Secret key found!")
+        log("RedTeam", "SUCCESS! Secret key found! Vulnerability exploited!", "🔴", "vulnerability", is_vulnerability=True)
+        
+        if successful_payload and successful_payload not in state["known_exploits"]:
+            try:
+                # Save exploit (will use Membase if enabled, otherwise file fallback)
+                # Pass None to auto-detect based on MEMBASE_ENABLED
+                await save_exploit(successful_payload, state["known_exploits"], use_mcp=None)
+            except Exception as e:
+                ctx.logger.warning(f"Failed to save exploit to Unibase: {str(e)}")
+                log("Unibase", f"Error saving exploit: {str(e)}", "💾", "info")
+        elif successful_payload in state["known_exploits"]:
+            log("Unibase", f"Exploit already known, skipping save: {successful_payload}", "💾", "info")
+        
+        state["attack_complete"] = True
+
+    async def send_attack_batch(ctx: Context):
+        """Generate up to ATTACK_BATCH_SIZE payloads and ship them in one envelope."""
+        batch_size = min(ATTACK_BATCH_SIZE, state["max_attacks"] - state["attack_count"])
+        payloads = await asyncio.gather(*(generate_attack() for _ in range(batch_size)))
+        
+        attacks = [BatchedAttack(attack_id=uuid.uuid4().hex, payload=payload) for payload in payloads]
+        for attack in attacks:
+            track_attack(attack.attack_id, attack.payload)
+        state["attack_count"] += len(attacks)
+        
+        batch = AttackBatchMessage(batch_id=uuid.uuid4().hex, attacks=attacks)
+        ctx.logger.info(f"Sending attack batch {batch.batch_id} with {len(attacks)} payloads")
+        log("RedTeam", f"Executing batch of {len(attacks)} vectors", "🔴", "attack")
+        
+        # Send batch to Target
+        await ctx.send(target_address, batch)
+        
+        # Also send to Judge for monitoring (if Judge address is provided)
+        if judge_address and not JUDGE_DIGEST_MODE:
+            try:
+                await ctx.send(judge_address, batch)
+            except Exception as e:
+                ctx.logger.debug(f"Could not send to Judge: {str(e)}")
+
     @red_team.on_interval(period=3.0)
     async def send_attack(ctx: Context):
         if state["attack_complete"] or state["attack_count"] >= state["max_attacks"]:
             return
 
+        if ATTACK_BATCH_SIZE > 1:
+            await send_attack_batch(ctx)
+            return
+
         # Generate attack using ASI.Cloud API
         payload = await generate_attack()
         
         # Track the payload we're sending so we can save it if it succeeds
+        attack = AttackMessage(payload=payload, attack_id=uuid.uuid4().hex)
         state["last_payload"] = payload
+        track_attack(attack.attack_id, payload)
         
         state["attack_count"] += 1
         ctx.logger.info(
@@ -217,15 +320,12 @@ def create_red_team_agent(
         log("RedTeam", f"Executing vector: '{payload}'", "🔴", "attack")
 
         # Send attack to Target
-        await ctx.send(
-            target_address,
-            AttackMessage(payload=payload),
-        )
+        await ctx.send(target_address, attack)
         
         # Also send to Judge for monitoring (if Judge address is provided)
-        if judge_address:
+        if judge_address and not JUDGE_DIGEST_MODE:
             try:
-                await ctx.send(judge_address, AttackMessage(payload=payload))
+                await ctx.send(judge_address, attack)
             except Exception as e:
                 ctx.logger.debug(f"Could not send to Judge: {str(e)}")
 
@@ -235,24 +335,12 @@ def create_red_team_agent(
         ctx.logger.info(f"Message: {msg.message}")
         log("RedTeam", f"Response received: {msg.status} - {msg.message}", "🔴", "info")
 
+        # Responses echo the attack ID; older Targets don't, so fall back to the last payload
+        payload = take_attack(msg.attack_id)
+        
         if msg.status == "SUCCESS":
-            ctx.logger.info("SUCCESS! Secret key found!")
-            log("RedTeam", "SUCCESS! Secret key found! Vulnerability exploited!", "🔴", "vulnerability", is_vulnerability=True)
-            
             # Save the successful exploit to Unibase
-            successful_payload = state.get("last_payload")
-            if successful_payload and successful_payload not in state["known_exploits"]:
-                try:
-                    # Save exploit (will use Membase if enabled, otherwise file fallback)
-                    # Pass None to auto-detect based on MEMBASE_ENABLED
-                    await save_exploit(successful_payload, state["known_exploits"], use_mcp=None)
-                except Exception as e:
-                    ctx.logger.warning(f"Failed to save exploit to Unibase: {str(e)}")
-                    log("Unibase", f"Error saving exploit: {str(e)}", "💾", "info")
-            elif successful_payload in state["known_exploits"]:
-                log("Unibase", f"Exploit already known, skipping save: {successful_payload}", "💾", "info")
-            
-            state["attack_complete"] = True
+            await record_success(ctx, payload or state.get("last_payload"))
         elif msg.status == "DENIED":
             ctx.logger.info("Attack denied, continuing...")
             log("RedTeam", f"Attack denied: {msg.message}. Continuing attack sequence...", "🔴", "info")
@@ -260,6 +348,23 @@ def create_red_team_agent(
             ctx.logger.warning(f"Unknown response status: {msg.status}")
             log("RedTeam", f"Unknown response status: {msg.status} - {msg.message}", "🔴", "info")
 
+    @red_team.on_message(model=ResponseBatchMessage)
+    async def handle_response_batch(ctx: Context, sender: str, msg: ResponseBatchMessage):
+        denied = 0
+        for verdict in msg.verdicts:
+            payload = take_attack(verdict.attack_id)
+            if verdict.status == "SUCCESS":
+                await record_success(ctx, payload)
+            elif verdict.status == "DENIED":
+                denied += 1
+            else:
+                log("RedTeam", f"Unknown response status: {verdict.status} - {verdict.message}", "🔴", "info")
+        
+        ctx.logger.info(f"Batch {msg.batch_id} answered: {len(msg.verdicts)} verdicts, {denied} denied")
+        log("RedTeam", f"Batch response received: {denied}/{len(msg.verdicts)} denied", "🔴", "info")
+
+    red_team.pending_attacks = state["pending_attacks"]
+
     return red_team
 
 
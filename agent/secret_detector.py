@@ -0,0 +1,199 @@
+"""
+Secret leak detection for the Judge Agent.
+Keeps a registry of secrets and canaries per target and compiles them into a single
+Aho-Corasick automaton, so every response is scanned in one linear pass no matter
+how many targets and secrets are registered.
+"""
+import os
+import sys
+import json
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+
+# Add agent directory to path for logger import
+sys.path.insert(0, str(Path(__file__).parent))
+from logger import log
+
+# Target key for secrets that count as a leak from any target
+ANY_TARGET = "*"
+
+# Optional JSON registry: {"<target_address or *>": ["secret", {"secret": "...", "label": "..."}]}
+JUDGE_SECRET_REGISTRY = os.getenv("JUDGE_SECRET_REGISTRY", "")
+
+
+@dataclass(frozen=True)
+class SecretMatch:
+    """A registered secret found in a response."""
+    target_address: str
+    label: str
+    start: int
+    end: int
+
+
+class SecretDetector:
+    """
+    Registry of per-target secrets compiled into a multi-pattern matcher.
+
+    The automaton is rebuilt lazily on the first scan after the registry
+    changes. Scanning costs O(len(text) + matches), independent of the
+    number of registered secrets.
+    """
+
+    def __init__(self):
+        # secret -> [(target_address, label)]; several targets may guard the same canary
+        self._owners: Dict[str, List[Tuple[str, str]]] = {}
+        self._dirty = True
+        self._goto: List[Dict[str, int]] = []
+        self._fail: List[int] = []
+        self._output: List[Optional[str]] = []  # secret ending exactly at this state
+        self._dict_link: List[int] = []  # nearest proper-suffix state with an output (-1 if none)
+
+    def __len__(self) -> int:
+        return sum(len(owners) for owners in self._owners.values())
+
+    def register(self, target_address: str, secret: str, label: Optional[str] = None) -> None:
+        """
+        Register a secret or canary guarded by a target.
+
+        Args:
+            target_address: Target agent address, or ANY_TARGET
+            secret: The secret string whose appearance in a response means a leak
+            label: Name to report instead of the secret itself (defaults to the secret)
+        """
+        if not secret:
+            raise ValueError("secret must be a non-empty string")
+        owner = (target_address, label or secret)
+        owners = self._owners.setdefault(secret, [])
+        if owner not in owners:
+            owners.append(owner)
+            self._dirty = True
+
+    def unregister(self, target_address: str, secret: str) -> None:
+        """Remove a secret from a target's registry."""
+        owners = self._owners.get(secret, [])
+        remaining = [owner for owner in owners if owner[0] != target_address]
+        if len(remaining) != len(owners):
+            if remaining:
+                self._owners[secret] = remaining
+            else:
+                del self._owners[secret]
+            self._dirty = True
+
+    def load_registry(self, path: str) -> int:
+        """
+        Load secrets from a JSON registry file.
+
+        Args:
+            path: Path to a {"target": ["secret" | {"secret", "label"}]} JSON file
+
+        Returns:
+            int: Number of secrets registered
+        """
+        with open(path, "r") as f:
+            data = json.load(f)
+
+        count = 0
+        for target_address, secrets in data.items():
+            for entry in secrets:
+                if isinstance(entry, dict):
+                    self.register(target_address, entry["secret"], entry.get("label"))
+                else:
+                    self.register(target_address, entry)
+                count += 1
+        return count
+
+    def scan(self, text: str, target_address: Optional[str] = None) -> List[SecretMatch]:
+        """
+        Find every registered secret leaked in a response, in one pass.
+
+        Args:
+            text: Response text to scan
+            target_address: If given, only report secrets guarded by this target
+                (or by ANY_TARGET)
+
+        Returns:
+            List[SecretMatch]: Leaks in order of their end position
+        """
+        if self._dirty:
+            self._compile()
+
+        matches: List[SecretMatch] = []
+        goto, fail, output, dict_link = self._goto, self._fail, self._output, self._dict_link
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            hit = state if output[state] is not None else dict_link[state]
+            while hit > 0:
+                secret = output[hit]
+                for owner_address, label in self._owners[secret]:
+                    if target_address is None or owner_address in (target_address, ANY_TARGET):
+                        matches.append(SecretMatch(owner_address, label, i - len(secret) + 1, i + 1))
+                hit = dict_link[hit]
+        return matches
+
+    def first_leak(self, text: str, target_address: Optional[str] = None) -> Optional[SecretMatch]:
+        """Convenience wrapper returning the first leak, or None."""
+        matches = self.scan(text, target_address)
+        return matches[0] if matches else None
+
+    def _compile(self) -> None:
+        """Build the goto/fail/dictionary-link tables from the registry."""
+        goto: List[Dict[str, int]] = [{}]
+        output: List[Optional[str]] = [None]
+        for secret in self._owners:
+            state = 0
+            for char in secret:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append(None)
+                state = next_state
+            output[state] = secret
+
+        fail = [0] * len(goto)
+        dict_link = [-1] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(char, 0)
+                suffix = fail[child]
+                dict_link[child] = suffix if output[suffix] is not None else dict_link[suffix]
+
+        self._goto, self._fail, self._output, self._dict_link = goto, fail, output, dict_link
+        self._dirty = False
+
+
+def create_detector(default_secret: Optional[str] = None) -> SecretDetector:
+    """
+    Build the Judge's detector from the default secret and JUDGE_SECRET_REGISTRY.
+
+    Args:
+        default_secret: Secret that counts as a leak from any target (e.g. TARGET_SECRET_KEY)
+
+    Returns:
+        SecretDetector: Detector ready to scan responses
+    """
+    detector = SecretDetector()
+    if default_secret:
+        detector.register(ANY_TARGET, default_secret, "SECRET_KEY")
+
+    if JUDGE_SECRET_REGISTRY:
+        try:
+            count = detector.load_registry(JUDGE_SECRET_REGISTRY)
+            log("Judge", f"Loaded {count} secrets/canaries from {JUDGE_SECRET_REGISTRY}", "⚖️", "info")
+        except Exception as e:
+            log("Judge", f"Error loading secret registry: {str(e)}", "⚖️", "info")
+
+    return detector
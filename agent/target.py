@@ -13,8 +13,12 @@ from uagents_core.utils.registration import (  # pyright: ignore[reportMissingIm
 )
 import sys
 import os
+import asyncio
+import hashlib
 import httpx  # pyright: ignore[reportMissingImports]
 from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
 
 # Add agent directory to path for logger import
 sys.path.insert(0, str(Path(__file__).parent))
@@ -27,14 +31,59 @@ ASI_API_URL = os.getenv("ASI_API_URL", "https://api.asi.cloud/v1/chat/completion
 # AgentVerse API Configuration
 AGENTVERSE_KEY = os.getenv("AGENTVERSE_KEY", "")
 
+# Judge digest mode: SUCCESS events go to the Judge immediately, DENIED traffic
+# is summarised in periodic digests instead of being mirrored message by message
+JUDGE_DIGEST_MODE = os.getenv("JUDGE_DIGEST_MODE", "false").lower() == "true"
+JUDGE_DIGEST_INTERVAL = float(os.getenv("JUDGE_DIGEST_INTERVAL", "30"))
+MAX_DIGEST_PAYLOAD_HASHES = 500
+
 
 class AttackMessage(Model):
     payload: str
+    attack_id: Optional[str] = None
 
 
 class ResponseMessage(Model):
     status: str
     message: str
+    attack_id: Optional[str] = None
+
+
+class BatchedAttack(Model):
+    attack_id: str
+    payload: str
+
+
+class AttackBatchMessage(Model):
+    batch_id: str
+    attacks: List[BatchedAttack]
+
+
+class BatchedVerdict(Model):
+    attack_id: str
+    status: str
+    message: str
+
+
+class ResponseBatchMessage(Model):
+    batch_id: str
+    verdicts: List[BatchedVerdict]
+
+
+class FindingEvent(Model):
+    red_team_address: str
+    attack_id: str
+    payload: str
+    status: str
+    message: str
+
+
+class TrafficDigest(Model):
+    period_start: str
+    period_end: str
+    denied_count: int
+    attackers: Dict[str, int]
+    payload_hashes: List[str]
 
 
 SECRET_KEY = "fetch_ai_2024"
@@ -119,6 +168,46 @@ Return JSON format: {{"attack_type": "string", "threat_level": "string", "defens
     }
 
 
+def evaluate_payload(payload: str, attack_id: Optional[str] = None) -> ResponseMessage:
+    """
+    Decide the Target's verdict for a single attack payload.
+    
+    Args:
+        payload: The attack payload to evaluate
+        attack_id: Correlation ID of the attack, echoed back in the response
+        
+    Returns:
+        ResponseMessage: SUCCESS (leaking SECRET_KEY) or DENIED
+    """
+    if payload == SECRET_KEY:
+        log("Target", f"Processing input... Vulnerability triggered! Leaking SECRET_KEY.", "🎯", "vulnerability", is_vulnerability=True)
+        return ResponseMessage(
+            status="SUCCESS",
+            message=f"Access Granted! Flag: {SECRET_KEY}",
+            attack_id=attack_id,
+        )
+
+    log("Target", f"Attack blocked: '{payload}'", "🎯", "info")
+    return ResponseMessage(
+        status="DENIED",
+        message="Access Denied",
+        attack_id=attack_id,
+    )
+
+
+def hash_payload(payload: str) -> str:
+    """
+    Short, stable fingerprint of a payload for traffic digests.
+    
+    Args:
+        payload: The attack payload
+        
+    Returns:
+        str: First 16 hex characters of the payload's SHA-256
+    """
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
 def create_target_agent(port: int = None, judge_address: str = None) -> Agent:
     # Get configuration from environment variables with sensible defaults
     agent_ip = os.getenv("TARGET_IP") or os.getenv("AGENT_IP", "localhost")
@@ -147,6 +236,36 @@ def create_target_agent(port: int = None, judge_address: str = None) -> Agent:
         log("Target", f"Chat Protocol inclusion failed (optional): {type(e).__name__}: {e}", "🎯", "info")
         # Agent will continue to function without chat protocol
 
+    digest = {
+        "period_start": datetime.now().isoformat(),
+        "denied_count": 0,
+        "attackers": {},  # red_team_address -> denied attacks this period
+        "payload_hashes": {},  # insertion-ordered set of payload hashes
+    }
+
+    def record_denied(sender: str, payload: str):
+        """Account a DENIED attack in the current digest period."""
+        digest["denied_count"] += 1
+        digest["attackers"][sender] = digest["attackers"].get(sender, 0) + 1
+        if len(digest["payload_hashes"]) < MAX_DIGEST_PAYLOAD_HASHES:
+            digest["payload_hashes"][hash_payload(payload)] = None
+
+    async def report_to_judge(ctx: Context, sender: str, attack_id: str, payload: str, response: ResponseMessage):
+        """Digest mode: forward findings to the Judge now, fold denials into the next digest."""
+        if response.status == "SUCCESS":
+            try:
+                await ctx.send(judge_address, FindingEvent(
+                    red_team_address=sender,
+                    attack_id=attack_id,
+                    payload=payload,
+                    status=response.status,
+                    message=response.message,
+                ))
+            except Exception as e:
+                ctx.logger.debug(f"Could not send to Judge: {str(e)}")
+        else:
+            record_denied(sender, payload)
+
     @target.on_event("startup")
     async def introduce(ctx: Context):
         ctx.logger.info(f"Target Agent started: {target.address}")
@@ -192,31 +311,89 @@ def create_target_agent(port: int = None, judge_address: str = None) -> Agent:
         log("Target", f"ASI Analysis: {attack_type} detected (Threat: {threat_level})", "🧠", "info")
         log("Target", f"Defensive recommendation: {recommendation}", "🧠", "info")
 
-        if msg.payload == SECRET_KEY:
-            response = ResponseMessage(
-                status="SUCCESS",
-                message=f"Access Granted! Flag: {SECRET_KEY}",
-            )
+        response = evaluate_payload(msg.payload, msg.attack_id)
+        if response.status == "SUCCESS":
             ctx.logger.info("SECRET_KEY COMPROMISED!")
-            log("Target", f"Processing input... Vulnerability triggered! Leaking SECRET_KEY.", "🎯", "vulnerability", is_vulnerability=True)
         else:
-            response = ResponseMessage(
-                status="DENIED",
-                message="Access Denied",
-            )
             ctx.logger.info("Attack blocked")
-            log("Target", f"Attack blocked: '{msg.payload}'", "🎯", "info")
 
         # Send response to Red Team (original sender)
         await ctx.send(sender, response)
         
         # Also send to Judge for monitoring (if Judge address is provided)
-        if judge_address:
+        if judge_address and JUDGE_DIGEST_MODE:
+            await report_to_judge(ctx, sender, msg.attack_id or "", msg.payload, response)
+        elif judge_address:
             try:
                 await ctx.send(judge_address, response)
             except Exception as e:
                 ctx.logger.debug(f"Could not send to Judge: {str(e)}")
 
+    @target.on_message(model=AttackBatchMessage)
+    async def handle_attack_batch(ctx: Context, sender: str, msg: AttackBatchMessage):
+        """
+        Process a batch of attacks in one pass and answer with a single ResponseBatchMessage.
+        """
+        ctx.logger.info(f"Received attack batch {msg.batch_id} from {sender}: {len(msg.attacks)} payloads")
+        log("Target", f"Processing batch of {len(msg.attacks)} inputs...", "🎯", "info")
+
+        # Classify all payloads concurrently instead of one ASI round-trip after another
+        analyses = await asyncio.gather(
+            *(analyze_attack_with_asi(attack.payload) for attack in msg.attacks)
+        )
+
+        verdicts = []
+        for attack, attack_analysis in zip(msg.attacks, analyses):
+            attack_type = attack_analysis.get("attack_type", "Unknown")
+            threat_level = attack_analysis.get("threat_level", "MEDIUM")
+            log("Target", f"ASI Analysis: {attack_type} detected (Threat: {threat_level})", "🧠", "info")
+
+            response = evaluate_payload(attack.payload, attack.attack_id)
+            if response.status == "SUCCESS":
+                ctx.logger.info("SECRET_KEY COMPROMISED!")
+            if judge_address and JUDGE_DIGEST_MODE:
+                await report_to_judge(ctx, sender, attack.attack_id, attack.payload, response)
+            verdicts.append(BatchedVerdict(
+                attack_id=attack.attack_id,
+                status=response.status,
+                message=response.message,
+            ))
+
+        batch_response = ResponseBatchMessage(batch_id=msg.batch_id, verdicts=verdicts)
+
+        # Send response to Red Team (original sender)
+        await ctx.send(sender, batch_response)
+
+        # Also send to Judge for monitoring (if Judge address is provided)
+        if judge_address and not JUDGE_DIGEST_MODE:
+            try:
+                await ctx.send(judge_address, batch_response)
+            except Exception as e:
+                ctx.logger.debug(f"Could not send to Judge: {str(e)}")
+
+    if judge_address and JUDGE_DIGEST_MODE:
+        @target.on_interval(period=JUDGE_DIGEST_INTERVAL)
+        async def send_traffic_digest(ctx: Context):
+            """Flush the DENIED-traffic digest of the elapsed period to the Judge."""
+            period_end = datetime.now().isoformat()
+            if digest["denied_count"]:
+                traffic_digest = TrafficDigest(
+                    period_start=digest["period_start"],
+                    period_end=period_end,
+                    denied_count=digest["denied_count"],
+                    attackers=dict(digest["attackers"]),
+                    payload_hashes=list(digest["payload_hashes"]),
+                )
+                try:
+                    await ctx.send(judge_address, traffic_digest)
+                except Exception as e:
+                    ctx.logger.debug(f"Could not send digest to Judge: {str(e)}")
+            
+            digest["period_start"] = period_end
+            digest["denied_count"] = 0
+            digest["attackers"] = {}
+            digest["payload_hashes"] = {}
+
     return target
 
 
@@ -4,6 +4,7 @@ Tests all verification methods with edge cases.
 """
 import pytest
 import asyncio
+import time
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch, MagicMock
 import sys
@@ -15,12 +16,15 @@ sys.path.insert(0, str(Path(__file__).parent))
 from proof_verifier import (
     verify_audit_proof,
     batch_verify,
+    verify_stream,
     get_verification_proof,
     ProofVerificationResult,
     _fetch_proof_from_contract,
     _verify_zk_proof,
     _is_proof_expired,
-    _simulate_proof_fetch
+    _simulate_proof_fetch,
+    proof_cache,
+    ProofCache
 )
 
 
@@ -28,6 +32,14 @@ from proof_verifier import (
 # Test Fixtures
 # ============================================================================
 
+@pytest.fixture(autouse=True)
+def clear_proof_cache():
+    """Start every test with an empty proof cache."""
+    proof_cache.clear()
+    yield
+    proof_cache.clear()
+
+
 @pytest.fixture
 def sample_proof_id():
     """Sample proof ID for testing."""
@@ -526,6 +538,175 @@ def test_proof_verification_result_with_error():
     assert result_dict["error"] == "Test error"
 
 
+# ============================================================================
+# Test Batched Fetching
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_batch_fetch_chunks_requests():
+    """Proof data is fetched in chunks with bounded concurrency."""
+    import proof_verifier
+    
+    in_flight = 0
+    max_in_flight = 0
+    chunk_sizes = []
+    
+    async def fake_chunk(chunk):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        chunk_sizes.append(len(chunk))
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {pid: _simulate_proof_fetch(pid) for pid in chunk}
+    
+    proof_ids = [f"audit_{i}" for i in range(250)]
+    with patch.object(proof_verifier, "MIDNIGHT_VERIFY_BATCH_SIZE", 100), \
+         patch.object(proof_verifier, "MIDNIGHT_VERIFY_MAX_CONCURRENCY", 2), \
+         patch("proof_verifier._fetch_proof_chunk", side_effect=fake_chunk), \
+         patch("proof_verifier._fetch_proof_from_contract") as mock_fetch:
+        results = await batch_verify(proof_ids)
+    
+    assert chunk_sizes == [100, 100, 50]
+    assert max_in_flight <= 2
+    assert [r.proofData["audit_id"] for r in results] == proof_ids
+    mock_fetch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_fetch_failed_chunk_falls_back(sample_proof_data):
+    """Proofs from a failed chunk are fetched individually."""
+    with patch("proof_verifier._fetch_proof_chunk", side_effect=Exception("bridge down")), \
+         patch("proof_verifier._fetch_proof_from_contract", return_value=sample_proof_data) as mock_fetch:
+        results = await batch_verify(["a", "b"])
+    
+    assert mock_fetch.call_count == 2
+    assert len(results) == 2
+
+
+# ============================================================================
+# Test Streaming Verification
+# ============================================================================
+
+def _result_after(delays, sample_proof_data):
+    """verify_audit_proof stand-in that takes delays[proof_id] seconds."""
+    async def verify(proof_id, *args):
+        await asyncio.sleep(delays[proof_id])
+        return ProofVerificationResult(
+            isValid=True,
+            isHighSeverity=True,
+            auditorId="auditor1",
+            timestamp=datetime.now(),
+            proofData=sample_proof_data
+        )
+    return verify
+
+
+@pytest.mark.asyncio
+async def test_verify_stream_yields_in_completion_order(sample_proof_data):
+    """Results are yielded as they complete, tagged with their input index."""
+    delays = {"slow": 0.2, "fast": 0.0, "medium": 0.1}
+    
+    with patch('proof_verifier.verify_audit_proof', side_effect=_result_after(delays, sample_proof_data)):
+        order = [index async for index, _ in verify_stream(["slow", "fast", "medium"])]
+    
+    assert order == [1, 2, 0]
+
+
+@pytest.mark.asyncio
+async def test_batch_verify_per_proof_deadline(sample_proof_data):
+    """A slow proof times out on its own deadline; the others keep their results."""
+    delays = {"proof1": 0.0, "stuck": 5.0, "proof3": 0.0}
+    
+    with patch('proof_verifier.verify_audit_proof', side_effect=_result_after(delays, sample_proof_data)):
+        results = await batch_verify(["proof1", "stuck", "proof3"], proof_timeout=0.2)
+    
+    assert results[0].isValid and results[2].isValid
+    assert not results[1].isValid
+    assert results[1].error == "Proof verification timeout"
+
+
+@pytest.mark.asyncio
+async def test_verify_stream_budget_returns_partial_results(sample_proof_data):
+    """When the batch budget runs out, finished results stand and the rest time out."""
+    delays = {"proof1": 0.0, "proof2": 0.05, "stuck": 5.0}
+    
+    with patch('proof_verifier.verify_audit_proof', side_effect=_result_after(delays, sample_proof_data)):
+        started = time.time()
+        results = {i: r async for i, r in verify_stream(["proof1", "proof2", "stuck"], total_timeout=0.3)}
+        elapsed = time.time() - started
+    
+    assert elapsed < 1.0
+    assert results[0].isValid and results[1].isValid
+    assert results[2].error == "Batch verification timeout"
+
+
+# ============================================================================
+# Test Proof Cache
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_repeated_verification_served_from_cache(sample_proof_id, sample_proof_data):
+    """A proof is fetched once and served from the cache afterwards."""
+    with patch('proof_verifier._fetch_proof_from_contract', new_callable=AsyncMock) as mock_fetch:
+        mock_fetch.return_value = sample_proof_data
+        
+        first = await verify_audit_proof(sample_proof_id)
+        second = await verify_audit_proof(sample_proof_id)
+        exported = await get_verification_proof(sample_proof_id)
+        
+        assert mock_fetch.call_count == 1
+        assert first.proofData == second.proofData
+        assert exported is not None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_fetch(sample_proof_id, sample_proof_data):
+    """Concurrent lookups for the same ID are coalesced into a single fetch."""
+    async def slow_fetch(proof_id):
+        await asyncio.sleep(0.05)
+        return sample_proof_data
+    
+    with patch('proof_verifier._fetch_proof_from_contract', side_effect=slow_fetch) as mock_fetch:
+        results = await asyncio.gather(*(verify_audit_proof(sample_proof_id) for _ in range(10)))
+    
+    assert mock_fetch.call_count == 1
+    assert all(r.proofData == sample_proof_data for r in results)
+
+
+@pytest.mark.asyncio
+async def test_missing_proofs_are_not_cached(sample_proof_id):
+    """A proof that is not found yet is looked up again next time."""
+    with patch('proof_verifier._fetch_proof_from_contract', new_callable=AsyncMock) as mock_fetch:
+        mock_fetch.return_value = None
+        
+        await verify_audit_proof(sample_proof_id)
+        await verify_audit_proof(sample_proof_id)
+        
+        assert mock_fetch.call_count == 2
+
+
+def test_proof_cache_expiry_and_lru(sample_proof_data, expired_proof_data):
+    """Entries expire with the proof and are bounded by LRU size."""
+    cache = ProofCache(max_entries=2)
+    
+    cache.put("expired", expired_proof_data)
+    assert cache.get("expired") is None
+    
+    cache.put("a", sample_proof_data)
+    cache.put("b", sample_proof_data)
+    cache.get("a")  # "b" is now least recently used
+    cache.put("c", sample_proof_data)
+    
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    
+    with patch('proof_verifier.MIDNIGHT_PROOF_EXPIRY_HOURS', 0):
+        cache.put("d", sample_proof_data)
+    assert cache.get("d") is None
+
+
 # ============================================================================
 # Run Tests
 # ============================================================================
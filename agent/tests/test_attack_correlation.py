@@ -0,0 +1,65 @@
+"""
+Tests for the Judge's attack-response correlation table.
+"""
+import pytest
+import time
+import sys
+from pathlib import Path
+
+# Add agent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from judge import AttackCorrelationTable
+
+
+def test_resolve_by_attack_id():
+    """Concurrent Red Teams are attributed by attack ID, not by arrival order."""
+    table = AttackCorrelationTable(ttl_seconds=60, max_entries=100)
+    table.record("a1", "red_team_1", "admin")
+    table.record("a2", "red_team_2", "fetch_ai_2024")
+    table.record("a3", "red_team_3", "root")
+    
+    assert table.resolve("a2") == ("red_team_2", "fetch_ai_2024")
+    assert table.resolve("a2") is None  # Consumed
+    assert len(table) == 2
+
+
+def test_latest_for_legacy_responses():
+    """Responses without an attack ID fall back to the most recent attack."""
+    table = AttackCorrelationTable(ttl_seconds=60, max_entries=100)
+    assert table.latest() is None
+    
+    table.record("a1", "red_team_1", "admin")
+    table.record("a2", "red_team_2", "root")
+    
+    assert table.latest() == ("red_team_2", "root")
+    assert len(table) == 2
+
+
+def test_ttl_eviction():
+    """Entries older than the TTL are dropped."""
+    table = AttackCorrelationTable(ttl_seconds=0.05, max_entries=100)
+    table.record("a1", "red_team_1", "admin")
+    time.sleep(0.1)
+    table.record("a2", "red_team_2", "root")
+    
+    assert table.resolve("a1") is None
+    assert table.resolve("a2") == ("red_team_2", "root")
+
+
+def test_memory_bound_evicts_oldest():
+    """The table never holds more than max_entries attacks."""
+    table = AttackCorrelationTable(ttl_seconds=60, max_entries=1000)
+    for i in range(5000):
+        table.record(f"a{i}", f"red_team_{i % 7}", f"payload_{i}")
+    
+    assert len(table) == 1000
+    assert table.resolve("a0") is None
+    assert table.resolve("a4999") == ("red_team_1", "payload_4999")
+
+
+def test_fallback_key_is_stable():
+    """Attacks without an ID are keyed by Red Team + payload hash."""
+    key = AttackCorrelationTable.fallback_key("red_team_1", "admin")
+    assert key == AttackCorrelationTable.fallback_key("red_team_1", "admin")
+    assert key != AttackCorrelationTable.fallback_key("red_team_2", "admin")
@@ -0,0 +1,163 @@
+"""
+Tests for the Judge's background finding pipeline.
+"""
+import pytest
+import asyncio
+import time
+import sys
+from pathlib import Path
+
+# Add agent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from finding_pipeline import Finding, FindingPipeline, FindingIdempotencyCache, normalize_exploit
+
+
+def make_stages(delay: float, events: list):
+    """Build stage callables that sleep for delay and record start/end events."""
+    def stage(name):
+        async def run(finding: Finding):
+            events.append((name, "start", time.monotonic()))
+            await asyncio.sleep(delay)
+            events.append((name, "end", time.monotonic()))
+            return {"risk_score": 95} if name == "analysis" else f"{name}_{finding.finding_id[:4]}"
+        return run
+    return stage("analysis"), stage("proof"), stage("bounty")
+
+
+@pytest.mark.asyncio
+async def test_submit_returns_immediately():
+    """Queuing a finding does not wait for analysis, proof or bounty."""
+    events = []
+    analyze, proof, bounty = make_stages(0.2, events)
+    pipeline = FindingPipeline(analyze, proof, bounty, workers=2, max_queue=10)
+    
+    start = time.monotonic()
+    finding = await pipeline.submit(Finding("red_team_1", "fetch_ai_2024", "Access Granted!"))
+    assert time.monotonic() - start < 0.05
+    
+    await pipeline.join()
+    await pipeline.stop()
+    
+    assert finding.analysis == {"risk_score": 95}
+    assert finding.results["proof"].startswith("proof_")
+    assert set(finding.stage_timings) >= {"queued", "analysis", "proof", "bounty", "total"}
+
+
+@pytest.mark.asyncio
+async def test_bounty_runs_concurrently_with_proof():
+    """By default the bounty does not wait for analysis and proof submission."""
+    events = []
+    analyze, proof, bounty = make_stages(0.1, events)
+    pipeline = FindingPipeline(analyze, proof, bounty, workers=1, bounty_after_proof=False)
+    
+    finding = await pipeline.submit(Finding("red_team_1", "fetch_ai_2024", "Access Granted!"))
+    await pipeline.join()
+    await pipeline.stop()
+    
+    bounty_end = next(t for name, kind, t in events if name == "bounty" and kind == "end")
+    proof_start = next(t for name, kind, t in events if name == "proof" and kind == "start")
+    assert bounty_end <= proof_start + 0.01
+    assert finding.stage_timings["total"] < 0.3
+
+
+@pytest.mark.asyncio
+async def test_bounty_after_proof_policy():
+    """With bounty_after_proof the bounty starts only once the proof is submitted."""
+    events = []
+    analyze, proof, bounty = make_stages(0.05, events)
+    pipeline = FindingPipeline(analyze, proof, bounty, workers=1, bounty_after_proof=True)
+    
+    await pipeline.submit(Finding("red_team_1", "fetch_ai_2024", "Access Granted!"))
+    await pipeline.join()
+    await pipeline.stop()
+    
+    order = [name for name, kind, _ in events if kind == "start"]
+    assert order == ["analysis", "proof", "bounty"]
+
+
+@pytest.mark.asyncio
+async def test_stage_failure_is_isolated():
+    """A failing stage is recorded without blocking the other stages."""
+    async def failing_proof(finding):
+        raise RuntimeError("Midnight API unavailable")
+    
+    events = []
+    analyze, _, bounty = make_stages(0.01, events)
+    pipeline = FindingPipeline(analyze, failing_proof, bounty, workers=1)
+    
+    finding = await pipeline.submit(Finding("red_team_1", "fetch_ai_2024", "Access Granted!"))
+    await pipeline.join()
+    await pipeline.stop()
+    
+    assert "Midnight API unavailable" in finding.errors["proof"]
+    assert finding.results["bounty"].startswith("bounty_")
+    stats = pipeline.stats()
+    assert stats["processed"] == 1
+    assert stats["failed"] == 1
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bounded_workers_throughput():
+    """Many findings are processed by a bounded worker pool."""
+    events = []
+    analyze, proof, bounty = make_stages(0.05, events)
+    pipeline = FindingPipeline(analyze, proof, bounty, workers=10, max_queue=100)
+    
+    start = time.monotonic()
+    for i in range(50):
+        await pipeline.submit(Finding(f"red_team_{i}", "fetch_ai_2024", "Access Granted!"))
+    await pipeline.join()
+    await pipeline.stop()
+    elapsed = time.monotonic() - start
+    
+    # 50 findings x 0.1s critical path / 10 workers ~= 0.5s (sequentially it would be 7.5s)
+    assert elapsed < 2.0
+    assert pipeline.stats()["processed"] == 50
+
+
+@pytest.mark.asyncio
+async def test_duplicate_finding_short_circuits():
+    """A replayed SUCCESS maps to the original finding without re-running any stage."""
+    calls = {"analysis": 0, "proof": 0, "bounty": 0}
+    
+    def counting(name):
+        async def run(finding):
+            calls[name] += 1
+            return f"{name}_result"
+        return run
+    
+    pipeline = FindingPipeline(
+        counting("analysis"), counting("proof"), counting("bounty"),
+        workers=2, idempotency=FindingIdempotencyCache(window_seconds=60),
+    )
+    
+    first = await pipeline.submit(Finding("red_team_1", "fetch_ai_2024", "Access Granted!", target_address="target_1"))
+    replay = await pipeline.submit(Finding("red_team_1", "  FETCH_AI_2024 ", "Access Granted!", target_address="target_1"))
+    await pipeline.join()
+    other_target = await pipeline.submit(Finding("red_team_1", "fetch_ai_2024", "Access Granted!", target_address="target_2"))
+    await pipeline.join()
+    await pipeline.stop()
+    
+    assert replay is first
+    assert other_target is not first
+    assert calls == {"analysis": 2, "proof": 2, "bounty": 2}
+    assert pipeline.stats()["duplicatesSkipped"] == 1
+
+
+def test_idempotency_window_expires():
+    """Outside the window the same exploit is processed again."""
+    cache = FindingIdempotencyCache(window_seconds=0.05)
+    finding = Finding("red_team_1", "fetch_ai_2024", "Access Granted!", target_address="target_1")
+    key = FindingIdempotencyCache.key_for(finding)
+    cache.put(key, finding)
+    
+    assert cache.get(key) is finding
+    time.sleep(0.1)
+    assert cache.get(key) is None
+
+
+def test_normalize_exploit():
+    """Whitespace and case differences do not create distinct findings."""
+    assert normalize_exploit("  ' OR  '1'='1 ") == normalize_exploit("' or '1'='1")
@@ -0,0 +1,185 @@
+"""
+Tests for the local AuditVerifier ledger mirror against the stand-in indexer.
+"""
+import pytest
+import asyncio
+import socket
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add agent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("websockets")
+import uvicorn
+
+import proof_verifier
+from ledger_mirror import LedgerMirror
+from local_indexer import LocalIndexer, create_app
+
+CONTRACT = "0xaudit_verifier"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+async def indexer():
+    """Run the stand-in indexer on a free local port."""
+    local_indexer = LocalIndexer()
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(
+        create_app(local_indexer), host="127.0.0.1", port=port, log_level="warning"
+    ))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    local_indexer.ws_url = f"ws://127.0.0.1:{port}/graphql/ws"
+    yield local_indexer
+    server.should_exit = True
+    await task
+
+
+async def _wait_for(condition, timeout: float = 5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out waiting for mirror"
+        await asyncio.sleep(0.01)
+
+
+async def test_mirror_replays_and_streams_changes(indexer, tmp_path):
+    """Existing audits are replayed and new ones stream in live."""
+    indexer.submit_audit("audit_a", "auditor_1")
+    mirror = LedgerMirror(CONTRACT, indexer.ws_url, str(tmp_path / "mirror.json"))
+    mirror.start()
+
+    await _wait_for(lambda: mirror.get("audit_a") is not None)
+    indexer.submit_audit("audit_b", "auditor_2")
+    await _wait_for(lambda: mirror.get("audit_b") is not None)
+    await mirror.stop()
+
+    record = mirror.get("audit_b")
+    assert record["is_verified"] is True
+    assert record["auditor_id"] == "auditor_2"
+    assert record["block_height"] == 2
+    assert mirror.last_block == 2
+
+
+async def test_mirror_resumes_from_disk(indexer, tmp_path):
+    """A restarted mirror loads its snapshot and resumes from the last block."""
+    path = str(tmp_path / "mirror.json")
+    for i in range(3):
+        indexer.submit_audit(f"audit_{i}", "auditor")
+
+    mirror = LedgerMirror(CONTRACT, indexer.ws_url, path)
+    mirror.start()
+    await _wait_for(lambda: mirror.last_block == 3 and mirror.get("audit_2") is not None)
+    await mirror.stop()
+
+    indexer.submit_audit("audit_3", "auditor")
+    restarted = LedgerMirror(CONTRACT, indexer.ws_url, path)
+    assert restarted.load() == 3
+    restarted.start()
+    await _wait_for(lambda: restarted.get("audit_3") is not None)
+    await restarted.stop()
+
+    assert indexer.subscriptions_from == [0, 3]
+    assert len(restarted) == 4
+
+
+async def test_proof_verifier_reads_from_mirror(indexer, tmp_path):
+    """Proof fetches are answered by the mirror without touching the bridge."""
+    indexer.submit_audit("audit_local", "auditor")
+    mirror = LedgerMirror(CONTRACT, indexer.ws_url, str(tmp_path / "mirror.json"))
+    mirror.start()
+    await _wait_for(lambda: mirror.get("audit_local") is not None)
+
+    with patch("proof_verifier.get_ledger_mirror", return_value=mirror), \
+         patch("proof_verifier._get_http_client") as mock_client:
+        proof_data = await proof_verifier._fetch_proof_from_contract("audit_local")
+    await mirror.stop()
+
+    assert proof_data["audit_id"] == "audit_local"
+    mock_client.assert_not_called()
+
+
+async def test_api_mirror_follows_change_feed(tmp_path):
+    """The API mirror pages through /api/ledger/changes and resumes from its cursor."""
+    import httpx
+    from ledger_mirror import ApiLedgerMirror
+
+    feed = [
+        {"block_height": 1, "audit_id": "audit_a", "proof_hash": "hash_a",
+         "is_verified": True, "auditor_id": "auditor_1"},
+        {"block_height": 2, "block_timestamp": "2025-10-09T08:53:20+00:00", "audit_id": "audit_b",
+         "proof_hash": "hash_b", "is_verified": True, "auditor_id": "auditor_2"},
+    ]
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.url.params))
+        start = int(request.url.params.get("cursor", 0))
+        page = feed[start:start + 1]
+        return httpx.Response(200, json={
+            "changes": page,
+            "next_cursor": str(start + len(page)),
+            "has_more": start + 1 < len(feed),
+            "synced_height": 2,
+        })
+
+    path = str(tmp_path / "mirror.json")
+    mirror = ApiLedgerMirror(CONTRACT, "http://midnight-api", path)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        assert await mirror.sync_once(client) == 2
+        mirror.save()
+
+        restarted = ApiLedgerMirror(CONTRACT, "http://midnight-api", path)
+        assert restarted.load() == 2
+        assert await restarted.sync_once(client) == 0
+
+    assert mirror.get("audit_b")["auditor_id"] == "auditor_2"
+    assert mirror.get("audit_b")["proof_timestamp"] == "2025-10-09T08:53:20+00:00"
+    assert mirror.last_block == 2
+    assert requests[-1]["cursor"] == "2"
+
+
+async def test_api_mirror_records_verify(tmp_path):
+    """Proofs served from the API mirror verify despite their UTC block timestamps."""
+    from datetime import datetime, timedelta, timezone
+    from ledger_mirror import ApiLedgerMirror
+
+    now = datetime.now(timezone.utc)
+    mirror = ApiLedgerMirror(CONTRACT, "http://midnight-api", str(tmp_path / "mirror.json"))
+    mirror.apply_change({"block_height": 1, "block_timestamp": now.isoformat(), "audit_id": "audit_fresh",
+                         "proof_hash": "abcd1234", "is_verified": True, "auditor_id": "auditor_1"})
+    stale = now - timedelta(hours=proof_verifier.MIDNIGHT_PROOF_EXPIRY_HOURS + 1)
+    mirror.apply_change({"block_height": 2, "block_timestamp": stale.isoformat(), "audit_id": "audit_stale",
+                         "proof_hash": "abcd5678", "is_verified": True, "auditor_id": "auditor_1"})
+
+    with patch("proof_verifier.get_ledger_mirror", return_value=mirror), \
+         patch("proof_verifier.proof_cache", proof_verifier.ProofCache()):
+        fresh = await proof_verifier.verify_audit_proof("audit_fresh", "auditor_1")
+        expired = await proof_verifier.verify_audit_proof("audit_stale")
+
+    assert fresh.isValid is True
+    assert fresh.error is None
+    assert expired.error == "Proof has expired"
+
+
+def test_mirror_withholds_partially_applied_audits(tmp_path):
+    """An audit is only served once its proofs, is_verified and auditor_id entries have all arrived."""
+    mirror = LedgerMirror(CONTRACT, "", str(tmp_path / "mirror.json"))
+    mirror.apply({"blockHeight": 1, "map": "proofs", "key": "audit_a", "value": "abcd"})
+    assert mirror.get("audit_a") is None
+    mirror.apply({"blockHeight": 1, "map": "is_verified", "key": "audit_a", "value": True})
+    assert mirror.get("audit_a") is None
+
+    mirror.apply({"blockHeight": 1, "map": "auditor_id", "key": "audit_a", "value": "auditor_1"})
+    record = mirror.get("audit_a")
+    assert record["proof_hash"] == "abcd"
+    assert record["is_verified"] is True
+    assert record["auditor_id"] == "auditor_1"
@@ -0,0 +1,88 @@
+"""
+Tests for the local Membase stand-in and the remote MultiMemory client.
+"""
+import pytest
+import asyncio
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add agent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import uvicorn
+
+import mcp_helper
+import unibase
+from local_membase import LocalMembase, FaultConfig, create_app
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def membase(tmp_path):
+    """Run the stand-in in a background thread (the Membase client is synchronous)."""
+    store = LocalMembase(str(tmp_path / "membase.db"))
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(
+        create_app(store), host="127.0.0.1", port=port, log_level="warning"
+    ))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    with patch("mcp_helper.MEMBASE_ENABLED", True), \
+         patch("mcp_helper.MEMBASE_URL", f"http://127.0.0.1:{port}"), \
+         patch("mcp_helper._membase_instance", None):
+        yield store
+    server.should_exit = True
+    thread.join()
+    store.close()
+
+
+async def test_exploits_round_trip_through_membase(membase, tmp_path):
+    """Exploits saved by unibase are read back from the stand-in and persist on disk."""
+    known = set()
+    assert await unibase.save_exploit("' OR 1=1 --", known, use_mcp=True)
+    assert await mcp_helper.save_mcp_message("BOUNTY: agent1 -> 10", conversation_id="bounties")
+
+    assert await unibase.get_known_exploits(use_mcp=True) == {"' OR 1=1 --"}
+    stored = membase.get_messages("0xguard_exploits")
+    assert stored[0]["metadata"] == {"source": "0xguard", "type": "exploit"}
+
+    reopened = LocalMembase(membase.path)
+    assert [m["content"] for m in reopened.get_messages("bounties")] == ["BOUNTY: agent1 -> 10"]
+    reopened.close()
+
+
+async def test_injected_failures_surface_as_unavailable(membase):
+    """A failing hub makes the helpers report failure, so callers fall back to files."""
+    membase.faults = FaultConfig(failure_rate=1.0)
+    assert await mcp_helper.save_mcp_message("EXPLOIT: x") is False
+    assert await mcp_helper.get_mcp_messages() == []
+    assert membase.stats()["injected_failures"] == 2
+
+
+async def test_slow_membase_does_not_block_event_loop(membase):
+    """Remote calls run off the event loop, so other tasks keep running meanwhile."""
+    membase.faults = FaultConfig(latency=0.3)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    assert await mcp_helper.save_mcp_message("EXPLOIT: slow")
+    task.cancel()
+
+    assert ticks >= 10
@@ -0,0 +1,89 @@
+"""
+Tests for the local Midnight API simulator.
+"""
+import pytest
+import asyncio
+import socket
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add agent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+import uvicorn
+
+import midnight_client
+from local_midnight import LocalMidnight, SimulatorConfig, create_app
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _request(audit_id: str, risk_score: int = 95) -> dict:
+    return {
+        "audit_id": audit_id,
+        "auditor_addr": "auditor",
+        "threshold": 90,
+        "witness": midnight_client.create_private_state("exploit", risk_score),
+    }
+
+
+@pytest.fixture
+async def api():
+    """Run the simulator with fast proofs and blocks on a free local port."""
+    midnight = LocalMidnight(SimulatorConfig(proof_latency=0.01, proof_jitter=0, block_time=0.05))
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(
+        create_app(midnight), host="127.0.0.1", port=port, log_level="warning"
+    ))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    yield midnight, f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    await task
+
+
+async def test_midnight_client_submits_to_simulator(api):
+    """midnight_client's submission path lands audits in the simulated ledger."""
+    midnight, url = api
+    with patch("midnight_client.MIDNIGHT_API_URL", url), \
+         patch("midnight_client.MIDNIGHT_JOB_POLL_SECONDS", 1.0):
+        tx_id = await midnight_client._send_submission(_request("audit_1"))
+        outcomes = await midnight_client._send_submissions([_request("audit_2"), _request("audit_3", 10)])
+        status = await midnight_client.verify_audit_status("audit_1")
+
+    assert tx_id and status["is_verified"] is True
+    assert isinstance(outcomes["audit_2"], str)
+    assert isinstance(outcomes["audit_3"], midnight_client.SubmissionError)
+    assert set(midnight.ledger["proofs"]) == {"audit_1", "audit_2"}
+
+    async with httpx.AsyncClient(base_url=url) as client:
+        changes = (await client.get("/api/ledger/changes", params={"since": 0})).json()
+        later = (await client.get("/api/ledger/changes", params={"cursor": changes["next_cursor"]})).json()
+    assert [change["audit_id"] for change in changes["changes"]] == ["audit_1", "audit_2"]
+    assert later["changes"] == []
+
+
+async def test_failure_injection_and_proof_contention():
+    """Injected failures fail the job, and proofs queue for the proof server slots."""
+    midnight = LocalMidnight(
+        SimulatorConfig(proof_latency=0.05, proof_jitter=0, proof_concurrency=1, block_time=0)
+    )
+    started = asyncio.get_running_loop().time()
+    results = await asyncio.gather(*(midnight.submit_audit(_request(f"audit_{i}")) for i in range(3)))
+    assert all(result["success"] for result in results)
+    assert asyncio.get_running_loop().time() - started >= 0.15
+    assert [result["block_height"] for result in results] == [1, 2, 3]
+
+    midnight.config.failure_rate = 1.0
+    job = midnight.submit_job("submit_audit", "audit_x", _request("audit_x"))
+    job = await midnight.wait_job(job["job_id"], 5)
+    assert job["status"] == "failed"
+    assert job["error"] == "Simulated proof server failure"
+    assert "audit_x" not in midnight.ledger["proofs"]
@@ -0,0 +1,335 @@
+"""
+Tests for the Judge, Target and Red Team message handlers (batched envelopes,
+attack correlation and Judge digest mode).
+"""
+import pytest
+import asyncio
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add agent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import judge
+import target
+import red_team
+from judge import (
+    AttackCorrelationTable,
+    AttackMessage,
+    ResponseMessage,
+    AttackBatchMessage,
+    ResponseBatchMessage,
+    BatchedAttack,
+    BatchedVerdict,
+    FindingEvent,
+    TrafficDigest,
+    SECRET_KEY,
+)
+
+TARGET = "agent1target"
+RED_TEAM = "agent1redteam"
+JUDGE = "agent1judge"
+
+
+class RecordingAgent:
+    """Stands in for uagents.Agent: keeps the registered handlers so tests can call them."""
+
+    def __init__(self, name: str, **kwargs):
+        self.name = name
+        self.address = f"agent1{name}"
+        self.message_handlers = {}
+        self.interval_handlers = []
+        self.query_handler = None
+
+    def include(self, protocol):
+        pass
+
+    def on_event(self, event):
+        return lambda handler: handler
+
+    def on_interval(self, period):
+        def register(handler):
+            self.interval_handlers.append(handler)
+            return handler
+        return register
+
+    def on_message(self, model):
+        def register(handler):
+            self.message_handlers[model] = handler
+            return handler
+        return register
+
+    def on_query(self, *args, **kwargs):
+        def register(handler):
+            self.query_handler = handler
+            return handler
+        return register
+
+
+def make_context() -> MagicMock:
+    ctx = MagicMock()
+    ctx.send = AsyncMock()
+    return ctx
+
+
+@pytest.fixture
+def bounties():
+    """Judge with the ASI, Midnight and Unibase stages replaced; yields (agent, bounty mock)."""
+    save_bounty = AsyncMock(return_value="tx_bounty")
+    with patch("judge.Agent", RecordingAgent), \
+         patch("judge.AttackCorrelationTable", lambda: AttackCorrelationTable(ttl_seconds=0.05)), \
+         patch("judge.analyze_vulnerability_with_asi", AsyncMock(return_value={"risk_score": 95})), \
+         patch("judge.submit_audit_proof", AsyncMock(return_value="zk_proof")), \
+         patch("judge.save_bounty_token", save_bounty):
+        yield judge.create_judge_agent(port=8999), save_bounty
+
+
+async def _drain(agent):
+    """Let queued findings run through analysis, proof and bounty."""
+    await agent.finding_pipeline.join()
+    await agent.finding_pipeline.stop(drain=True)
+
+
+async def test_expired_attack_id_is_held_without_bounty(bounties):
+    """A leak whose attack expired from the correlation table pays nobody."""
+    agent, save_bounty = bounties
+    ctx = make_context()
+    await agent.message_handlers[AttackMessage](ctx, RED_TEAM, AttackMessage(payload=SECRET_KEY, attack_id="a1"))
+    await asyncio.sleep(0.1)  # past the 0.05 s TTL
+
+    await agent.message_handlers[ResponseMessage](
+        ctx, TARGET, ResponseMessage(status="SUCCESS", message=f"Access granted: {SECRET_KEY}", attack_id="a1")
+    )
+    await _drain(agent)
+
+    save_bounty.assert_not_awaited()
+    held = (await agent.query_handler(ctx, {"method": "unattributedFindings"}))["findings"]
+    assert [(f["attack_id"], f["target_address"]) for f in held] == [("a1", TARGET)]
+
+
+async def test_batch_leaks_paid_only_to_known_attackers(bounties):
+    """In a batch, the correlated leak is paid to its Red Team and the unknown one is held."""
+    agent, save_bounty = bounties
+    ctx = make_context()
+    await agent.message_handlers[AttackBatchMessage](ctx, RED_TEAM, AttackBatchMessage(
+        batch_id="b1",
+        attacks=[BatchedAttack(attack_id="a1", payload=SECRET_KEY), BatchedAttack(attack_id="a2", payload="root")],
+    ))
+
+    await agent.message_handlers[ResponseBatchMessage](ctx, TARGET, ResponseBatchMessage(
+        batch_id="b1",
+        verdicts=[
+            BatchedVerdict(attack_id="a1", status="SUCCESS", message=f"Access granted: {SECRET_KEY}"),
+            BatchedVerdict(attack_id="a2", status="DENIED", message="Access denied"),
+            BatchedVerdict(attack_id="unknown", status="SUCCESS", message=f"Access granted: {SECRET_KEY}"),
+        ],
+    ))
+    await _drain(agent)
+
+    assert [call.kwargs["recipient_address"] for call in save_bounty.await_args_list] == [RED_TEAM]
+    held = (await agent.query_handler(ctx, {"method": "unattributedFindings"}))["findings"]
+    assert [f["attack_id"] for f in held] == ["unknown"]
+
+
+async def test_finding_event_pays_reported_red_team(bounties):
+    """Digest mode: a FindingEvent carries its own attribution; a non-leak is rejected."""
+    agent, save_bounty = bounties
+    ctx = make_context()
+    handler = agent.message_handlers[FindingEvent]
+    await handler(ctx, TARGET, FindingEvent(
+        red_team_address=RED_TEAM, attack_id="a1", payload=SECRET_KEY,
+        status="SUCCESS", message=f"Access granted: {SECRET_KEY}",
+    ))
+    await handler(ctx, TARGET, FindingEvent(
+        red_team_address="agent1other", attack_id="a2", payload="root",
+        status="SUCCESS", message="Welcome back",
+    ))
+    await _drain(agent)
+
+    assert [call.kwargs["recipient_address"] for call in save_bounty.await_args_list] == [RED_TEAM]
+
+
+async def test_traffic_digests_accumulate(bounties):
+    """TrafficDigest counts are folded into the Judge's traffic stats."""
+    agent, _ = bounties
+    ctx = make_context()
+    for period_end, attackers in (("t1", {RED_TEAM: 3}), ("t2", {RED_TEAM: 1, "agent1other": 2})):
+        await agent.message_handlers[TrafficDigest](ctx, TARGET, TrafficDigest(
+            period_start="t0", period_end=period_end, denied_count=sum(attackers.values()),
+            attackers=attackers, payload_hashes=["h1"],
+        ))
+
+    stats = await agent.query_handler(ctx, {"method": "trafficStats"})
+    assert stats["digests_received"] == 2
+    assert stats["denied_attacks"] == 6
+    assert stats["attackers"] == {RED_TEAM: 4, "agent1other": 2}
+    assert stats["last_period_end"] == "t2"
+
+
+@contextmanager
+def _verified_proofs(total_timeout: float):
+    """Serve valid proofs for audit IDs p0, p1, ... in order and shorten the batchVerify budget."""
+    from datetime import datetime
+    import proof_verifier
+
+    async def fake_chunk(chunk):
+        await asyncio.sleep(0.01 * int(chunk[0][1:]))  # proofs finish one after another
+        return {pid: {"audit_id": pid, "is_verified": True, "auditor_id": "auditor", "proof_hash": "abcd",
+                      "proof_timestamp": datetime.now().isoformat()} for pid in chunk}
+
+    def stream(proof_ids, auditor_id):
+        return proof_verifier.verify_stream(proof_ids, auditor_id, total_timeout=total_timeout)
+
+    with patch("proof_verifier._fetch_proof_chunk", side_effect=fake_chunk), \
+         patch("proof_verifier.MIDNIGHT_VERIFY_BATCH_SIZE", 1), \
+         patch("proof_verifier.proof_cache", proof_verifier.ProofCache()), \
+         patch("judge.verify_stream", stream):
+        yield
+
+
+async def test_batch_verify_pages_resumed_after_budget_keep_results(bounties):
+    """Proofs that finished while the caller was between pages are not reported as timeouts."""
+    agent, _ = bounties
+    ctx = make_context()
+    proof_ids = [f"p{i}" for i in range(6)]
+    with _verified_proofs(total_timeout=0.2):
+        first = await agent.query_handler(ctx, {"method": "batchVerify", "proofIds": proof_ids, "pageSize": 2})
+        await asyncio.sleep(0.3)
+        second = await agent.query_handler(ctx, {"method": "batchVerify", "cursor": first["cursor"], "pageSize": 10})
+
+    assert len(first["results"]) == 2 and not first["done"]
+    assert second["done"]
+    results = first["results"] + second["results"]
+    assert sorted(r["proofId"] for r in results) == proof_ids
+    assert all(r["isValid"] and r["error"] is None for r in results)
+
+
+def test_page_size_parsed_defensively():
+    """Unusable pageSize values fall back to the default and huge ones are clamped."""
+    assert judge.parse_page_size("abc") == judge.VERIFY_PAGE_SIZE_DEFAULT
+    assert judge.parse_page_size(None) == judge.VERIFY_PAGE_SIZE_DEFAULT
+    assert judge.parse_page_size("20") == 20
+    assert judge.parse_page_size(0) == 1
+    assert judge.parse_page_size(10 ** 9) == judge.VERIFY_PAGE_SIZE_MAX
+
+
+async def test_batch_verify_accepts_non_numeric_page_size(bounties):
+    """A malformed pageSize still returns a page instead of raising out of the handler."""
+    agent, _ = bounties
+    with _verified_proofs(total_timeout=5.0):
+        page = await agent.query_handler(make_context(), {"method": "batchVerify", "proofIds": ["p0", "p1"], "pageSize": "lots"})
+    assert page["done"]
+    assert len(page["results"]) == 2
+
+
+@contextmanager
+def _target(digest_mode: bool):
+    """Target with ASI analysis replaced, in or out of Judge digest mode."""
+    with patch("target.Agent", RecordingAgent), \
+         patch("target.JUDGE_DIGEST_MODE", digest_mode), \
+         patch("target.analyze_attack_with_asi", AsyncMock(return_value={"attack_type": "Brute force"})):
+        yield target.create_target_agent(port=8998, judge_address=JUDGE)
+
+
+def _attack_batch() -> target.AttackBatchMessage:
+    return target.AttackBatchMessage(batch_id="b1", attacks=[
+        target.BatchedAttack(attack_id="a1", payload="admin"),
+        target.BatchedAttack(attack_id="a2", payload=target.SECRET_KEY),
+        target.BatchedAttack(attack_id="a3", payload="root"),
+    ])
+
+
+def _sent(ctx, to: str) -> list:
+    return [call.args[1] for call in ctx.send.await_args_list if call.args[0] == to]
+
+
+async def test_target_answers_batch_and_mirrors_it_to_judge():
+    """One ResponseBatchMessage answers the whole batch, to the Red Team and the Judge."""
+    ctx = make_context()
+    with _target(digest_mode=False) as agent:
+        await agent.message_handlers[target.AttackBatchMessage](ctx, RED_TEAM, _attack_batch())
+
+    [response] = _sent(ctx, RED_TEAM)
+    assert [(v.attack_id, v.status) for v in response.verdicts] == [
+        ("a1", "DENIED"), ("a2", "SUCCESS"), ("a3", "DENIED"),
+    ]
+    assert _sent(ctx, JUDGE) == [response]
+
+
+async def test_target_digest_mode_reports_findings_and_digests_denials():
+    """Digest mode sends SUCCESS as a FindingEvent at once and DENIED traffic as one digest."""
+    ctx = make_context()
+    with _target(digest_mode=True) as agent:
+        await agent.message_handlers[target.AttackBatchMessage](ctx, RED_TEAM, _attack_batch())
+        [send_digest] = agent.interval_handlers
+    assert _sent(ctx, RED_TEAM)[0].batch_id == "b1"
+
+    [finding] = _sent(ctx, JUDGE)
+    assert isinstance(finding, target.FindingEvent)
+    assert (finding.red_team_address, finding.attack_id) == (RED_TEAM, "a2")
+
+    await send_digest(ctx)
+    digest = _sent(ctx, JUDGE)[-1]
+    assert isinstance(digest, target.TrafficDigest)
+    assert digest.denied_count == 2
+    assert digest.attackers == {RED_TEAM: 2}
+    assert len(digest.payload_hashes) == 2
+
+    await send_digest(ctx)  # Nothing denied since: no empty digest
+    assert len(_sent(ctx, JUDGE)) == 2
+
+
+@contextmanager
+def _red_team(generate_attack: AsyncMock):
+    """Red Team sending batches of three generated payloads, mirrored to the Judge."""
+    with patch("red_team.Agent", RecordingAgent), \
+         patch("red_team.ATTACK_BATCH_SIZE", 3), \
+         patch("red_team.JUDGE_DIGEST_MODE", False), \
+         patch("red_team.generate_attack", generate_attack):
+        yield red_team.create_red_team_agent(TARGET, port=8997, judge_address=JUDGE)
+
+
+async def test_red_team_batch_verdicts_resolve_pending_attacks():
+    """A batch goes to Target and Judge; its verdicts clear the pending attacks and save the exploit."""
+    ctx = make_context()
+    save_exploit = AsyncMock()
+    with _red_team(AsyncMock(side_effect=["admin", SECRET_KEY, "root"])) as agent:
+        [send_attack] = agent.interval_handlers
+        await send_attack(ctx)
+
+    [batch] = _sent(ctx, TARGET)
+    assert _sent(ctx, JUDGE) == [batch]
+    assert len(agent.pending_attacks) == 3
+
+    verdicts = [
+        red_team.BatchedVerdict(
+            attack_id=attack.attack_id,
+            status="SUCCESS" if attack.payload == SECRET_KEY else "DENIED",
+            message="",
+        )
+        for attack in batch.attacks
+    ]
+    with patch("red_team.save_exploit", save_exploit):
+        await agent.message_handlers[red_team.ResponseBatchMessage](
+            ctx, TARGET, red_team.ResponseBatchMessage(batch_id=batch.batch_id, verdicts=verdicts)
+        )
+
+    assert agent.pending_attacks == {}
+    assert save_exploit.await_args.args[0] == SECRET_KEY
+
+
+async def test_red_team_forgets_unanswered_attacks():
+    """Attacks that never get a verdict are pruned after the pending TTL."""
+    ctx = make_context()
+    with _red_team(AsyncMock(return_value="admin")) as agent, \
+         patch("red_team.PENDING_ATTACK_TTL_SECONDS", 0.05):
+        [send_attack] = agent.interval_handlers
+        await send_attack(ctx)
+        first = set(agent.pending_attacks)
+        await asyncio.sleep(0.1)
+        await send_attack(ctx)
+
+    assert len(agent.pending_attacks) == 3
+    assert first.isdisjoint(agent.pending_attacks)
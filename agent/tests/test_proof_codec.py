@@ -0,0 +1,92 @@
+"""
+Tests for the compact binary proof export format.
+"""
+import pytest
+import json
+import hashlib
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+# Add agent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from proof_codec import ProofChecksumError, encode_proof, decode_proof, frame_record, unframe_record
+from proof_verifier import export_proofs, load_proofs, get_verification_proof, proof_cache
+
+
+def _proof(i: int) -> dict:
+    return {
+        "audit_id": hashlib.sha256(f"audit{i}".encode()).hexdigest(),
+        "is_verified": True,
+        "auditor_id": "agent1q" + "x" * 58,
+        "proof_hash": hashlib.sha256(f"proof{i}".encode()).hexdigest(),
+        "proof_timestamp": datetime(2025, 1, 2, 3, 4, 5, 678901).isoformat(),
+        "block_height": 1000 + i,
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_proof_cache():
+    proof_cache.clear()
+    yield
+    proof_cache.clear()
+
+
+def test_round_trip_preserves_fields():
+    """Hex IDs, free-form IDs, timestamps and block heights survive encoding."""
+    proof = _proof(1)
+    assert decode_proof(encode_proof(proof)) == proof
+
+    loose = {"audit_id": "test_audit_id", "is_verified": False, "auditor_id": "", "proof_hash": "zk_abc"}
+    assert decode_proof(encode_proof(loose)) == loose
+
+
+def test_compact_is_smaller_than_hex_json():
+    """The compact record is a fraction of the hex-encoded JSON export."""
+    proof = _proof(1)
+    compact = frame_record(encode_proof(proof))
+    hex_json = json.dumps(proof, indent=2).encode().hex()
+    assert len(compact) * 4 < len(hex_json)
+
+
+def test_unframe_detects_corruption():
+    """A flipped byte fails the record checksum."""
+    record = bytearray(frame_record(encode_proof(_proof(1))))
+    assert unframe_record(bytes(record)) == _proof(1)
+    record[10] ^= 0xFF
+    with pytest.raises(ProofChecksumError):
+        unframe_record(bytes(record))
+
+
+async def test_bulk_export_and_load(tmp_path):
+    """Bulk export writes every found proof; the loader verifies each record."""
+    proofs = {p["audit_id"]: p for p in (_proof(i) for i in range(250))}
+
+    async def fake_chunk(chunk):
+        return {pid: proofs.get(pid, {}) for pid in chunk}
+
+    path = str(tmp_path / "proofs.bin")
+    with patch("proof_verifier._fetch_proof_chunk", side_effect=fake_chunk):
+        written = await export_proofs(list(proofs) + ["missing"], path)
+
+    assert written == 250
+    loaded = load_proofs(path)
+    assert sorted(p["audit_id"] for p in loaded) == sorted(proofs)
+    assert all(p == proofs[p["audit_id"]] for p in loaded)
+
+    data = bytearray(Path(path).read_bytes())
+    data[20] ^= 0xFF  # inside the first record body
+    Path(path).write_bytes(bytes(data))
+    with pytest.raises(ProofChecksumError):
+        load_proofs(path)
+    assert len(load_proofs(path, skip_corrupt=True)) == 249
+
+
+async def test_get_verification_proof_compact():
+    """The compact single-proof export decodes back to the proof data."""
+    proof = _proof(7)
+    with patch("proof_verifier._fetch_proof_from_contract", return_value=proof):
+        exported = await get_verification_proof(proof["audit_id"], "compact")
+    assert unframe_record(bytes.fromhex(exported)) == proof
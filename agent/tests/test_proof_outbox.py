@@ -0,0 +1,165 @@
+"""
+Tests for the durable Midnight proof submission outbox.
+"""
+import pytest
+import asyncio
+import sys
+from pathlib import Path
+
+# Add agent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from proof_outbox import ProofOutbox, SubmissionError, STATUS_PENDING, STATUS_SUBMITTED, STATUS_FAILED
+from midnight_client import ProofScheduler
+
+
+class FlakyApi:
+    """Submit function that is unreachable for the first `down_for` calls."""
+
+    def __init__(self, down_for: int = 0, reject: bool = False):
+        self.down_for = down_for
+        self.reject = reject
+        self.calls = []
+
+    async def __call__(self, request):
+        self.calls.append(request["audit_id"])
+        if self.reject:
+            raise SubmissionError("risk_score < threshold", retryable=False)
+        if len(self.calls) <= self.down_for:
+            raise SubmissionError("Midnight API unavailable (ConnectError)")
+        return f"tx_{request['audit_id']}"
+
+
+def _outbox(tmp_path, api, **kwargs) -> ProofOutbox:
+    kwargs.setdefault("retry_base", 0.01)
+    return ProofOutbox(api, path=str(tmp_path / "outbox.db"), flush_interval=0.05, **kwargs)
+
+
+async def test_submission_retries_until_api_reachable(tmp_path):
+    """Connectivity failures are retried with backoff until the proof lands."""
+    api = FlakyApi(down_for=2)
+    outbox = _outbox(tmp_path, api)
+    landed = {}
+    outbox.add_listener(lambda audit_id, proof_hash: landed.update({audit_id: proof_hash}))
+
+    outbox.enqueue("audit_1", {"audit_id": "audit_1"})
+    outbox.start()
+    assert await outbox.wait_for_attempt("audit_1", 1.0) is None  # first attempt fails
+
+    for _ in range(100):
+        if outbox.status("audit_1")["status"] == STATUS_SUBMITTED:
+            break
+        await asyncio.sleep(0.01)
+    await outbox.stop()
+
+    status = outbox.status("audit_1")
+    assert status["status"] == STATUS_SUBMITTED
+    assert status["attempts"] == 3
+    assert landed == {"audit_1": "tx_audit_1"}
+
+
+async def test_pending_submissions_survive_restart(tmp_path):
+    """Submissions queued while the API is down are sent by the next process."""
+    down = _outbox(tmp_path, FlakyApi(down_for=1000), retry_base=0)
+    down.enqueue("audit_1", {"audit_id": "audit_1"})
+    down.enqueue("audit_1", {"audit_id": "audit_1"})  # duplicate is ignored
+    down.enqueue("audit_2", {"audit_id": "audit_2"})
+    await down.flush()
+    assert down.stats()[STATUS_PENDING] == 2
+    down.close()
+
+    api = FlakyApi()
+    restarted = _outbox(tmp_path, api)
+    assert await restarted.flush() == 2
+    assert sorted(api.calls) == ["audit_1", "audit_2"]
+    assert restarted.stats()[STATUS_SUBMITTED] == 2
+
+
+async def test_rejected_submission_fails_after_max_rejections(tmp_path):
+    """Requests the API rejects are not retried forever."""
+    api = FlakyApi(reject=True)
+    outbox = _outbox(tmp_path, api, max_rejections=2, retry_base=0)
+    outbox.enqueue("audit_1", {"audit_id": "audit_1"})
+
+    await outbox.flush()
+    assert outbox.status("audit_1")["status"] == STATUS_PENDING
+    await outbox.flush()
+    status = outbox.status("audit_1")
+    assert status["status"] == STATUS_FAILED
+    assert "threshold" in status["lastError"]
+    assert await outbox.flush() == 0
+
+
+async def test_flush_drains_in_batches(tmp_path):
+    """Each flush submits at most batch_size due submissions concurrently."""
+    api = FlakyApi()
+    outbox = _outbox(tmp_path, api, batch_size=10)
+    for i in range(25):
+        outbox.enqueue(f"audit_{i}", {"audit_id": f"audit_{i}"})
+
+    assert [await outbox.flush() for _ in range(4)] == [10, 10, 5, 0]
+    assert outbox.stats()[STATUS_SUBMITTED] == 25
+
+
+async def test_flush_prefers_higher_priority(tmp_path):
+    """Higher-priority submissions leave the outbox first, then older ones."""
+    api = FlakyApi()
+    outbox = _outbox(tmp_path, api, batch_size=1)
+    outbox.enqueue("low_old", {"audit_id": "low_old"}, priority=91)
+    outbox.enqueue("critical", {"audit_id": "critical"}, priority=99)
+    outbox.enqueue("low_new", {"audit_id": "low_new"}, priority=91)
+
+    for _ in range(3):
+        await outbox.flush()
+    assert api.calls == ["critical", "low_old", "low_new"]
+
+
+async def test_flush_uses_batch_submit(tmp_path):
+    """With submit_batch, one flush sends every due submission in a single call."""
+    batches = []
+
+    async def submit_batch(requests):
+        batches.append([r["audit_id"] for r in requests])
+        return {
+            "good": "tx_good",
+            "rejected": SubmissionError("risk_score < threshold", retryable=False),
+        }  # "lost" has no result
+
+    api = FlakyApi()
+    outbox = _outbox(tmp_path, api, submit_batch=submit_batch, retry_base=0)
+    for audit_id in ("good", "rejected", "lost"):
+        outbox.enqueue(audit_id, {"audit_id": audit_id})
+
+    assert await outbox.flush() == 3
+    assert batches == [["good", "rejected", "lost"]]
+    assert api.calls == []
+    assert outbox.status("good")["proofHash"] == "tx_good"
+    assert outbox.status("rejected")["lastError"] == "risk_score < threshold"
+    assert outbox.status("lost")["status"] == STATUS_PENDING
+
+    await outbox.flush()  # "rejected" and "lost" are retried together
+    assert batches[-1] == ["rejected", "lost"]
+
+
+async def test_flusher_dispatches_while_attempts_in_flight(tmp_path):
+    """A new high-priority submission starts while a slow one is still in flight."""
+    started = []
+
+    async def send(request):
+        started.append(request["audit_id"])
+        await asyncio.sleep(1.0 if request["audit_id"] == "a" else 0)
+        return f"tx_{request['audit_id']}"
+
+    scheduler = ProofScheduler(send, concurrency=2)
+    outbox = _outbox(tmp_path, scheduler.submit)
+
+    outbox.enqueue("a", {"audit_id": "a", "witness": {"riskScore": 10}}, priority=10)
+    outbox.start()
+    await asyncio.sleep(0.1)
+    outbox.enqueue("b", {"audit_id": "b", "witness": {"riskScore": 99}}, priority=99)
+
+    assert await outbox.wait_for_attempt("b", 0.5) == "tx_b"
+    assert outbox.status("a")["status"] == STATUS_PENDING  # still in flight
+    assert outbox.stats()["inFlight"] == 1
+    assert started == ["a", "b"]
+    await outbox.stop()
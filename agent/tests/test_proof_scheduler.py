@@ -0,0 +1,147 @@
+"""
+Tests for priority scheduling of Midnight proof generation.
+"""
+import pytest
+import asyncio
+import sys
+from pathlib import Path
+
+# Add agent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from midnight_client import ProofScheduler
+
+
+def _request(audit_id: str, risk_score: int) -> dict:
+    return {"audit_id": audit_id, "witness": {"riskScore": risk_score}}
+
+
+class SlowProofServer:
+    """Records the order and concurrency of proof generation."""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.order = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, request):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.order.append(request["audit_id"])
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return f"tx_{request['audit_id']}"
+
+
+async def test_higher_risk_first_then_oldest():
+    """A critical finding overtakes a queued burst of low-risk ones."""
+    server = SlowProofServer()
+    scheduler = ProofScheduler(server, concurrency=1)
+
+    burst = [asyncio.create_task(scheduler.submit(_request(f"low_{i}", 91))) for i in range(5)]
+    await asyncio.sleep(0)  # low_0 starts, the rest queue
+    critical = asyncio.create_task(scheduler.submit(_request("critical", 99)))
+    await asyncio.gather(*burst, critical)
+
+    assert server.order == ["low_0", "critical", "low_1", "low_2", "low_3", "low_4"]
+
+
+async def test_bounded_concurrency_and_stats():
+    """No more than `concurrency` proofs run at once; waits are reported."""
+    server = SlowProofServer()
+    scheduler = ProofScheduler(server, concurrency=3)
+
+    tasks = [asyncio.create_task(scheduler.submit(_request(f"a{i}", 95))) for i in range(12)]
+    await asyncio.sleep(0.01)
+    stats = scheduler.stats()
+    assert stats["inFlight"] == 3
+    assert stats["queueDepth"] == 9
+    await asyncio.gather(*tasks)
+
+    assert server.max_active == 3
+    stats = scheduler.stats()
+    assert stats["completed"] == 12
+    assert stats["queueDepth"] == 0
+    assert stats["maxWaitMs"] > 0
+
+
+async def test_duplicate_audit_generates_once():
+    """Concurrent requests for the same audit share one proof."""
+    server = SlowProofServer()
+    scheduler = ProofScheduler(server, concurrency=2)
+
+    results = await asyncio.gather(*(scheduler.submit(_request("same", 95)) for _ in range(5)))
+
+    assert server.order == ["same"]
+    assert results == ["tx_same"] * 5
+
+
+async def test_failure_propagates_to_every_waiter():
+    """A failed proof fails all requests for that audit, and the next request retries."""
+    calls = []
+
+    async def failing(request):
+        calls.append(request["audit_id"])
+        raise RuntimeError("proof server down")
+
+    scheduler = ProofScheduler(failing, concurrency=1)
+    results = await asyncio.gather(
+        scheduler.submit(_request("x", 95)), scheduler.submit(_request("x", 95)), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    with pytest.raises(RuntimeError):
+        await scheduler.submit(_request("x", 95))
+    assert calls == ["x", "x"]
+
+
+async def test_bulk_submission_holds_a_slot_in_priority_order():
+    """A bulk submission queues at its highest risk score and counts against concurrency."""
+    server = SlowProofServer()
+    scheduler = ProofScheduler(server, concurrency=1)
+
+    async def send_bulk(requests):
+        return await server({"audit_id": "+".join(r["audit_id"] for r in requests)})
+
+    first = asyncio.create_task(scheduler.submit(_request("low_0", 91)))
+    await asyncio.sleep(0)  # low_0 starts
+    low = asyncio.create_task(scheduler.submit(_request("low_1", 91)))
+    bulk = asyncio.create_task(
+        scheduler.submit_batch([_request("b1", 50), _request("b2", 99)], send_bulk)
+    )
+    await asyncio.gather(first, low, bulk)
+
+    assert server.order == ["low_0", "b1+b2", "low_1"]
+    assert server.max_active == 1
+    assert bulk.result() == "tx_b1+b2"
+
+
+async def test_bulk_job_followed_per_audit():
+    """A bulk job is followed for MIDNIGHT_JOB_TIMEOUT per audit, since the API proves them in turn."""
+    import httpx
+    from unittest.mock import patch
+    import midnight_client
+
+    requests = [_request(f"bulk_{i}", 95) for i in range(3)]
+    polls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(202, json={"job_id": "job_bulk", "status": "running"})
+        polls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        if len(polls) < 4:
+            return httpx.Response(202, json={"job_id": "job_bulk", "status": "running"})
+        return httpx.Response(200, json={"job_id": "job_bulk", "status": "succeeded", "result": {
+            "success": True,
+            "results": [{"audit_id": r["audit_id"], "success": True, "transaction_id": f"tx_{r['audit_id']}"} for r in requests],
+        }})
+
+    real_client = httpx.AsyncClient
+    with patch("midnight_client.MIDNIGHT_JOB_TIMEOUT", 0.1), \
+         patch("midnight_client.httpx.AsyncClient",
+               lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs)):
+        outcomes = await midnight_client._send_bulk(requests)
+
+    assert outcomes == {r["audit_id"]: f"tx_{r['audit_id']}" for r in requests}
+    assert polls == ["/api/jobs/job_bulk"] * 4
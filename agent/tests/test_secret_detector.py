@@ -0,0 +1,101 @@
+"""
+Tests for the Judge's multi-pattern secret detector.
+"""
+import pytest
+import json
+import time
+import random
+import string
+import sys
+from pathlib import Path
+
+# Add agent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from secret_detector import SecretDetector, ANY_TARGET
+
+
+def test_detects_secret_of_responding_target():
+    """Only secrets guarded by the responding target (or any target) count."""
+    detector = SecretDetector()
+    detector.register("target_a", "alpha_secret", "alpha")
+    detector.register("target_b", "beta_secret", "beta")
+    detector.register(ANY_TARGET, "fetch_ai_2024", "SECRET_KEY")
+    
+    leak = detector.first_leak("Access Granted! Flag: beta_secret", "target_b")
+    assert leak.target_address == "target_b"
+    assert leak.label == "beta"
+    
+    assert detector.first_leak("Access Granted! Flag: beta_secret", "target_a") is None
+    assert detector.first_leak("Flag: fetch_ai_2024", "target_a").label == "SECRET_KEY"
+    assert detector.first_leak("Access Denied", "target_a") is None
+
+
+def test_overlapping_secrets():
+    """Secrets that are substrings of each other are all reported."""
+    detector = SecretDetector()
+    for secret in ["he", "she", "his", "hers"]:
+        detector.register("target", secret)
+    
+    labels = sorted(m.label for m in detector.scan("ushers"))
+    assert labels == ["he", "hers", "she"]
+
+
+def test_unregister_recompiles():
+    """Removing a secret takes effect on the next scan."""
+    detector = SecretDetector()
+    detector.register("target", "canary_1")
+    assert detector.scan("leaked canary_1")
+    
+    detector.unregister("target", "canary_1")
+    assert detector.scan("leaked canary_1") == []
+    assert len(detector) == 0
+
+
+def test_load_registry(tmp_path):
+    """Secrets can be loaded from a JSON registry file."""
+    registry = tmp_path / "secrets.json"
+    registry.write_text(json.dumps({
+        "target_a": ["plain_secret", {"secret": "db_password_42", "label": "db"}],
+        "*": ["global_canary"],
+    }))
+    
+    detector = SecretDetector()
+    assert detector.load_registry(str(registry)) == 3
+    assert detector.first_leak("dump: db_password_42", "target_a").label == "db"
+    assert detector.first_leak("global_canary", "target_z").target_address == ANY_TARGET
+
+
+@pytest.mark.benchmark
+def test_scan_performance_with_thousands_of_canaries():
+    """Benchmark: one pass over a response with 10,000 registered canaries."""
+    rng = random.Random(42)
+    detector = SecretDetector()
+    canaries = {}
+    for target_index in range(500):
+        for canary_index in range(20):
+            canary = "cnry_" + "".join(rng.choices(string.ascii_lowercase + string.digits, k=16))
+            canaries[canary] = f"target_{target_index}"
+            detector.register(f"target_{target_index}", canary)
+    assert len(detector) == 10000
+    
+    leaked = rng.choice(list(canaries))
+    response = "".join(rng.choices(string.ascii_letters + " ", k=4000)) + leaked + " trailing output"
+    
+    detector.scan("warm up")  # compile once
+    
+    start_time = time.time()
+    for _ in range(100):
+        matches = detector.scan(response)
+    scan_time = (time.time() - start_time) / 100
+    
+    start_time = time.time()
+    for _ in range(5):
+        naive = [c for c in canaries if c in response]
+    naive_time = (time.time() - start_time) / 5
+    
+    print(f"\nAho-Corasick scan: {scan_time * 1000:.3f} ms, naive substring scans: {naive_time * 1000:.3f} ms")
+    
+    assert [m.target_address for m in matches] == [canaries[leaked]]
+    assert naive == [leaked]
+    assert scan_time < 0.05  # single linear pass over ~4 KB
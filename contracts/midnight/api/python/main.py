@@ -12,13 +12,31 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Header, Response
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, Field
 import uvicorn
 
 from config import NetworkType
-from utils.wallet import WalletUtils
+from utils.wallet import WalletUtils, WALLET_SERVICE_ENABLED
+from utils.bridge_pool import (
+    BridgePool,
+    BridgeError,
+    BRIDGE_POOL_SIZE,
+    BRIDGE_REQUEST_TIMEOUT,
+)
+from utils.audit_cache import AuditCache
+from utils.jobs import JobRunner, TERMINAL_STATES
+from utils.indexer import IndexerError
+from utils.network_health import NetworkHealthMonitor
+from utils.ledger_log import (
+    LedgerLog,
+    block_time,
+    LEDGER_CHANGES_PAGE_SIZE,
+    LEDGER_CHANGES_MAX_PAGE_SIZE,
+)
 
 
 # Pydantic models for request/response
@@ -57,6 +75,44 @@ class SubmitAuditResponse(BaseModel):
     ledger_state: Dict[str, Any]
 
 
+# Upper bound on audits per /api/submit-audits call
+SUBMIT_AUDITS_MAX = int(os.getenv("SUBMIT_AUDITS_MAX", "50"))
+
+
+class SubmitAuditsRequest(BaseModel):
+    audits: List[SubmitAuditRequest] = Field(
+        ..., min_length=1, max_length=SUBMIT_AUDITS_MAX, description="Audits to submit"
+    )
+
+
+class AuditSubmissionResult(BaseModel):
+    audit_id: str
+    success: bool
+    transaction_id: Optional[str] = None
+    block_height: Optional[int] = None
+    error: Optional[str] = None
+
+
+class SubmitAuditsResponse(BaseModel):
+    success: bool
+    submitted: int
+    failed: int
+    results: List[AuditSubmissionResult]
+    error: Optional[str] = None
+    ledger_state: Dict[str, Any]
+
+
+class JobResponse(BaseModel):
+    job_id: str
+    operation: str
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    attempts: int
+    created_at: float
+    updated_at: float
+
+
 class QueryAuditRequest(BaseModel):
     audit_id: str = Field(..., description="Audit ID to query")
 
@@ -68,6 +124,32 @@ class QueryAuditResponse(BaseModel):
     is_verified: Optional[bool] = None
 
 
+# Upper bound on audits per /api/query-audits call
+QUERY_AUDITS_MAX = int(os.getenv("QUERY_AUDITS_MAX", "200"))
+
+
+class QueryAuditsRequest(BaseModel):
+    auditIds: List[str] = Field(
+        ..., min_length=1, max_length=QUERY_AUDITS_MAX, description="Audit IDs to query"
+    )
+
+
+class AuditStatus(BaseModel):
+    auditId: str
+    found: bool
+    proofHash: Optional[str] = None
+    isVerified: Optional[bool] = None
+
+
+class QueryAuditsResponse(BaseModel):
+    audits: List[AuditStatus]
+
+
+class TransactionLookupRequest(BaseModel):
+    tx_ids: List[str] = Field(..., description="Transaction hashes or identifiers")
+    search_type: str = Field("hash", description="Either 'hash' or 'identifier'")
+
+
 class WalletBalanceResponse(BaseModel):
     address: str
     balances: Dict[str, str]
@@ -75,12 +157,35 @@ class WalletBalanceResponse(BaseModel):
     pending_coins: int
     total_coins: int
     synced: bool
+    updated_at: Optional[float] = None
+    staleness_seconds: Optional[float] = None
 
 
 class TransactionHistoryResponse(BaseModel):
     address: str
     transaction_count: int
     transactions: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+    updated_at: Optional[float] = None
+    staleness_seconds: Optional[float] = None
+
+
+class LedgerChange(BaseModel):
+    block_height: int
+    block_timestamp: Optional[str] = Field(None, description="ISO timestamp of the block")
+    audit_id: str
+    proof_hash: Optional[str] = None
+    is_verified: Optional[bool] = None
+    auditor_id: Optional[str] = None
+
+
+class LedgerChangesResponse(BaseModel):
+    changes: List[LedgerChange]
+    next_cursor: str = Field(..., description="Pass as cursor to continue after this page")
+    has_more: bool
+    synced_height: Optional[int] = Field(
+        None, description="Chain height of the latest ledger snapshot in the log"
+    )
 
 
 class NetworkHealthResponse(BaseModel):
@@ -92,6 +197,24 @@ class NetworkHealthResponse(BaseModel):
     failed: int
     success_rate: str
     healthy: bool
+    blocks_checked: Optional[int] = None
+    average_block_time_seconds: Optional[float] = None
+    updated_at: Optional[float] = None
+    age_seconds: Optional[float] = None
+    error: Optional[str] = Field(None, description="Last refresh error, if the snapshot is stale")
+
+
+class NetworkHealthPoint(BaseModel):
+    updated_at: float
+    latest_block: int
+    success_rate: float
+    average_block_time_seconds: Optional[float] = None
+    healthy: bool
+
+
+class NetworkHealthHistoryResponse(BaseModel):
+    interval_seconds: float
+    history: List[NetworkHealthPoint]
 
 
 # Global state
@@ -99,6 +222,11 @@ class AppState:
     contract_api: Optional[Any] = None
     contract_address: Optional[str] = None
     wallet_utils: Optional[WalletUtils] = None
+    bridge_pool: Optional[BridgePool] = None
+    audit_cache: AuditCache = AuditCache()
+    jobs: Optional[JobRunner] = None
+    ledger_log: Optional[LedgerLog] = None
+    network_health: Optional[NetworkHealthMonitor] = None
     api_root: Path = Path(__file__).parent.parent
 
 
@@ -111,9 +239,38 @@ async def lifespan(app: FastAPI):
     # Startup
     app_state.api_root = Path(__file__).parent.parent
     app_state.wallet_utils = WalletUtils(app_state.api_root)
+    app_state.network_health = NetworkHealthMonitor(app_state.wallet_utils.indexer)
+    app_state.network_health.start()
+    if BRIDGE_POOL_SIZE > 0:
+        pool = BridgePool(app_state.api_root, size=BRIDGE_POOL_SIZE)
+        try:
+            await pool.start()
+            app_state.bridge_pool = pool
+        except OSError as e:
+            # tsx missing: fall back to spawning the bridge per request
+            await pool.stop()
+            print(f"Bridge pool disabled: {e}")
+    if WALLET_SERVICE_ENABLED:
+        try:
+            await app_state.wallet_utils.start_service()
+        except OSError as e:
+            print(f"Wallet service disabled: {e}")
+    app_state.ledger_log = LedgerLog()
+    app_state.jobs = JobRunner()
+    app_state.jobs.register("submit_audit", run_submit_audit)
+    app_state.jobs.register("submit_audits", run_submit_audits)
+    await app_state.jobs.start()
     yield
     # Shutdown
-    pass
+    await app_state.jobs.stop()
+    app_state.jobs.close()
+    app_state.ledger_log.close()
+    await app_state.wallet_utils.stop_service()
+    await app_state.network_health.stop()
+    await app_state.wallet_utils.indexer.close()
+    if app_state.bridge_pool:
+        await app_state.bridge_pool.stop()
+        app_state.bridge_pool = None
 
 
 # Initialize FastAPI app
@@ -132,17 +289,23 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Ledger snapshots and change pages are large and repetitive JSON
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
 async def run_ts_contract_operation(
-    operation: str, data: Dict[str, Any]
+    operation: str, data: Dict[str, Any], timeout: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Run a TypeScript contract operation
 
+    Uses the persistent bridge worker pool when it is running, otherwise spawns
+    a one-shot bridge process.
+
     Args:
-        operation: Operation name (init, submit_audit, query_audit, get_ledger)
+        operation: Operation name (init, submit_audit, submit_audits, query_audit, get_ledger)
         data: Operation data
+        timeout: Pool request timeout (defaults to BRIDGE_REQUEST_TIMEOUT)
 
     Returns:
         Operation result
@@ -155,6 +318,14 @@ async def run_ts_contract_operation(
             status_code=500, detail="Contract bridge not initialized. Run setup first."
         )
 
+    if app_state.bridge_pool:
+        try:
+            return await app_state.bridge_pool.call(operation, data, timeout)
+        except BridgeError as e:
+            raise HTTPException(
+                status_code=500, detail=f"Contract operation failed: {str(e)}"
+            )
+
     # tsx is in the root workspace node_modules
     tsx_bin = "/usr/bin/tsx" 
     process = await asyncio.create_subprocess_exec(
@@ -188,6 +359,10 @@ async def health_check():
         "status": "healthy",
         "initialized": app_state.contract_address is not None,
         "contract_address": app_state.contract_address,
+        "bridge_pool": app_state.bridge_pool.stats() if app_state.bridge_pool else None,
+        "audit_cache": app_state.audit_cache.stats(),
+        "jobs": app_state.jobs.stats() if app_state.jobs else None,
+        "network": app_state.network_health.stats() if app_state.network_health else None,
     }
 
 
@@ -205,34 +380,147 @@ async def initialize_contract(request: InitRequest):
 
         if result.get("success"):
             app_state.contract_address = result.get("contract_address")
+            app_state.audit_cache.clear()
+            app_state.ledger_log.set_contract(app_state.contract_address)
 
         return InitResponse(**result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/submit-audit", response_model=SubmitAuditResponse, tags=["Contract"])
-async def submit_audit(request: SubmitAuditRequest):
+async def block_timestamp(block_height: Optional[int]) -> Optional[str]:
+    """ISO timestamp of a block, or None if the indexer cannot tell"""
+    if block_height is None:
+        return None
+    try:
+        block = await app_state.wallet_utils.indexer.get_block(block_height)
+    except IndexerError:
+        return None
+    return block_time(block.get("timestamp"))
+
+
+async def run_submit_audit(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Job handler: submit one audit and update the audit cache"""
+    result = await run_ts_contract_operation("submit_audit", payload)
+    app_state.audit_cache.record_submission(payload["audit_id"], result)
+    if result.get("success"):
+        app_state.ledger_log.record_submission(
+            payload["audit_id"],
+            result.get("ledger_state") or {},
+            result.get("block_height"),
+            await block_timestamp(result.get("block_height")),
+        )
+    return SubmitAuditResponse(**{"ledger_state": {}, **result}).dict()
+
+
+async def run_submit_audits(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Job handler: submit a batch of audits and update the audit cache"""
+    result = await run_ts_contract_operation(
+        "submit_audits",
+        payload,
+        timeout=BRIDGE_REQUEST_TIMEOUT * len(payload["audits"]),
+    )
+
+    ledger_state = result.get("ledger_state") or {}
+    timestamps: Dict[int, Optional[str]] = {}
+    for item in result.get("results", []):
+        app_state.audit_cache.record_submission(
+            item["audit_id"],
+            {"success": item.get("success"), "ledger_state": ledger_state},
+        )
+        if item.get("success"):
+            height = item.get("block_height")
+            if height not in timestamps:
+                timestamps[height] = await block_timestamp(height)
+            app_state.ledger_log.record_submission(
+                item["audit_id"], ledger_state, height, timestamps[height]
+            )
+    submitted = sum(1 for item in result.get("results", []) if item.get("success"))
+    return SubmitAuditsResponse(
+        **{"results": [], "ledger_state": {}, **result},
+        submitted=submitted,
+        failed=len(result.get("results", [])) - submitted,
+    ).dict()
+
+
+async def job_response(job: Dict[str, Any], response: Response, wait: float) -> JobResponse:
+    """Optionally wait for a job, then return it (202 while it is unfinished)"""
+    if wait > 0:
+        job = await app_state.jobs.wait(job["job_id"], wait)
+    response.status_code = 200 if job["status"] in TERMINAL_STATES else 202
+    response.headers["Location"] = f"/api/jobs/{job['job_id']}"
+    return JobResponse(**job)
+
+
+@app.post(
+    "/api/submit-audit", response_model=JobResponse, status_code=202, tags=["Contract"]
+)
+async def submit_audit(
+    request: SubmitAuditRequest, response: Response, wait: float = Query(0, ge=0)
+):
     """
     Submit an audit with zero-knowledge proof
 
+    Returns a job immediately (202); poll `/api/jobs/{job_id}` for the
+    SubmitAuditResponse in **result**. Resubmitting an audit returns its
+    existing job unless that job failed.
+
     - **audit_id**: Unique identifier for the audit (32-byte hex string)
     - **auditor_addr**: Auditor address (32-byte hex string, e.g., Judge agent)
     - **threshold**: Minimum risk score required (e.g., 90)
     - **witness**: Private witness data containing:
         - **exploit_string**: Exploit details (hex string, max 64 bytes)
         - **risk_score**: Actual risk score (integer, private - never revealed on-chain)
+    - **wait**: Seconds to wait for the job to finish before answering (200 if it did)
     """
     if not app_state.contract_address:
         raise HTTPException(
             status_code=400, detail="Contract not initialized. Call /api/init first."
         )
 
-    try:
-        result = await run_ts_contract_operation("submit_audit", request.dict())
-        return SubmitAuditResponse(**result)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    job = app_state.jobs.submit("submit_audit", request.audit_id, request.dict())
+    return await job_response(job, response, wait)
+
+
+@app.post(
+    "/api/submit-audits", response_model=JobResponse, status_code=202, tags=["Contract"]
+)
+async def submit_audits(
+    request: SubmitAuditsRequest, response: Response, wait: float = Query(0, ge=0)
+):
+    """
+    Submit many audits in one bridge operation
+
+    Providers, proving keys and the wallet are set up once for the whole batch.
+    Each audit is still its own transaction (the contract records one audit per
+    call) and has its own entry in **results**; one failure does not stop the rest.
+    Returns a job like `/api/submit-audit`; its **result** is a SubmitAuditsResponse.
+
+    - **audits**: List of /api/submit-audit request bodies
+    - **wait**: Seconds to wait for the job to finish before answering (200 if it did)
+    """
+    if not app_state.contract_address:
+        raise HTTPException(
+            status_code=400, detail="Contract not initialized. Call /api/init first."
+        )
+
+    key = ",".join(sorted(audit.audit_id for audit in request.audits))
+    job = app_state.jobs.submit("submit_audits", key, request.dict())
+    return await job_response(job, response, wait)
+
+
+@app.get("/api/jobs/{job_id}", response_model=JobResponse, tags=["Contract"])
+async def get_job(job_id: str, response: Response, wait: float = Query(0, ge=0)):
+    """
+    Get a submission job
+
+    - **job_id**: Job ID returned by a submit endpoint
+    - **wait**: Long-poll: seconds to wait for the job to finish (max `JOBS_MAX_WAIT`)
+    """
+    job = app_state.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return await job_response(job, response, wait)
 
 
 @app.post("/api/query-audit", response_model=QueryAuditResponse, tags=["Contract"])
@@ -248,26 +536,134 @@ async def query_audit(request: QueryAuditRequest):
         )
 
     try:
-        result = await run_ts_contract_operation("query_audit", request.dict())
+        result = await app_state.audit_cache.get_audit(
+            request.audit_id,
+            lambda: run_ts_contract_operation("query_audit", request.dict()),
+        )
         return QueryAuditResponse(**result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/query-audits", response_model=QueryAuditsResponse, tags=["Contract"])
+async def query_audits(request: QueryAuditsRequest):
+    """
+    Query the status of many audits
+
+    Served from the audit cache; only uncached audits go to the bridge.
+
+    - **auditIds**: Audit IDs to query (at most `QUERY_AUDITS_MAX`)
+    """
+    if not app_state.contract_address:
+        raise HTTPException(
+            status_code=400, detail="Contract not initialized. Call /api/init first."
+        )
+
+    audit_ids = list(dict.fromkeys(request.auditIds))
+    try:
+        records = await asyncio.gather(
+            *(
+                app_state.audit_cache.get_audit(
+                    audit_id,
+                    lambda audit_id=audit_id: run_ts_contract_operation(
+                        "query_audit", {"audit_id": audit_id}
+                    ),
+                )
+                for audit_id in audit_ids
+            )
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return QueryAuditsResponse(
+        audits=[
+            AuditStatus(
+                auditId=audit_id,
+                found=record["found"],
+                proofHash=record.get("proof_hash"),
+                isVerified=record.get("is_verified"),
+            )
+            for audit_id, record in zip(audit_ids, records)
+        ]
+    )
+
+
 @app.get("/api/ledger", tags=["Contract"])
-async def get_ledger_state():
-    """Get the current ledger state"""
+async def get_ledger_state(
+    response: Response, if_none_match: Optional[str] = Header(None)
+):
+    """
+    Get the current ledger state
+
+    The response carries an ETag; send it back in If-None-Match to get a 304
+    when the snapshot has not changed.
+    """
     if not app_state.contract_address:
         raise HTTPException(
             status_code=400, detail="Contract not initialized. Call /api/init first."
         )
 
     try:
-        result = await run_ts_contract_operation("get_ledger", {})
-        return result
+        result, etag = await app_state.audit_cache.get_ledger(
+            lambda: run_ts_contract_operation("get_ledger", {})
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    if not result.get("success"):
+        return result
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return result
+
+
+async def refresh_ledger_log() -> None:
+    """Diff the current ledger snapshot into the change log"""
+    try:
+        result, etag = await app_state.audit_cache.get_ledger(
+            lambda: run_ts_contract_operation("get_ledger", {})
+        )
+        if not result.get("success"):
+            return
+        # Read the height after the snapshot so it is never below the snapshot's
+        block = await app_state.wallet_utils.indexer.get_latest_block()
+    except (HTTPException, IndexerError) as e:
+        # Serve what is already logged; the next request tries again
+        print(f"Ledger change log not refreshed: {getattr(e, 'detail', e)}")
+        return
+    app_state.ledger_log.record_snapshot(
+        result.get("ledger_state") or {},
+        int(block["height"]),
+        etag,
+        block_time(block.get("timestamp")),
+    )
+
+
+@app.get("/api/ledger/changes", response_model=LedgerChangesResponse, tags=["Contract"])
+async def get_ledger_changes(
+    since: Optional[int] = Query(None, ge=0, description="Only changes after this block height"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(LEDGER_CHANGES_PAGE_SIZE, ge=1, le=LEDGER_CHANGES_MAX_PAGE_SIZE),
+):
+    """
+    Audits inserted or updated after a block height, oldest first
+
+    Start with **since** (0 for a full sync), then keep passing **next_cursor**
+    back as **cursor**: it resumes exactly after the last change returned, even
+    when several changes share a block height. Responses are gzip-compressed
+    for clients that send Accept-Encoding: gzip.
+    """
+    if not app_state.contract_address:
+        raise HTTPException(
+            status_code=400, detail="Contract not initialized. Call /api/init first."
+        )
+    if cursor is not None and not cursor.isdigit():
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    await refresh_ledger_log()
+    return LedgerChangesResponse(**app_state.ledger_log.changes(since, cursor, limit))
+
 
 # Wallet Endpoints
 
@@ -299,15 +695,48 @@ async def get_wallet_balance():
 @app.get(
     "/wallet/transactions", response_model=TransactionHistoryResponse, tags=["Wallet"]
 )
-async def get_transaction_history():
+async def get_transaction_history(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    from_timestamp: Optional[int] = None,
+    to_timestamp: Optional[int] = None,
+    type: Optional[str] = Query(None, pattern="^(received|sent|neutral)$"),
+    identifier: Optional[str] = None,
+    stream: bool = False,
+):
     """
-    Get wallet transaction history
+    Get wallet transaction history, newest first
 
-    Returns all transactions associated with the wallet
+    - **cursor**: `next_cursor` from the previous page
+    - **limit**: Page size
+    - **from_timestamp** / **to_timestamp**: Block timestamp range (indexer units)
+    - **type**: "received", "sent" or "neutral"
+    - **identifier**: Transaction identifier
+    - **stream**: Stream every matching transaction as NDJSON instead of a page
+
+    Served from the local transaction index when the wallet session is running,
+    otherwise returns the full history from a one-shot script.
     """
+    wallet_utils = app_state.wallet_utils
     try:
-        history = await app_state.wallet_utils.get_transaction_history()
-        return TransactionHistoryResponse(**history)
+        if wallet_utils.tx_index is None:
+            history = await wallet_utils.get_transaction_history()
+            return TransactionHistoryResponse(**history)
+
+        if stream:
+            rows = await wallet_utils.iter_transactions(
+                from_timestamp, to_timestamp, type, identifier
+            )
+            return StreamingResponse(
+                (json.dumps(row) + "\n" for row in rows),
+                media_type="application/x-ndjson",
+            )
+
+        page = await wallet_utils.get_transaction_page(
+            cursor, limit, from_timestamp, to_timestamp, type, identifier
+        )
+        address = await wallet_utils.get_address()
+        return TransactionHistoryResponse(address=address, **page)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -326,20 +755,56 @@ async def query_transaction(tx_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/network/health", response_model=NetworkHealthResponse, tags=["Network"])
-async def check_network_health():
+@app.post("/wallet/transactions/lookup", tags=["Wallet"])
+async def lookup_transactions(request: TransactionLookupRequest):
     """
-    Check Midnight network health
+    Query many transactions at once
 
-    Returns statistics about recent blocks and transaction success rate
+    - **tx_ids**: Transaction hashes or identifiers
+    - **search_type**: "hash" (default) or "identifier"
     """
     try:
-        health = await app_state.wallet_utils.check_network_health()
-        return NetworkHealthResponse(**health)
+        return await app_state.wallet_utils.query_transactions(
+            request.tx_ids, request.search_type
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/network/health", response_model=NetworkHealthResponse, tags=["Network"])
+async def check_network_health():
+    """
+    Check Midnight network health
+
+    Returns statistics about recent blocks and transaction success rate from the
+    latest background refresh (every NETWORK_HEALTH_INTERVAL seconds), with its
+    age in **age_seconds**
+    """
+    health = app_state.network_health.snapshot()
+    if health is None:
+        # No refresh has succeeded yet
+        try:
+            health = await app_state.network_health.refresh()
+        except IndexerError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+    return NetworkHealthResponse(**health)
+
+
+@app.get(
+    "/network/health/history",
+    response_model=NetworkHealthHistoryResponse,
+    tags=["Network"],
+)
+async def get_network_health_history():
+    """Rolling history of network health snapshots, oldest first"""
+    return NetworkHealthHistoryResponse(
+        interval_seconds=app_state.network_health.interval,
+        history=list(app_state.network_health.history),
+    )
+
+
 def main():
     """Run the API server"""
     port = int(os.getenv("PORT", "8000"))
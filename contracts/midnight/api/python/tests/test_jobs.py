@@ -0,0 +1,114 @@
+"""
+Tests for the persistent submission job queue.
+"""
+import pytest
+import asyncio
+import sys
+from pathlib import Path
+
+# Add API python directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.jobs import JobRunner, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, JOB_FAILED
+
+
+class GatedHandler:
+    """Job handler that records its payloads and finishes when released."""
+
+    def __init__(self, result=None):
+        self.result = result or {"success": True}
+        self.calls = []
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self, payload: dict) -> dict:
+        self.calls.append(payload)
+        self.started.set()
+        await self.release.wait()
+        return self.result
+
+
+async def _finish(runner: JobRunner, job_id: str) -> dict:
+    job = await runner.wait(job_id, timeout=5.0)
+    assert job["status"] in (JOB_SUCCEEDED, JOB_FAILED), job
+    return job
+
+
+@pytest.mark.asyncio
+async def test_same_key_attaches_to_the_running_job(tmp_path):
+    """Resubmitting work that is queued or running returns the existing job and runs it once."""
+    handler = GatedHandler()
+    runner = JobRunner(str(tmp_path / "jobs.db"), concurrency=1)
+    runner.register("submit_audit", handler)
+    await runner.start()
+
+    first = runner.submit("submit_audit", "audit_a", {"audit_id": "audit_a"})
+    await handler.started.wait()
+    again = runner.submit("submit_audit", "audit_a", {"audit_id": "audit_a"})
+    assert again["job_id"] == first["job_id"]
+    assert again["status"] == JOB_RUNNING
+
+    handler.release.set()
+    job = await _finish(runner, first["job_id"])
+    assert job["status"] == JOB_SUCCEEDED
+    assert runner.submit("submit_audit", "audit_a", {"audit_id": "audit_a"})["status"] == JOB_SUCCEEDED
+    assert len(handler.calls) == 1
+
+    await runner.stop()
+    runner.close()
+
+
+@pytest.mark.asyncio
+async def test_rejected_job_is_queued_again_on_resubmit(tmp_path):
+    """A "success": false result fails the job; submitting it again runs it again."""
+    handler = GatedHandler({"success": False, "error": "Contract rejected the audit"})
+    handler.release.set()
+    runner = JobRunner(str(tmp_path / "jobs.db"), concurrency=1)
+    runner.register("submit_audit", handler)
+    await runner.start()
+
+    job = await _finish(runner, runner.submit("submit_audit", "audit_a", {"audit_id": "audit_a"})["job_id"])
+    assert job["status"] == JOB_FAILED
+    assert job["error"] == "Contract rejected the audit"
+
+    handler.result = {"success": True}
+    retried = runner.submit("submit_audit", "audit_a", {"audit_id": "audit_a"})
+    assert retried["status"] == JOB_QUEUED
+    job = await _finish(runner, retried["job_id"])
+    assert job["status"] == JOB_SUCCEEDED
+    assert job["attempts"] == 2
+
+    await runner.stop()
+    runner.close()
+
+
+@pytest.mark.asyncio
+async def test_unfinished_jobs_resume_after_restart(tmp_path):
+    """Jobs queued or running at shutdown run again when the next runner starts."""
+    path = str(tmp_path / "jobs.db")
+    stuck = GatedHandler()
+    runner = JobRunner(path, concurrency=1)
+    runner.register("submit_audit", stuck)
+    await runner.start()
+    running = runner.submit("submit_audit", "audit_a", {"audit_id": "audit_a"})
+    await stuck.started.wait()
+    queued = runner.submit("submit_audit", "audit_b", {"audit_id": "audit_b"})
+    await runner.stop()
+    runner.close()
+
+    handler = GatedHandler()
+    handler.release.set()
+    restarted = JobRunner(path, concurrency=1)
+    restarted.register("submit_audit", handler)
+    assert restarted.stats()[JOB_RUNNING] == 1
+    await restarted.start()
+
+    first = await _finish(restarted, running["job_id"])
+    second = await _finish(restarted, queued["job_id"])
+    assert first["status"] == second["status"] == JOB_SUCCEEDED
+    assert first["attempts"] == 2  # interrupted once
+    assert second["attempts"] == 1
+    assert [call["audit_id"] for call in handler.calls] == ["audit_a", "audit_b"]
+
+    await restarted.stop()
+    restarted.close()
@@ -0,0 +1,189 @@
+"""
+Tests for the ledger endpoints (/api/ledger and /api/ledger/changes).
+"""
+import pytest
+import copy
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import pytest_asyncio
+
+# Add API python directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import main
+from utils.audit_cache import AuditCache
+from utils.ledger_log import LedgerLog
+
+CONTRACT = "0xaudit_verifier"
+
+
+class FakeChain:
+    """Stands in for the contract bridge and the indexer: one audit per block."""
+
+    def __init__(self):
+        self.height = 1
+        self.ledger = {"proofs": {}, "is_verified": {}, "auditor_id": {}}
+        self.operations = []
+
+    def add_audit(self, audit_id: str, auditor_id: str = "auditor") -> int:
+        """Write an audit to the ledger in a new block (as another client would)"""
+        self.height += 1
+        self.ledger["proofs"][audit_id] = f"hash_{audit_id}"
+        self.ledger["is_verified"][audit_id] = True
+        self.ledger["auditor_id"][audit_id] = auditor_id
+        return self.height
+
+    async def run(self, operation: str, data: dict, timeout=None) -> dict:
+        self.operations.append(operation)
+        if operation == "get_ledger":
+            return {"success": True, "ledger_state": copy.deepcopy(self.ledger)}
+        if operation == "submit_audit":
+            height = self.add_audit(data["audit_id"])
+            return {
+                "success": True,
+                "transaction_id": f"tx_{data['audit_id']}",
+                "block_height": height,
+                "ledger_state": copy.deepcopy(self.ledger),
+            }
+        raise AssertionError(f"Unexpected bridge operation: {operation}")
+
+    def _block(self, height: int) -> dict:
+        return {"height": height, "hash": f"hash_{height}", "timestamp": 1_700_000_000_000 + height * 6000}
+
+    async def get_latest_block(self) -> dict:
+        return self._block(self.height)
+
+    async def get_block(self, height: int) -> dict:
+        return self._block(height)
+
+
+@pytest.fixture
+def chain(tmp_path):
+    """Initialized API state backed by a FakeChain; restored afterwards."""
+    fake = FakeChain()
+    saved = {name: getattr(main.app_state, name) for name in ("contract_address", "wallet_utils", "audit_cache", "ledger_log")}
+    main.app_state.contract_address = CONTRACT
+    main.app_state.wallet_utils = SimpleNamespace(indexer=fake)
+    main.app_state.audit_cache = AuditCache(ledger_ttl=0)
+    main.app_state.ledger_log = LedgerLog(str(tmp_path / "ledger-log.db"))
+    main.app_state.ledger_log.set_contract(CONTRACT)
+    with patch("main.run_ts_contract_operation", fake.run):
+        yield fake
+    main.app_state.ledger_log.close()
+    for name, value in saved.items():
+        setattr(main.app_state, name, value)
+
+
+@pytest_asyncio.fixture
+async def client():
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://midnight-api") as http:
+        yield http
+
+
+async def _submit(audit_id: str) -> None:
+    await main.run_submit_audit({"audit_id": audit_id, "auditor_addr": "auditor"})
+
+
+async def _changes(client: httpx.AsyncClient, **params) -> dict:
+    response = await client.get("/api/ledger/changes", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_through_changes_in_order(chain, client):
+    """Following next_cursor returns every change once, including several at one height."""
+    await _submit("audit_a")
+    await _submit("audit_b")
+    chain.add_audit("audit_c")  # submitted elsewhere: found by the snapshot diff
+    chain.add_audit("audit_d")
+
+    seen = []
+    page = await _changes(client, since=0, limit=1)
+    seen += page["changes"]
+    while page["has_more"]:
+        page = await _changes(client, cursor=page["next_cursor"], limit=1)
+        seen += page["changes"]
+
+    assert [change["audit_id"] for change in seen] == ["audit_a", "audit_b", "audit_c", "audit_d"]
+    assert [change["block_height"] for change in seen] == [2, 3, 5, 5]  # c and d logged at the snapshot height
+    assert seen[0]["block_timestamp"] == "2023-11-14T22:13:32+00:00"
+    assert seen[0]["proof_hash"] == "hash_audit_a"
+    assert page["synced_height"] == 5
+
+
+@pytest.mark.asyncio
+async def test_cursor_resumes_after_the_last_change(chain, client):
+    """An exhausted cursor returns nothing until new changes arrive, then only those."""
+    await _submit("audit_a")
+    page = await _changes(client, since=0)
+    assert len(page["changes"]) == 1 and not page["has_more"]
+
+    idle = await _changes(client, cursor=page["next_cursor"])
+    assert idle["changes"] == []
+    assert idle["next_cursor"] == page["next_cursor"]
+
+    await _submit("audit_b")
+    resumed = await _changes(client, cursor=idle["next_cursor"])
+    assert [change["audit_id"] for change in resumed["changes"]] == ["audit_b"]
+
+
+@pytest.mark.asyncio
+async def test_since_filters_by_block_height(chain, client):
+    """since skips changes at or below the given block height."""
+    await _submit("audit_a")
+    await _submit("audit_b")
+    page = await _changes(client, since=2)
+    assert [change["audit_id"] for change in page["changes"]] == ["audit_b"]
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(chain, client):
+    """A cursor that is not a change sequence number is a 400."""
+    response = await client.get("/api/ledger/changes", params={"cursor": "abc"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_unchanged_ledger_answers_304(chain, client):
+    """Sending the snapshot's ETag back in If-None-Match gets a bodiless 304."""
+    chain.add_audit("audit_a")
+    first = await client.get("/api/ledger")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.json()["ledger_state"]["proofs"] == {"audit_a": "hash_audit_a"}
+
+    again = await client.get("/api/ledger", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.headers["ETag"] == etag
+    assert again.content == b""
+
+
+@pytest.mark.asyncio
+async def test_submission_invalidates_cached_etag(chain, client):
+    """A submission through the API replaces the cached snapshot, so the old ETag no longer matches."""
+    main.app_state.audit_cache = AuditCache()  # snapshot cached for LEDGER_CACHE_TTL
+    etag = (await client.get("/api/ledger")).headers["ETag"]
+    await _submit("audit_a")
+
+    response = await client.get("/api/ledger", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert "audit_a" in response.json()["ledger_state"]["proofs"]
+    assert chain.operations.count("get_ledger") == 1  # served from the snapshot the submission returned
+
+
+@pytest.mark.asyncio
+async def test_change_made_elsewhere_changes_etag_after_ttl(chain, client):
+    """Once the cached snapshot expires, a ledger change from another client yields a new ETag."""
+    etag = (await client.get("/api/ledger")).headers["ETag"]
+    chain.add_audit("audit_b")
+
+    response = await client.get("/api/ledger", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
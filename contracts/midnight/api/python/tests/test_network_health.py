@@ -0,0 +1,108 @@
+"""
+Tests for the background network health monitor.
+"""
+import pytest
+import re
+import sys
+from pathlib import Path
+
+# Add API python directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.indexer import IndexerError
+from utils.network_health import NetworkHealthMonitor
+
+
+class FakeIndexer:
+    """Stands in for IndexerClient: a chain of blocks, 6 s apart, with given apply stages."""
+
+    def __init__(self, height: int, stages=("SucceedEntirely", "SucceedEntirely", "FailEntirely")):
+        self.height = height
+        self.stages = list(stages)
+        self.fetched = []
+        self.down = False
+
+    def _block(self, height: int) -> dict:
+        return {
+            "height": height,
+            "hash": f"hash_{height}",
+            "timestamp": 1_700_000_000_000 + height * 6000,
+            "transactions": [{"applyStage": stage} for stage in self.stages],
+        }
+
+    async def get_latest_block(self) -> dict:
+        if self.down:
+            raise IndexerError("Indexer request failed: connection refused")
+        block = self._block(self.height)
+        return {key: block[key] for key in ("height", "hash", "timestamp")}
+
+    async def query(self, query: str, variables=None) -> dict:
+        heights = [(alias, int(height)) for alias, height in re.findall(r"(b\d+): block\(offset: \{height: (\d+)\}\)", query)]
+        self.fetched.append([height for _, height in heights])
+        return {alias: self._block(height) for alias, height in heights}
+
+
+@pytest.mark.asyncio
+async def test_refresh_only_fetches_new_blocks():
+    """Counted blocks are kept; later refreshes fetch just the new ones in one query."""
+    indexer = FakeIndexer(height=10)
+    monitor = NetworkHealthMonitor(indexer, window=5)
+
+    snapshot = await monitor.refresh()
+    assert indexer.fetched == [[6, 7, 8, 9, 10]]
+    assert snapshot["blocks_checked"] == 5
+    assert snapshot["total_transactions_checked"] == 15
+    assert snapshot["success_rate"] == "66.67"
+    assert snapshot["healthy"] is True
+    assert snapshot["average_block_time_seconds"] == 6.0
+
+    indexer.height = 12
+    await monitor.refresh()
+    assert indexer.fetched[-1] == [11, 12]
+    assert sorted(monitor._blocks) == [8, 9, 10, 11, 12]  # blocks out of the window are dropped
+
+    await monitor.refresh()  # no new block: nothing to fetch
+    assert len(indexer.fetched) == 2
+
+
+@pytest.mark.asyncio
+async def test_history_keeps_the_last_snapshots():
+    """History is a rolling window of refreshes, oldest first."""
+    indexer = FakeIndexer(height=3)
+    monitor = NetworkHealthMonitor(indexer, window=2, history_size=3)
+
+    for height in range(3, 8):
+        indexer.height = height
+        await monitor.refresh()
+
+    assert [point["latest_block"] for point in monitor.history] == [5, 6, 7]
+    assert all(point["success_rate"] == 66.67 for point in monitor.history)
+    assert monitor.stats()["refreshes"] == 5
+
+
+@pytest.mark.asyncio
+async def test_blocks_without_transactions_are_healthy():
+    """An idle chain is not reported unhealthy."""
+    monitor = NetworkHealthMonitor(FakeIndexer(height=4, stages=()), window=3)
+
+    snapshot = await monitor.refresh()
+
+    assert snapshot["total_transactions_checked"] == 0
+    assert snapshot["healthy"] is True
+    assert monitor.history[-1]["healthy"] is True
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_last_snapshot():
+    """When the indexer is down the previous snapshot is served with the error attached."""
+    indexer = FakeIndexer(height=5)
+    monitor = NetworkHealthMonitor(indexer, window=2)
+    await monitor.refresh()
+
+    indexer.down = True
+    with pytest.raises(IndexerError):
+        await monitor.refresh()
+
+    snapshot = monitor.snapshot()
+    assert snapshot["latest_block"] == 5
+    assert snapshot["error"].startswith("Indexer request failed")
@@ -2,5 +2,8 @@
 Utility modules for 0xGuard Midnight API
 """
 from .wallet import WalletUtils
+from .bridge_pool import BridgePool, BridgeError, BRIDGE_POOL_SIZE
+from .indexer import IndexerClient, IndexerError
+from .tx_index import TransactionIndex
 
-__all__ = ["WalletUtils"]
+__all__ = ["WalletUtils", "BridgePool", "BridgeError", "BRIDGE_POOL_SIZE", "IndexerClient", "IndexerError", "TransactionIndex"]
@@ -0,0 +1,215 @@
+"""
+Read-through cache of audit records and the ledger snapshot
+"""
+
+import os
+import json
+import time
+import hashlib
+import asyncio
+from collections import OrderedDict, deque
+from typing import Dict, Any, Optional, Tuple, Callable, Awaitable
+
+# Configuration
+AUDIT_MISS_TTL = float(os.getenv("AUDIT_MISS_TTL", "10"))  # seconds to remember "not found"
+LEDGER_CACHE_TTL = float(os.getenv("LEDGER_CACHE_TTL", "15"))  # seconds
+AUDIT_CACHE_SIZE = int(os.getenv("AUDIT_CACHE_SIZE", "10000"))  # audit records kept
+
+Fetch = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+def audit_record(result: Dict[str, Any], audit_id: str) -> Dict[str, Any]:
+    """Normalize a query_audit bridge result to the API's snake_case shape"""
+    if not result.get("found"):
+        return {"found": False}
+    return {
+        "found": True,
+        "audit_id": result.get("audit_id", result.get("auditId", audit_id)),
+        "proof_hash": result.get("proof_hash", result.get("proofHash")),
+        "is_verified": result.get("is_verified", result.get("isVerified")),
+    }
+
+
+def ledger_etag(ledger_state: Dict[str, Any]) -> str:
+    """Strong ETag of a serialized ledger snapshot"""
+    canonical = json.dumps(ledger_state, sort_keys=True, separators=(",", ":"))
+    return '"' + hashlib.sha256(canonical.encode()).hexdigest()[:32] + '"'
+
+
+class AuditCache:
+    """
+    In-process cache of audit records and the latest ledger snapshot
+
+    Audits are immutable once written, so found records are kept until the
+    contract changes or they are the least recently used of `max_audits`;
+    misses and the ledger snapshot expire after a short TTL. Concurrent reads
+    of the same key share one bridge call.
+    """
+
+    def __init__(
+        self,
+        miss_ttl: float = AUDIT_MISS_TTL,
+        ledger_ttl: float = LEDGER_CACHE_TTL,
+        max_audits: int = AUDIT_CACHE_SIZE,
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            miss_ttl: Seconds to cache an audit that was not found
+            ledger_ttl: Seconds to cache the ledger snapshot
+            max_audits: Audit records kept before the least recently used is dropped
+        """
+        self.miss_ttl = miss_ttl
+        self.ledger_ttl = ledger_ttl
+        self.max_audits = max(1, max_audits)
+        # audit_id -> (expires_at or None, record), least recently used first
+        self._audits: "OrderedDict[str, Tuple[Optional[float], Dict[str, Any]]]" = OrderedDict()
+        # (expires_at, audit_id) of cached misses, oldest first (the TTL is fixed)
+        self._miss_expiry: deque = deque()
+        self.evictions = 0
+        # (ledger_state, etag, expires_at)
+        self._ledger: Optional[Tuple[Dict[str, Any], str, float]] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        """Forget everything (e.g. after joining a different contract)"""
+        self._audits.clear()
+        self._miss_expiry.clear()
+        self._ledger = None
+
+    async def _single_flight(self, key: str, fetch: Fetch) -> Dict[str, Any]:
+        future = self._inflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fetch()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def get_audit(self, audit_id: str, fetch: Fetch) -> Dict[str, Any]:
+        """
+        Audit record, fetched through the bridge on a miss
+
+        Args:
+            audit_id: Audit ID
+            fetch: Runs query_audit for this audit
+
+        Returns:
+            Normalized audit record
+        """
+        entry = self._audits.get(audit_id)
+        if entry is not None and (entry[0] is None or entry[0] > time.time()):
+            self.hits += 1
+            self._audits.move_to_end(audit_id)
+            return entry[1]
+
+        self.misses += 1
+
+        async def load() -> Dict[str, Any]:
+            result = await fetch()
+            if result.get("success") is False and result.get("error"):
+                return audit_record(result, audit_id)  # Do not cache bridge errors
+            record = audit_record(result, audit_id)
+            expires_at = None if record["found"] else time.time() + self.miss_ttl
+            self._store(audit_id, expires_at, record)
+            return record
+
+        return await self._single_flight(f"audit:{audit_id}", load)
+
+    def _store(self, audit_id: str, expires_at: Optional[float], record: Dict[str, Any]) -> None:
+        # Drop expired misses first, then the least recently used records
+        now = time.time()
+        while self._miss_expiry and self._miss_expiry[0][0] <= now:
+            expired_at, key = self._miss_expiry.popleft()
+            entry = self._audits.get(key)
+            if entry is not None and entry[0] == expired_at:  # Not re-cached since
+                del self._audits[key]
+                self.evictions += 1
+
+        self._audits[audit_id] = (expires_at, record)
+        self._audits.move_to_end(audit_id)
+        if expires_at is not None:
+            self._miss_expiry.append((expires_at, audit_id))
+        while len(self._audits) > self.max_audits:
+            self._audits.popitem(last=False)
+            self.evictions += 1
+
+    async def get_ledger(self, fetch: Fetch) -> Tuple[Dict[str, Any], str]:
+        """
+        Ledger snapshot and its ETag, fetched through the bridge when stale
+
+        Args:
+            fetch: Runs get_ledger
+
+        Returns:
+            (bridge result, etag)
+        """
+        if self._ledger is not None and self._ledger[2] > time.time():
+            self.hits += 1
+            return self._ledger[0], self._ledger[1]
+
+        self.misses += 1
+
+        async def load() -> Dict[str, Any]:
+            result = await fetch()
+            if result.get("success"):
+                self._set_ledger(result)
+            return result
+
+        result = await self._single_flight("ledger", load)
+        return result, ledger_etag(result)
+
+    def _set_ledger(self, result: Dict[str, Any]) -> None:
+        self._ledger = (result, ledger_etag(result), time.time() + self.ledger_ttl)
+
+    def record_submission(self, audit_id: str, result: Dict[str, Any]) -> None:
+        """
+        Update the cache from a submit_audit result
+
+        Args:
+            audit_id: Submitted audit ID
+            result: Bridge result of submit_audit
+        """
+        if not result.get("success"):
+            return
+
+        ledger_state = result.get("ledger_state") or {}
+        proof_hash = (ledger_state.get("proofs") or {}).get(audit_id)
+        if proof_hash is not None:
+            is_verified = (ledger_state.get("is_verified") or {}).get(audit_id, True)
+            self._store(
+                audit_id,
+                None,
+                {"found": True, "audit_id": audit_id, "proof_hash": proof_hash, "is_verified": is_verified},
+            )
+        else:
+            # The snapshot does not expose the maps; the next read goes to the chain
+            self._audits.pop(audit_id, None)
+
+        if ledger_state:
+            self._set_ledger({"success": True, "ledger_state": ledger_state})
+        else:
+            self._ledger = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics"""
+        return {
+            "audits": len(self._audits),
+            "max_audits": self.max_audits,
+            "evictions": self.evictions,
+            "ledger_cached": self._ledger is not None and self._ledger[2] > time.time(),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
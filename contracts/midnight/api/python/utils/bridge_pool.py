@@ -0,0 +1,435 @@
+"""
+Pool of long-lived TypeScript bridge workers
+
+Each worker runs `tsx bridge.ts serve` and speaks line-delimited JSON-RPC 2.0
+over stdin/stdout, so contract operations no longer pay for a tsx start-up and
+a contract join on every request.
+
+With BRIDGE_WALLET_POOL each worker also submits with its own wallet
+(MIDNIGHT_WALLET_INDEX), so parallel submissions do not compete for coins.
+"""
+
+import os
+import json
+import time
+import asyncio
+import itertools
+from typing import Dict, Any, List, Optional
+from pathlib import Path
+
+# Configuration
+BRIDGE_POOL_SIZE = int(os.getenv("BRIDGE_POOL_SIZE", "2"))  # 0 disables the pool
+BRIDGE_REQUEST_TIMEOUT = float(os.getenv("BRIDGE_REQUEST_TIMEOUT", "300"))  # proofs are slow
+BRIDGE_HEALTH_INTERVAL = float(os.getenv("BRIDGE_HEALTH_INTERVAL", "30"))
+BRIDGE_PING_TIMEOUT = float(os.getenv("BRIDGE_PING_TIMEOUT", "5"))
+BRIDGE_TSX_BIN = os.getenv("BRIDGE_TSX_BIN", "/usr/bin/tsx")
+BRIDGE_WALLET_POOL = os.getenv("BRIDGE_WALLET_POOL", "false").lower() == "true"
+# Wallets at or below this native balance only get submissions when no other wallet is free
+BRIDGE_WALLET_MIN_BALANCE = int(os.getenv("BRIDGE_WALLET_MIN_BALANCE", "0"))
+# Top wallets up to this balance from the richest one (0 disables rebalancing)
+BRIDGE_WALLET_TARGET_BALANCE = int(os.getenv("BRIDGE_WALLET_TARGET_BALANCE", "0"))
+
+# Operations that spend from the worker's wallet
+WALLET_OPERATIONS = {"init", "submit_audit", "submit_audits", "transfer"}
+
+# Bridge responses can carry the full ledger state
+_STREAM_LIMIT = 64 * 1024 * 1024
+
+
+class BridgeError(Exception):
+    """A bridge request failed or the worker died"""
+
+
+class BridgeTimeoutError(BridgeError):
+    """A bridge request exceeded its timeout"""
+
+
+class BridgeWorker:
+    """One persistent bridge process"""
+
+    def __init__(
+        self,
+        worker_id: int,
+        tsx_bin: str,
+        script_path: Path,
+        cwd: Path,
+        env: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize a bridge worker
+
+        Args:
+            worker_id: Index of the worker in its pool
+            tsx_bin: Path to the tsx binary
+            script_path: Path to bridge.ts
+            cwd: Working directory for the process
+            env: Extra environment variables for the process
+        """
+        self.worker_id = worker_id
+        self.tsx_bin = tsx_bin
+        self.script_path = script_path
+        self.cwd = cwd
+        self.env = env or {}
+        # Latest wallet_status result (wallet pool only)
+        self.wallet: Optional[Dict[str, Any]] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.requests_served = 0
+        self.restarts = 0
+        self.started_at: Optional[float] = None
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader: Optional[asyncio.Task] = None
+        self._stderr: Optional[asyncio.Task] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self) -> None:
+        """Spawn the bridge process in serve mode"""
+        self.process = await asyncio.create_subprocess_exec(
+            self.tsx_bin,
+            str(self.script_path),
+            "serve",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(self.cwd),
+            env={**os.environ, **self.env} if self.env else None,
+            limit=_STREAM_LIMIT,
+        )
+        self.started_at = time.time()
+        self._reader = asyncio.create_task(self._read_responses())
+        self._stderr = asyncio.create_task(self._drain_stderr())
+
+    async def stop(self) -> None:
+        """Kill the process and fail any in-flight request"""
+        if self.alive:
+            self.process.kill()
+        if self.process is not None:
+            await self.process.wait()
+        for task in (self._reader, self._stderr):
+            if task is not None:
+                task.cancel()
+        await asyncio.gather(
+            *(t for t in (self._reader, self._stderr) if t is not None),
+            return_exceptions=True,
+        )
+        self._fail_pending(BridgeError("Bridge worker stopped"))
+
+    async def restart(self) -> None:
+        """Replace a crashed or hung process with a fresh one"""
+        await self.stop()
+        self.restarts += 1
+        await self.start()
+
+    async def call(self, method: str, params: Dict[str, Any], timeout: float) -> Any:
+        """
+        Send one JSON-RPC request and wait for its response
+
+        Args:
+            method: Bridge operation (or "ping")
+            params: Operation data
+            timeout: Seconds to wait for the response
+
+        Returns:
+            The JSON-RPC result
+        """
+        if not self.alive:
+            raise BridgeError("Bridge worker is not running")
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        line = json.dumps(
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+        )
+        try:
+            self.process.stdin.write(line.encode() + b"\n")
+            await self.process.stdin.drain()
+            response = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise BridgeTimeoutError(f"Bridge operation {method} timed out after {timeout:.0f}s")
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise BridgeError(f"Bridge worker pipe closed: {e}")
+        finally:
+            self._pending.pop(request_id, None)
+
+        if "error" in response:
+            raise BridgeError(response["error"].get("message", "Unknown bridge error"))
+        self.requests_served += 1
+        return response.get("result")
+
+    async def _read_responses(self) -> None:
+        try:
+            while True:
+                line = await self.process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    response = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Stray output from a dependency
+                future = self._pending.get(response.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            self._fail_pending(BridgeError("Bridge worker exited"))
+
+    async def _drain_stderr(self) -> None:
+        # The bridge logs to stderr; keep reading so the pipe never fills up
+        while await self.process.stderr.readline():
+            pass
+
+    def _fail_pending(self, error: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    @property
+    def balance(self) -> Optional[int]:
+        """Available native balance from the last wallet check (None if unknown)"""
+        if self.wallet and self.wallet.get("success"):
+            return int(self.wallet["available_balance"])
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "id": self.worker_id,
+            "wallet": self.wallet,
+            "pid": self.process.pid if self.process else None,
+            "alive": self.alive,
+            "requests_served": self.requests_served,
+            "restarts": self.restarts,
+            "uptime": round(time.time() - self.started_at, 1) if self.started_at else 0,
+        }
+
+
+def wallet_pool_problem(size: int) -> Optional[str]:
+    """
+    Why a pool of `size` workers cannot each get their own wallet, if it cannot
+
+    Worker i needs seed i of MIDNIGHT_WALLET_SEEDS or account i of MIDNIGHT_MNEMONIC;
+    a single MIDNIGHT_WALLET_SEED has no accounts, so every worker would share it.
+    """
+    seeds = os.getenv("MIDNIGHT_WALLET_SEEDS")
+    if seeds:
+        count = len([seed for seed in seeds.split(",") if seed.strip()])
+        if count < size:
+            return f"MIDNIGHT_WALLET_SEEDS has {count} seeds for {size} workers"
+        return None
+    if os.getenv("MIDNIGHT_MNEMONIC"):
+        return None
+    return "MIDNIGHT_WALLET_SEED alone gives every worker the same wallet"
+
+
+class BridgePool:
+    """Fixed-size pool of bridge workers with health checks and restart on crash"""
+
+    def __init__(
+        self,
+        api_root: Path,
+        size: int = BRIDGE_POOL_SIZE,
+        request_timeout: float = BRIDGE_REQUEST_TIMEOUT,
+        health_interval: float = BRIDGE_HEALTH_INTERVAL,
+        tsx_bin: str = BRIDGE_TSX_BIN,
+        wallet_pool: bool = BRIDGE_WALLET_POOL,
+        min_balance: int = BRIDGE_WALLET_MIN_BALANCE,
+        target_balance: int = BRIDGE_WALLET_TARGET_BALANCE,
+    ):
+        """
+        Initialize the pool
+
+        Args:
+            api_root: Root directory of the API (where ts/ folder is located)
+            size: Number of workers
+            request_timeout: Seconds before a request is abandoned and its worker restarted
+            health_interval: Seconds between pings of idle workers
+            tsx_bin: Path to the tsx binary
+            wallet_pool: Give every worker its own wallet
+            min_balance: Balance at or below which a wallet counts as drained
+            target_balance: Balance rebalancing tops wallets up to (0 disables it)
+        """
+        self.api_root = api_root
+        self.script_path = api_root / "ts/src" / "bridge.ts"
+        self.size = max(1, size)
+        self.request_timeout = request_timeout
+        self.health_interval = health_interval
+        self.tsx_bin = tsx_bin
+        self.wallet_pool = wallet_pool
+        self.min_balance = min_balance
+        self.target_balance = target_balance
+        self.workers: List[BridgeWorker] = []
+        self._idle: List[BridgeWorker] = []
+        self._available: Optional[asyncio.Condition] = None
+        self._health_task: Optional[asyncio.Task] = None
+        self.failed_health_checks = 0
+        self.rebalances = 0
+
+    @property
+    def running(self) -> bool:
+        return self._available is not None
+
+    async def start(self) -> None:
+        """Spawn all workers and the health check loop"""
+        if self.running:
+            return
+        self._available = asyncio.Condition()
+        if self.wallet_pool and self.size > 1:
+            problem = wallet_pool_problem(self.size)
+            if problem:
+                print(f"Wallet pool disabled, workers share one wallet: {problem}")
+                self.wallet_pool = False
+        for worker_id in range(self.size):
+            env = {"MIDNIGHT_WALLET_INDEX": str(worker_id)} if self.wallet_pool else None
+            worker = BridgeWorker(worker_id, self.tsx_bin, self.script_path, self.api_root, env)
+            await worker.start()
+            self.workers.append(worker)
+            self._idle.append(worker)
+        self._health_task = asyncio.create_task(self._health_loop())
+
+    async def stop(self) -> None:
+        """Stop the health checks and kill all workers"""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            await asyncio.gather(self._health_task, return_exceptions=True)
+            self._health_task = None
+        await asyncio.gather(*(worker.stop() for worker in self.workers))
+        self.workers = []
+        self._idle = []
+        self._available = None
+
+    def _pick(self, spends: bool) -> Optional[BridgeWorker]:
+        if not self._idle:
+            return None
+        if not (spends and self.wallet_pool):
+            return self._idle[0]
+        # Richest idle wallet; unknown balances rank with funded ones, drained wallets last
+        def rank(worker: BridgeWorker):
+            balance = worker.balance
+            if balance is None:
+                return (1, 0)
+            return (2 if balance > self.min_balance else 0, balance)
+
+        return max(self._idle, key=rank)
+
+    async def _acquire(self, spends: bool) -> BridgeWorker:
+        async with self._available:
+            await self._available.wait_for(lambda: self._pick(spends) is not None)
+            worker = self._pick(spends)
+            self._idle.remove(worker)
+            return worker
+
+    async def _release(self, worker: BridgeWorker) -> None:
+        if not self.running:
+            return
+        async with self._available:
+            self._idle.append(worker)
+            self._available.notify_all()
+
+    async def call(
+        self, operation: str, data: Dict[str, Any], timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Run a contract operation on an idle worker
+
+        Submissions go to the idle worker whose wallet has the most free balance.
+
+        Args:
+            operation: Operation name (init, submit_audit, query_audit, get_ledger, ...)
+            data: Operation data
+            timeout: Per-request timeout (defaults to request_timeout)
+
+        Returns:
+            Operation result
+        """
+        if not self.running:
+            raise BridgeError("Bridge pool is not running")
+
+        worker = await self._acquire(operation in WALLET_OPERATIONS)
+        try:
+            if not worker.alive:
+                await worker.restart()
+            return await worker.call(operation, data, timeout or self.request_timeout)
+        except BridgeError:
+            # A hung or crashed worker may still hold half a response; start clean
+            if self.running:
+                await worker.restart()
+            raise
+        finally:
+            if operation in WALLET_OPERATIONS and self.wallet_pool:
+                worker.wallet = None  # Spent coins; re-read on the next health check
+            await self._release(worker)
+
+    async def _take(self, worker: BridgeWorker) -> bool:
+        """Take a specific worker out of the idle list if it is idle right now"""
+        async with self._available:
+            if worker not in self._idle:
+                return False
+            self._idle.remove(worker)
+            return True
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            # Check one idle worker at a time so the others keep serving requests
+            for worker in list(self.workers):
+                if not await self._take(worker):
+                    continue  # Busy; checked next time
+                try:
+                    await worker.call("ping", {}, BRIDGE_PING_TIMEOUT)
+                    if self.wallet_pool:
+                        worker.wallet = await worker.call(
+                            "wallet_status", {}, self.request_timeout
+                        )
+                except BridgeError:
+                    self.failed_health_checks += 1
+                    worker.wallet = None
+                    try:
+                        await worker.restart()
+                    except OSError:
+                        pass  # Retried on the next health check or request
+                finally:
+                    await self._release(worker)
+            if self.wallet_pool and self.target_balance > 0:
+                await self._rebalance()
+
+    async def _rebalance(self) -> None:
+        """Top up the poorest wallet from the richest one, one transfer per health check"""
+        known = [worker for worker in self.workers if worker.balance is not None]
+        if len(known) < 2:
+            return
+        poorest = min(known, key=lambda worker: worker.balance)
+        richest = max(known, key=lambda worker: worker.balance)
+        amount = self.target_balance - poorest.balance
+        if amount <= 0 or richest.balance - amount < self.target_balance:
+            return
+        receiver = poorest.wallet["address"]
+        # Only the sending worker is held; the receiver keeps serving requests
+        if not await self._take(richest):
+            return
+        try:
+            result = await richest.call(
+                "transfer",
+                {"receiver_address": receiver, "amount": str(amount)},
+                self.request_timeout,
+            )
+        except BridgeError:
+            return
+        finally:
+            await self._release(richest)
+        if result.get("success"):
+            self.rebalances += 1
+            richest.wallet = poorest.wallet = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool status for the health endpoint"""
+        return {
+            "size": self.size,
+            "running": self.running,
+            "idle": len(self._idle),
+            "wallet_pool": self.wallet_pool,
+            "failed_health_checks": self.failed_health_checks,
+            "rebalances": self.rebalances,
+            "workers": [worker.stats() for worker in self.workers],
+        }
@@ -0,0 +1,233 @@
+"""
+Native async client for the Midnight indexer GraphQL API
+"""
+
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+import httpx
+
+# Configuration
+MIDNIGHT_INDEXER = os.getenv(
+    "MIDNIGHT_INDEXER", "https://indexer.testnet-02.midnight.network/api/v1/graphql"
+)
+INDEXER_TIMEOUT = float(os.getenv("INDEXER_TIMEOUT", "15"))
+INDEXER_BATCH_SIZE = int(os.getenv("INDEXER_BATCH_SIZE", "50"))  # lookups per GraphQL request
+INDEXER_TX_CACHE_SIZE = int(os.getenv("INDEXER_TX_CACHE_SIZE", "100000"))
+INDEXER_PENDING_TTL = float(os.getenv("INDEXER_PENDING_TTL", "5"))  # seconds
+
+TRANSACTION_FIELDS = """
+    hash
+    protocolVersion
+    applyStage
+    identifiers
+    block {
+      height
+      timestamp
+      hash
+    }
+"""
+
+# Offset argument per lookup type
+SEARCH_TYPES = {"hash": "hash", "identifier": "identifier"}
+
+
+class IndexerError(Exception):
+    """The indexer returned an error or could not be reached"""
+
+
+class IndexerClient:
+    """
+    Pooled GraphQL client for the indexer with a transaction cache
+
+    Transactions included in a block are immutable and cached until evicted by
+    size; unknown transactions are cached for a short TTL so repeated polling of
+    a pending transaction does not hit the indexer on every request.
+    """
+
+    def __init__(
+        self,
+        url: str = MIDNIGHT_INDEXER,
+        timeout: float = INDEXER_TIMEOUT,
+        batch_size: int = INDEXER_BATCH_SIZE,
+        cache_size: int = INDEXER_TX_CACHE_SIZE,
+        pending_ttl: float = INDEXER_PENDING_TTL,
+    ):
+        """
+        Initialize the client
+
+        Args:
+            url: Indexer GraphQL HTTP endpoint
+            timeout: Request timeout in seconds
+            batch_size: Maximum lookups per GraphQL request
+            cache_size: Maximum cached transactions
+            pending_ttl: Seconds to cache a transaction that is not in a block yet
+        """
+        self.url = url
+        self.timeout = timeout
+        self.batch_size = max(1, batch_size)
+        self.cache_size = cache_size
+        self.pending_ttl = pending_ttl
+        self._client: Optional[httpx.AsyncClient] = None
+        # (search_type, tx_id) -> (expires_at or None for finalized, transactions)
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[Optional[float], List[Dict[str, Any]]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def query(
+        self, query: str, variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run a GraphQL query
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+
+        Returns:
+            The `data` object of the response
+        """
+        try:
+            response = await self._get_client().post(
+                self.url, json={"query": query, "variables": variables or {}}
+            )
+            response.raise_for_status()
+            body = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            raise IndexerError(f"Indexer request failed: {e}")
+
+        if body.get("errors"):
+            raise IndexerError(body["errors"][0].get("message", "Unknown indexer error"))
+        return body.get("data") or {}
+
+    async def get_latest_block(self) -> Dict[str, Any]:
+        """
+        Latest block known to the indexer
+
+        Returns:
+            {"height", "hash", "timestamp"}
+        """
+        data = await self.query("query { block { height hash timestamp } }")
+        block = data.get("block")
+        if not block:
+            raise IndexerError("Indexer returned no block")
+        return block
+
+    async def get_block(self, height: int) -> Dict[str, Any]:
+        """
+        Block at a given height
+
+        Returns:
+            {"height", "hash", "timestamp"}
+        """
+        data = await self.query(
+            f"query {{ block(offset: {{height: {int(height)}}}) {{ height hash timestamp }} }}"
+        )
+        block = data.get("block")
+        if not block:
+            raise IndexerError(f"Indexer has no block {height}")
+        return block
+
+    async def get_transaction(
+        self, tx_id: str, search_type: str = "hash"
+    ) -> List[Dict[str, Any]]:
+        """
+        Look up one transaction
+
+        Args:
+            tx_id: Transaction hash or identifier
+            search_type: "hash" or "identifier"
+
+        Returns:
+            Matching transactions (empty if not found)
+        """
+        results = await self.get_transactions([tx_id], search_type)
+        return results[tx_id]
+
+    async def get_transactions(
+        self, tx_ids: List[str], search_type: str = "hash"
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Look up many transactions, batching cache misses into aliased queries
+
+        Args:
+            tx_ids: Transaction hashes or identifiers
+            search_type: "hash" or "identifier"
+
+        Returns:
+            Mapping of each ID to its matching transactions (empty if not found)
+        """
+        if search_type not in SEARCH_TYPES:
+            raise ValueError(f"Unknown search type: {search_type}")
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        missing: List[str] = []
+        for tx_id in dict.fromkeys(tx_ids):
+            cached = self._cache_get((search_type, tx_id))
+            if cached is None:
+                missing.append(tx_id)
+            else:
+                results[tx_id] = cached
+
+        for start in range(0, len(missing), self.batch_size):
+            chunk = missing[start:start + self.batch_size]
+            fetched = await self._fetch_chunk(chunk, search_type)
+            for tx_id, transactions in fetched.items():
+                self._cache_put((search_type, tx_id), transactions)
+                results[tx_id] = transactions
+        return results
+
+    async def _fetch_chunk(
+        self, tx_ids: List[str], search_type: str
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        offset_key = SEARCH_TYPES[search_type]
+        params = ", ".join(f"$v{i}: String!" for i in range(len(tx_ids)))
+        selections = "\n".join(
+            f"t{i}: transactions(offset: {{{offset_key}: $v{i}}}) {{{TRANSACTION_FIELDS}}}"
+            for i in range(len(tx_ids))
+        )
+        query = f"query LookupTransactions({params}) {{\n{selections}\n}}"
+        data = await self.query(query, {f"v{i}": tx_id for i, tx_id in enumerate(tx_ids)})
+        return {tx_id: data.get(f"t{i}") or [] for i, tx_id in enumerate(tx_ids)}
+
+    def _cache_get(self, key: Tuple[str, str]) -> Optional[List[Dict[str, Any]]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, transactions = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._cache[key]
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return transactions
+
+    def _cache_put(self, key: Tuple[str, str], transactions: List[Dict[str, Any]]) -> None:
+        finalized = bool(transactions) and all(tx.get("block") for tx in transactions)
+        expires_at = None if finalized else time.time() + self.pending_ttl
+        self._cache[key] = (expires_at, transactions)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics"""
+        return {"cached": len(self._cache), "hits": self.hits, "misses": self.misses}
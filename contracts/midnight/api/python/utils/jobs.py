@@ -0,0 +1,234 @@
+"""
+Persistent background jobs for slow contract operations
+"""
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import asyncio
+from typing import Dict, List, Any, Optional, Callable, Awaitable
+from pathlib import Path
+
+# Configuration
+JOBS_DB_PATH = os.getenv(
+    "JOBS_DB_PATH", str(Path(__file__).parent.parent.parent / ".jobs.db")
+)
+JOBS_CONCURRENCY = int(os.getenv("JOBS_CONCURRENCY", os.getenv("BRIDGE_POOL_SIZE", "2")))
+JOBS_MAX_WAIT = float(os.getenv("JOBS_MAX_WAIT", "60"))  # longest long-poll, seconds
+
+# Job states
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+TERMINAL_STATES = (JOB_SUCCEEDED, JOB_FAILED)
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+def job_id_for(operation: str, key: str) -> str:
+    """Deterministic job ID, so resubmitting the same work attaches to the same job"""
+    return hashlib.sha256(f"{operation}:{key}".encode()).hexdigest()[:32]
+
+
+class JobRunner:
+    """
+    SQLite-backed job queue with a bounded number of concurrent workers
+
+    Jobs that were queued or running when the API stopped are run again on the
+    next start. Submitting work whose job already exists returns that job, unless
+    it failed, in which case it is queued again. A handler result with
+    "success": false marks the job failed.
+    """
+
+    def __init__(self, path: str = JOBS_DB_PATH, concurrency: int = JOBS_CONCURRENCY):
+        """
+        Initialize the job runner
+
+        Args:
+            path: SQLite database file
+            concurrency: Jobs executed at once
+        """
+        self.path = path
+        self.concurrency = max(1, concurrency)
+        self.handlers: Dict[str, JobHandler] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._done: Dict[str, asyncio.Event] = {}
+
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                operation TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+        self._db.commit()
+
+    def register(self, operation: str, handler: JobHandler) -> None:
+        """Set the coroutine that executes jobs of an operation"""
+        self.handlers[operation] = handler
+
+    @property
+    def running(self) -> bool:
+        return self._queue is not None
+
+    async def start(self) -> None:
+        """Start the workers and requeue jobs interrupted by the last shutdown"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        rows = self._db.execute(
+            "SELECT id FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+            (JOB_QUEUED, JOB_RUNNING),
+        ).fetchall()
+        for row in rows:
+            self._set_status(row["id"], JOB_QUEUED)
+            self._queue.put_nowait(row["id"])
+        if rows:
+            print(f"Resuming {len(rows)} unfinished jobs")
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def stop(self) -> None:
+        """Stop the workers; unfinished jobs resume on the next start"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    def close(self) -> None:
+        """Close the database"""
+        self._db.close()
+
+    def submit(self, operation: str, key: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue an operation
+
+        Args:
+            operation: Registered operation name
+            key: Identity of the work (e.g. the audit ID) used to deduplicate
+            payload: Handler input
+
+        Returns:
+            The job (see get)
+        """
+        if operation not in self.handlers:
+            raise ValueError(f"Unknown job operation: {operation}")
+
+        job_id = job_id_for(operation, key)
+        now = time.time()
+        existing = self.get(job_id)
+        if existing is not None and existing["status"] != JOB_FAILED:
+            return existing
+
+        self._db.execute(
+            "INSERT OR REPLACE INTO jobs (id, operation, payload, status, attempts, created_at, updated_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                job_id,
+                operation,
+                json.dumps(payload),
+                JOB_QUEUED,
+                existing["attempts"] if existing else 0,
+                existing["created_at"] if existing else now,
+                now,
+            ),
+        )
+        self._db.commit()
+        if self._queue is not None:
+            self._queue.put_nowait(job_id)
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Current state of a job
+
+        Returns:
+            {"job_id", "operation", "status", "result", "error", "attempts",
+             "created_at", "updated_at"}; None if unknown
+        """
+        row = self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        return {
+            "job_id": row["id"],
+            "operation": row["operation"],
+            "status": row["status"],
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+            "attempts": row["attempts"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Wait up to timeout seconds for a job to finish
+
+        Returns:
+            The job in its latest state; None if unknown
+        """
+        job = self.get(job_id)
+        if job is None or job["status"] in TERMINAL_STATES or timeout <= 0:
+            return job
+        event = self._done.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), min(timeout, JOBS_MAX_WAIT))
+        except asyncio.TimeoutError:
+            pass
+        return self.get(job_id)
+
+    def stats(self) -> Dict[str, int]:
+        """Job counts by status"""
+        counts = {state: 0 for state in (JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, JOB_FAILED)}
+        for row in self._db.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"):
+            counts[row["status"]] = row["n"]
+        return counts
+
+    def _set_status(self, job_id: str, status: str, **fields: Any) -> None:
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        self._db.execute(
+            f"UPDATE jobs SET status = ?, updated_at = ?{', ' + assignments if fields else ''} WHERE id = ?",
+            (status, time.time(), *fields.values(), job_id),
+        )
+        self._db.commit()
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            row = self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None or row["status"] != JOB_QUEUED:
+                continue  # Already picked up through another queue entry
+            self._set_status(job_id, JOB_RUNNING, attempts=row["attempts"] + 1)
+            try:
+                result = await self.handlers[row["operation"]](json.loads(row["payload"]))
+                if result.get("success") is False:
+                    # The operation ran but was rejected; keep the result and allow a resubmit
+                    self._set_status(
+                        job_id, JOB_FAILED, result=json.dumps(result), error=result.get("error")
+                    )
+                else:
+                    self._set_status(job_id, JOB_SUCCEEDED, result=json.dumps(result), error=None)
+            except asyncio.CancelledError:
+                raise  # Left running; requeued on the next start
+            except Exception as e:
+                detail = getattr(e, "detail", None) or str(e)
+                self._set_status(job_id, JOB_FAILED, error=str(detail))
+            event = self._done.pop(job_id, None)
+            if event is not None:
+                event.set()
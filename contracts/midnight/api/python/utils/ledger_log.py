@@ -0,0 +1,276 @@
+"""
+Change log of AuditVerifier ledger entries, for incremental sync
+"""
+
+import os
+import sqlite3
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional
+from pathlib import Path
+
+# Configuration
+LEDGER_LOG_PATH = os.getenv(
+    "LEDGER_LOG_PATH", str(Path(__file__).parent.parent.parent / ".ledger-log.db")
+)
+LEDGER_CHANGES_PAGE_SIZE = int(os.getenv("LEDGER_CHANGES_PAGE_SIZE", "500"))
+LEDGER_CHANGES_MAX_PAGE_SIZE = 5000
+
+AUDIT_FIELDS = ("proof_hash", "is_verified", "auditor_id")
+
+# Indexer block timestamps are epoch milliseconds
+TIMESTAMP_UNITS_PER_SECOND = 1000
+
+
+def block_time(timestamp: Optional[Any]) -> Optional[str]:
+    """ISO 8601 (UTC) form of an indexer block timestamp"""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(
+        int(timestamp) / TIMESTAMP_UNITS_PER_SECOND, tz=timezone.utc
+    ).isoformat()
+
+
+def ledger_entries(ledger_state: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-audit view of a serialized ledger snapshot
+
+    Returns:
+        {audit_id: {"proof_hash", "is_verified", "auditor_id"}}
+    """
+    maps = {
+        "proof_hash": ledger_state.get("proofs") or {},
+        "is_verified": ledger_state.get("is_verified") or {},
+        "auditor_id": ledger_state.get("auditor_id") or {},
+    }
+    entries: Dict[str, Dict[str, Any]] = {}
+    for field, values in maps.items():
+        if not isinstance(values, dict):
+            continue
+        for audit_id, value in values.items():
+            entries.setdefault(audit_id, {name: None for name in AUDIT_FIELDS})[field] = value
+    return entries
+
+
+class LedgerLog:
+    """
+    Append-only log of audit inserts and updates, tagged with a block height
+
+    Submissions made through this API are logged at their transaction's block
+    height. Changes made elsewhere are found by diffing ledger snapshots and are
+    logged at the chain height the snapshot was taken at, which is never lower
+    than the height they actually landed at. Each change carries the timestamp
+    of the block it is logged at, when known.
+    """
+
+    def __init__(self, path: str = LEDGER_LOG_PATH):
+        """
+        Initialize the log
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        self._snapshot_etag: Optional[str] = None
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS changes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                block_height INTEGER NOT NULL,
+                audit_id TEXT NOT NULL,
+                proof_hash TEXT,
+                is_verified INTEGER,
+                auditor_id TEXT,
+                recorded_at REAL NOT NULL,
+                block_timestamp TEXT
+            );
+            CREATE INDEX IF NOT EXISTS changes_height ON changes (block_height, seq);
+            CREATE TABLE IF NOT EXISTS audits (
+                audit_id TEXT PRIMARY KEY,
+                proof_hash TEXT,
+                is_verified INTEGER,
+                auditor_id TEXT,
+                block_height INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value NOT NULL
+            );
+            """
+        )
+        columns = {row["name"] for row in self._db.execute("PRAGMA table_info(changes)")}
+        if "block_timestamp" not in columns:  # Log written before block timestamps
+            self._db.execute("ALTER TABLE changes ADD COLUMN block_timestamp TEXT")
+        self._db.commit()
+
+    def close(self) -> None:
+        """Close the database"""
+        self._db.close()
+
+    def set_contract(self, contract_address: str) -> None:
+        """Start a fresh log when the API switches to a different contract"""
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'contract'").fetchone()
+        if row is not None and row["value"] == contract_address:
+            return
+        self._db.execute("DELETE FROM changes")
+        self._db.execute("DELETE FROM audits")
+        self._db.execute("DELETE FROM meta")
+        self._db.execute("INSERT INTO meta (key, value) VALUES ('contract', ?)", (contract_address,))
+        self._db.commit()
+        self._snapshot_etag = None
+
+    @property
+    def synced_height(self) -> Optional[int]:
+        """Chain height of the last ledger snapshot recorded"""
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'synced_height'").fetchone()
+        return row["value"] if row else None
+
+    @property
+    def last_seq(self) -> int:
+        row = self._db.execute("SELECT MAX(seq) AS seq FROM changes").fetchone()
+        return row["seq"] or 0
+
+    def record(
+        self,
+        audit_id: str,
+        entry: Dict[str, Any],
+        block_height: int,
+        block_timestamp: Optional[str] = None,
+    ) -> bool:
+        """
+        Log an audit's current state if it differs from what was last logged
+
+        Args:
+            audit_id: Audit ID
+            entry: {"proof_hash", "is_verified", "auditor_id"}
+            block_height: Height the change landed at (or was observed at)
+            block_timestamp: ISO timestamp of that block
+
+        Returns:
+            bool: True if a change was logged
+        """
+        values = tuple(entry.get(field) for field in AUDIT_FIELDS)
+        values = (values[0], None if values[1] is None else int(bool(values[1])), values[2])
+        current = self._db.execute(
+            "SELECT proof_hash, is_verified, auditor_id FROM audits WHERE audit_id = ?",
+            (audit_id,),
+        ).fetchone()
+        if current is not None and tuple(current) == values:
+            return False
+
+        self._db.execute(
+            "INSERT INTO changes"
+            " (block_height, audit_id, proof_hash, is_verified, auditor_id, recorded_at, block_timestamp)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (block_height, audit_id, *values, time.time(), block_timestamp),
+        )
+        self._db.execute(
+            "INSERT OR REPLACE INTO audits (audit_id, proof_hash, is_verified, auditor_id, block_height)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (audit_id, *values, block_height),
+        )
+        return True
+
+    def record_snapshot(
+        self,
+        ledger_state: Dict[str, Any],
+        block_height: int,
+        etag: Optional[str] = None,
+        block_timestamp: Optional[str] = None,
+    ) -> int:
+        """
+        Log every audit that changed since the previous snapshot
+
+        Args:
+            ledger_state: Serialized ledger state
+            block_height: Chain height at or after the one the snapshot was taken at
+            etag: Snapshot ETag; the diff is skipped when it matches the last one
+            block_timestamp: ISO timestamp of the block at block_height
+
+        Returns:
+            int: Number of changes logged
+        """
+        logged = 0
+        if etag is None or etag != self._snapshot_etag:
+            logged = sum(
+                self.record(audit_id, entry, block_height, block_timestamp)
+                for audit_id, entry in ledger_entries(ledger_state).items()
+            )
+            self._snapshot_etag = etag
+        self._db.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_height', ?)",
+            (max(block_height, self.synced_height or 0),),
+        )
+        self._db.commit()
+        return logged
+
+    def record_submission(
+        self,
+        audit_id: str,
+        ledger_state: Dict[str, Any],
+        block_height: Optional[int],
+        block_timestamp: Optional[str] = None,
+    ) -> None:
+        """Log an audit submitted through this API at its transaction's height"""
+        entry = ledger_entries(ledger_state).get(audit_id)
+        if entry is None or block_height is None:
+            return  # Picked up by the next snapshot instead
+        self.record(audit_id, entry, block_height, block_timestamp)
+        self._db.commit()
+
+    def changes(
+        self,
+        since: Optional[int] = None,
+        cursor: Optional[str] = None,
+        limit: int = LEDGER_CHANGES_PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Changes after a block height, oldest first
+
+        Args:
+            since: Only changes logged at a block height above this
+            cursor: next_cursor of the previous page; continues exactly where it stopped
+            limit: Page size (capped at LEDGER_CHANGES_MAX_PAGE_SIZE)
+
+        Returns:
+            {"changes": [...], "next_cursor": str, "has_more": bool, "synced_height": int}
+        """
+        limit = max(1, min(limit, LEDGER_CHANGES_MAX_PAGE_SIZE))
+        clauses: List[str] = []
+        params: List[Any] = []
+        if cursor:
+            clauses.append("seq > ?")
+            params.append(int(cursor))
+        if since is not None:
+            clauses.append("block_height > ?")
+            params.append(since)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        rows = self._db.execute(
+            f"SELECT * FROM changes{where} ORDER BY seq LIMIT ?", (*params, limit + 1)
+        ).fetchall()
+
+        changes = [
+            {
+                "block_height": row["block_height"],
+                "block_timestamp": row["block_timestamp"],
+                "audit_id": row["audit_id"],
+                "proof_hash": row["proof_hash"],
+                "is_verified": None if row["is_verified"] is None else bool(row["is_verified"]),
+                "auditor_id": row["auditor_id"],
+            }
+            for row in rows[:limit]
+        ]
+        if changes:
+            next_cursor = rows[len(changes) - 1]["seq"]
+        else:
+            # Nothing new: continue from the end of the log
+            next_cursor = max(int(cursor or 0), self.last_seq)
+        return {
+            "changes": changes,
+            "next_cursor": str(next_cursor),
+            "has_more": len(rows) > limit,
+            "synced_height": self.synced_height,
+        }
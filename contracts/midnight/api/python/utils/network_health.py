@@ -0,0 +1,206 @@
+"""
+Background-refreshed Midnight network health
+"""
+
+import os
+import time
+import asyncio
+from collections import OrderedDict, deque
+from typing import Dict, List, Any, Optional
+
+from .indexer import IndexerClient, IndexerError
+
+# Configuration
+NETWORK_HEALTH_INTERVAL = float(os.getenv("NETWORK_HEALTH_INTERVAL", "15"))  # seconds
+NETWORK_HEALTH_BLOCKS = int(os.getenv("NETWORK_HEALTH_BLOCKS", "10"))  # recent blocks scanned
+NETWORK_HEALTH_HISTORY = int(os.getenv("NETWORK_HEALTH_HISTORY", "240"))  # snapshots kept
+
+# Indexer block timestamps are epoch milliseconds
+TIMESTAMP_UNITS_PER_SECOND = 1000
+
+SUCCESS_STAGE = "SucceedEntirely"
+
+BLOCK_FIELDS = """
+    height
+    hash
+    timestamp
+    transactions {
+      applyStage
+    }
+"""
+
+
+class NetworkHealthMonitor:
+    """
+    Periodically scans the latest blocks on the indexer and serves the result
+
+    Blocks are immutable, so the per-block transaction counts are kept and each
+    refresh only fetches blocks it has not seen yet, in one aliased query. A
+    rolling history of snapshots backs trend views. When a refresh fails the last
+    good snapshot is still served, with the error attached.
+    """
+
+    def __init__(
+        self,
+        indexer: IndexerClient,
+        interval: float = NETWORK_HEALTH_INTERVAL,
+        window: int = NETWORK_HEALTH_BLOCKS,
+        history_size: int = NETWORK_HEALTH_HISTORY,
+    ):
+        """
+        Initialize the monitor
+
+        Args:
+            indexer: Indexer client
+            interval: Seconds between refreshes
+            window: Number of recent blocks each snapshot covers
+            history_size: Number of snapshots kept for trends
+        """
+        self.indexer = indexer
+        self.interval = interval
+        self.window = max(1, window)
+        self.history: deque = deque(maxlen=history_size)
+        self.error: Optional[str] = None
+        self.refreshes = 0
+        self._latest: Optional[Dict[str, Any]] = None
+        # height -> {"height", "hash", "timestamp", "total", "succeeded"}
+        self._blocks: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start refreshing in the background"""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background refresh"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The last snapshot is still served, with the error attached
+                self.error = str(e)
+            await asyncio.sleep(self.interval)
+
+    async def _fetch_blocks(self, heights: List[int]) -> None:
+        selections = "\n".join(
+            f"b{i}: block(offset: {{height: {height}}}) {{{BLOCK_FIELDS}}}"
+            for i, height in enumerate(heights)
+        )
+        data = await self.indexer.query(f"query RecentBlocks {{\n{selections}\n}}")
+        for i, height in enumerate(heights):
+            block = data.get(f"b{i}")
+            if not block:
+                continue
+            stages = [tx.get("applyStage") for tx in block.get("transactions") or []]
+            self._blocks[height] = {
+                "height": height,
+                "hash": block.get("hash"),
+                "timestamp": block.get("timestamp"),
+                "total": len(stages),
+                "succeeded": sum(1 for stage in stages if stage == SUCCESS_STAGE),
+            }
+
+    async def refresh(self) -> Dict[str, Any]:
+        """
+        Scan the latest blocks now
+
+        Returns:
+            The new snapshot (see snapshot)
+        """
+        async with self._lock:
+            try:
+                latest = await self.indexer.get_latest_block()
+                height = int(latest["height"])
+                heights = [h for h in range(max(0, height - self.window + 1), height + 1)]
+                missing = [h for h in heights if h not in self._blocks]
+                if missing:
+                    await self._fetch_blocks(missing)
+            except IndexerError as e:
+                self.error = str(e)
+                raise
+
+            for old in [h for h in self._blocks if h < heights[0]]:
+                del self._blocks[old]
+            blocks = [self._blocks[h] for h in heights if h in self._blocks]
+
+            total = sum(block["total"] for block in blocks)
+            succeeded = sum(block["succeeded"] for block in blocks)
+            success_rate = (succeeded / total) * 100 if total > 0 else 0
+            # Blocks with no transactions at all say nothing bad about the network
+            healthy = success_rate > 50 if total > 0 else True
+            timestamps = [block["timestamp"] for block in blocks if block["timestamp"] is not None]
+            block_time = None
+            if len(timestamps) > 1:
+                block_time = (
+                    (timestamps[-1] - timestamps[0])
+                    / (len(timestamps) - 1)
+                    / TIMESTAMP_UNITS_PER_SECOND
+                )
+
+            now = time.time()
+            self._latest = {
+                "latest_block": height,
+                "block_hash": latest.get("hash"),
+                "timestamp": latest.get("timestamp"),
+                "total_transactions_checked": total,
+                "succeeded": succeeded,
+                "failed": total - succeeded,
+                "success_rate": f"{success_rate:.2f}",
+                "healthy": healthy,
+                "blocks_checked": len(blocks),
+                "average_block_time_seconds": block_time,
+                "updated_at": now,
+            }
+            self.history.append(
+                {
+                    "updated_at": now,
+                    "latest_block": height,
+                    "success_rate": round(success_rate, 2),
+                    "average_block_time_seconds": block_time,
+                    "healthy": healthy,
+                }
+            )
+            self.error = None
+            self.refreshes += 1
+            return self.snapshot()
+
+    def snapshot(self) -> Optional[Dict[str, Any]]:
+        """
+        Latest health snapshot with its age
+
+        Returns:
+            Snapshot fields plus "age_seconds" and "error"; None before the first
+            successful refresh
+        """
+        if self._latest is None:
+            return None
+        return {
+            **self._latest,
+            "age_seconds": time.time() - self._latest["updated_at"],
+            "error": self.error,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Short status for /health"""
+        latest = self.snapshot()
+        return {
+            "healthy": latest["healthy"] if latest else None,
+            "latest_block": latest["latest_block"] if latest else None,
+            "age_seconds": latest["age_seconds"] if latest else None,
+            "refreshes": self.refreshes,
+            "error": self.error,
+        }
@@ -0,0 +1,254 @@
+"""
+Local SQLite index of the wallet's transaction history
+"""
+
+import os
+import json
+import time
+import sqlite3
+import asyncio
+from typing import Dict, List, Any, Optional, Iterator, Tuple, Callable, Awaitable
+from pathlib import Path
+
+# Configuration
+TX_INDEX_PATH = os.getenv(
+    "TX_INDEX_PATH", str(Path(__file__).parent.parent.parent / ".tx-index.db")
+)
+TX_INDEX_SYNC_INTERVAL = float(os.getenv("TX_INDEX_SYNC_INTERVAL", "2"))  # seconds
+TX_INDEX_PAGE_SIZE = int(os.getenv("TX_INDEX_PAGE_SIZE", "50"))
+TX_INDEX_MAX_PAGE_SIZE = 500
+
+# Transaction types, from the wallet's net balance change
+TX_TYPE_RECEIVED = "received"
+TX_TYPE_SENT = "sent"
+TX_TYPE_NEUTRAL = "neutral"
+
+# Returns {"total": int, "entries": [...]} for history positions >= offset
+FetchHistory = Callable[[int], Awaitable[Dict[str, Any]]]
+# Returns {tx_hash: [indexer transaction, ...]}
+LookupBlocks = Callable[[List[str]], Awaitable[Dict[str, List[Dict[str, Any]]]]]
+
+
+def transaction_type(deltas: Dict[str, str]) -> str:
+    """Classify a transaction by the sum of its per-token balance changes"""
+    net = sum(int(amount) for amount in deltas.values())
+    if net > 0:
+        return TX_TYPE_RECEIVED
+    if net < 0:
+        return TX_TYPE_SENT
+    return TX_TYPE_NEUTRAL
+
+
+class TransactionIndex:
+    """
+    Incrementally synced, queryable copy of the wallet's transaction history
+
+    Rows are keyed by their position in the wallet's append-only history, which
+    is also the pagination cursor. Block height and timestamp are filled in from
+    the indexer, and re-checked on later syncs while a transaction is pending.
+    """
+
+    def __init__(self, path: str = TX_INDEX_PATH, sync_interval: float = TX_INDEX_SYNC_INTERVAL):
+        """
+        Initialize the index
+
+        Args:
+            path: SQLite database file
+            sync_interval: Minimum seconds between syncs triggered by reads
+        """
+        self.path = path
+        self.sync_interval = sync_interval
+        self.last_sync = 0.0
+        self._sync_lock = asyncio.Lock()
+
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS transactions (
+                seq INTEGER PRIMARY KEY,
+                tx_hash TEXT NOT NULL,
+                apply_stage TEXT,
+                type TEXT NOT NULL,
+                identifiers TEXT NOT NULL,
+                deltas TEXT NOT NULL,
+                block_height INTEGER,
+                block_timestamp INTEGER,
+                indexed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS transactions_hash ON transactions (tx_hash);
+            CREATE INDEX IF NOT EXISTS transactions_time ON transactions (block_timestamp);
+            CREATE INDEX IF NOT EXISTS transactions_type ON transactions (type, seq);
+            CREATE TABLE IF NOT EXISTS identifiers (
+                identifier TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                PRIMARY KEY (identifier, seq)
+            );
+            """
+        )
+        self._db.commit()
+
+    def close(self) -> None:
+        """Close the database"""
+        self._db.close()
+
+    @property
+    def count(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+
+    async def sync(self, fetch_history: FetchHistory, lookup_blocks: LookupBlocks, force: bool = False) -> int:
+        """
+        Append new history entries and resolve their blocks
+
+        Args:
+            fetch_history: Reads wallet history from a position onwards
+            lookup_blocks: Looks up transactions on the indexer by hash
+            force: Sync even if the last sync was less than sync_interval ago
+
+        Returns:
+            Number of new transactions indexed
+        """
+        async with self._sync_lock:
+            if not force and time.time() - self.last_sync < self.sync_interval:
+                return 0
+
+            offset = self.count
+            history = await fetch_history(offset)
+            entries = history.get("entries", [])
+            now = time.time()
+            for seq, entry in enumerate(entries, start=offset):
+                self._db.execute(
+                    "INSERT OR REPLACE INTO transactions"
+                    " (seq, tx_hash, apply_stage, type, identifiers, deltas, indexed_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        seq,
+                        entry["transaction_hash"],
+                        entry.get("apply_stage"),
+                        transaction_type(entry.get("deltas", {})),
+                        json.dumps(entry.get("identifiers", [])),
+                        json.dumps(entry.get("deltas", {})),
+                        now,
+                    ),
+                )
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO identifiers (identifier, seq) VALUES (?, ?)",
+                    [(identifier, seq) for identifier in entry.get("identifiers", [])],
+                )
+            self._db.commit()
+
+            await self._resolve_blocks(lookup_blocks)
+            self.last_sync = time.time()
+            return len(entries)
+
+    async def _resolve_blocks(self, lookup_blocks: LookupBlocks) -> None:
+        unresolved = [
+            row["tx_hash"]
+            for row in self._db.execute(
+                "SELECT DISTINCT tx_hash FROM transactions WHERE block_height IS NULL"
+            )
+        ]
+        if not unresolved:
+            return
+        found = await lookup_blocks(unresolved)
+        for tx_hash, transactions in found.items():
+            block = next((tx["block"] for tx in transactions if tx.get("block")), None)
+            if block is None:
+                continue
+            self._db.execute(
+                "UPDATE transactions SET block_height = ?, block_timestamp = ? WHERE tx_hash = ?",
+                (block.get("height"), block.get("timestamp"), tx_hash),
+            )
+        self._db.commit()
+
+    def _where(
+        self,
+        cursor: Optional[int],
+        from_timestamp: Optional[int],
+        to_timestamp: Optional[int],
+        tx_type: Optional[str],
+        identifier: Optional[str],
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if cursor is not None:
+            clauses.append("seq < ?")
+            params.append(cursor)
+        if from_timestamp is not None:
+            clauses.append("block_timestamp >= ?")
+            params.append(from_timestamp)
+        if to_timestamp is not None:
+            clauses.append("block_timestamp < ?")
+            params.append(to_timestamp)
+        if tx_type is not None:
+            clauses.append("type = ?")
+            params.append(tx_type)
+        if identifier is not None:
+            clauses.append("seq IN (SELECT seq FROM identifiers WHERE identifier = ?)")
+            params.append(identifier)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    @staticmethod
+    def _row(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "cursor": str(row["seq"]),
+            "hash": row["tx_hash"],
+            "apply_stage": row["apply_stage"],
+            "type": row["type"],
+            "identifiers": json.loads(row["identifiers"]),
+            "deltas": json.loads(row["deltas"]),
+            "block_height": row["block_height"],
+            "block_timestamp": row["block_timestamp"],
+        }
+
+    def page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = TX_INDEX_PAGE_SIZE,
+        from_timestamp: Optional[int] = None,
+        to_timestamp: Optional[int] = None,
+        tx_type: Optional[str] = None,
+        identifier: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        One page of transactions, newest first
+
+        Args:
+            cursor: next_cursor of the previous page (None for the first page)
+            limit: Page size (capped at TX_INDEX_MAX_PAGE_SIZE)
+            from_timestamp: Only transactions in blocks at or after this indexer timestamp
+            to_timestamp: Only transactions in blocks before this indexer timestamp
+            tx_type: Only transactions of this type (received, sent, neutral)
+            identifier: Only the transaction with this identifier
+
+        Returns:
+            {"transactions": [...], "next_cursor": str or None}
+        """
+        limit = max(1, min(limit, TX_INDEX_MAX_PAGE_SIZE))
+        where, params = self._where(
+            int(cursor) if cursor else None, from_timestamp, to_timestamp, tx_type, identifier
+        )
+        rows = self._db.execute(
+            f"SELECT * FROM transactions{where} ORDER BY seq DESC LIMIT ?", (*params, limit + 1)
+        ).fetchall()
+        transactions = [self._row(row) for row in rows[:limit]]
+        next_cursor = transactions[-1]["cursor"] if len(rows) > limit else None
+        return {"transactions": transactions, "next_cursor": next_cursor}
+
+    def iter_all(
+        self,
+        from_timestamp: Optional[int] = None,
+        to_timestamp: Optional[int] = None,
+        tx_type: Optional[str] = None,
+        identifier: Optional[str] = None,
+        chunk_size: int = TX_INDEX_MAX_PAGE_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield every matching transaction, newest first, reading in chunks"""
+        cursor = None
+        while True:
+            page = self.page(cursor, chunk_size, from_timestamp, to_timestamp, tx_type, identifier)
+            yield from page["transactions"]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return
@@ -2,12 +2,23 @@
 Wallet utilities for Midnight Network
 """
 
+import os
 import json
+import time
 import subprocess
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
 from pathlib import Path
 
+from .bridge_pool import BridgeWorker, BridgeError
+from .indexer import IndexerClient
+from .tx_index import TransactionIndex, TX_INDEX_PAGE_SIZE
+
+# Configuration
+WALLET_SERVICE_ENABLED = os.getenv("WALLET_SERVICE_ENABLED", "true").lower() == "true"
+# The first request after start-up waits for the wallet's initial state
+WALLET_SERVICE_TIMEOUT = float(os.getenv("WALLET_SERVICE_TIMEOUT", "120"))
+
 
 class WalletUtils:
     """Utilities for interacting with Midnight wallet"""
@@ -22,6 +33,56 @@ class WalletUtils:
         self.api_root = api_root
         # tsx is in the root workspace node_modules (/Users/godson/Desktop/0xguard/node_modules)
         self.tsx_bin = "/usr/bin/tsx"
+        # Long-running synced wallet session (ts/scripts/wallet-service.ts)
+        self.service: Optional[BridgeWorker] = None
+        self.indexer = IndexerClient()
+        # Local history index, synced from the wallet session
+        self.tx_index: Optional[TransactionIndex] = None
+
+    async def start_service(self) -> None:
+        """Start the background wallet session"""
+        if self.service is not None:
+            return
+        service = BridgeWorker(
+            0,
+            self.tsx_bin,
+            self.api_root / "ts/scripts/wallet-service.ts",
+            self.api_root,
+        )
+        await service.start()
+        self.service = service
+        self.tx_index = TransactionIndex()
+
+    async def stop_service(self) -> None:
+        """Stop the background wallet session"""
+        if self.service is not None:
+            await self.service.stop()
+            self.service = None
+        if self.tx_index is not None:
+            self.tx_index.close()
+            self.tx_index = None
+
+    async def _call_service(
+        self, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Read from the wallet session, restarting it if it has crashed
+
+        Args:
+            method: Wallet service method
+            params: Method parameters
+
+        Returns:
+            Result with `updated_at` and `staleness_seconds` of the wallet state
+        """
+        if not self.service.alive:
+            await self.service.restart()
+        try:
+            result = await self.service.call(method, params or {}, WALLET_SERVICE_TIMEOUT)
+        except BridgeError as e:
+            raise RuntimeError(f"Wallet service failed: {e}")
+        result["staleness_seconds"] = round(max(0.0, time.time() - result["updated_at"]), 3)
+        return result
 
     async def _run_ts_script(self, script_path: str) -> Dict[str, Any]:
         """
@@ -61,9 +122,13 @@ class WalletUtils:
                 "balances": Dict[str, int],
                 "available_coins": int,
                 "pending_coins": int,
-                "synced": bool
+                "synced": bool,
+                "updated_at": float,  # wallet session only
+                "staleness_seconds": float  # wallet session only
             }
         """
+        if self.service:
+            return await self._call_service("get_balance")
         return await self._run_ts_script("ts/scripts/get-balance.ts")
 
     async def get_transaction_history(self) -> List[Dict[str, Any]]:
@@ -73,6 +138,9 @@ class WalletUtils:
         Returns:
             List of transactions with details
         """
+        if self.service:
+            return await self._call_service("get_transaction_history")
+
         script = """
 import "dotenv/config";
 import { createWalletProviders, getWalletCredentials } from "./src/wallet-provider.js";
@@ -112,6 +180,61 @@ getTxHistory().catch(error => {
 """
         return await self._run_ts_script(script)
 
+    async def _sync_tx_index(self) -> None:
+        await self.tx_index.sync(
+            lambda offset: self._call_service("get_history_since", {"offset": offset}),
+            self.indexer.get_transactions,
+        )
+
+    async def get_transaction_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = TX_INDEX_PAGE_SIZE,
+        from_timestamp: Optional[int] = None,
+        to_timestamp: Optional[int] = None,
+        tx_type: Optional[str] = None,
+        identifier: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        One page of indexed transaction history, newest first
+
+        Requires the wallet session. The index is brought up to date with the
+        wallet before reading.
+
+        Args:
+            cursor: next_cursor of the previous page
+            limit: Page size
+            from_timestamp: Only transactions in blocks at or after this timestamp
+            to_timestamp: Only transactions in blocks before this timestamp
+            tx_type: "received", "sent" or "neutral"
+            identifier: Only the transaction with this identifier
+
+        Returns:
+            {"transactions": [...], "next_cursor": str or None, "transaction_count": int}
+        """
+        await self._sync_tx_index()
+        page = self.tx_index.page(
+            cursor, limit, from_timestamp, to_timestamp, tx_type, identifier
+        )
+        page["transaction_count"] = self.tx_index.count
+        return page
+
+    async def iter_transactions(
+        self,
+        from_timestamp: Optional[int] = None,
+        to_timestamp: Optional[int] = None,
+        tx_type: Optional[str] = None,
+        identifier: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Every matching indexed transaction, newest first, read lazily
+
+        Returns:
+            Iterator over transactions
+        """
+        await self._sync_tx_index()
+        return self.tx_index.iter_all(from_timestamp, to_timestamp, tx_type, identifier)
+
     async def query_transaction(
         self, tx_id: str, search_type: str = "hash"
     ) -> Optional[Dict[str, Any]]:
@@ -123,62 +246,31 @@ getTxHistory().catch(error => {
             search_type: "hash" or "identifier"
 
         Returns:
-            Transaction details if found, None otherwise
+            {"found": True, "transaction": [...]} if found, {"found": False} otherwise
         """
-        script = f"""
-import "dotenv/config";
-import {{ getConfig }} from "./src/config.js";
-
-async function queryTransaction() {{
-  const config = getConfig("testnet");
-  const indexerUrl = config.indexer;
-  const txId = "{tx_id}";
-
-  const query = `
-    query GetTransaction($hash: String!) {{
-      transactions(offset: {{hash: $hash}}) {{
-        hash
-        protocolVersion
-        applyStage
-        identifiers
-        block {{
-          height
-          timestamp
-          hash
-        }}
-      }}
-    }}
-  `;
-
-  const response = await fetch(indexerUrl, {{
-    method: "POST",
-    headers: {{ "Content-Type": "application/json" }},
-    body: JSON.stringify({{
-      query,
-      variables: {{ hash: txId }}
-    }})
-  }});
-
-  const data = await response.json();
-
-  if (data.data?.transactions) {{
-    console.log(JSON.stringify({{
-      found: true,
-      transaction: data.data.transactions
-    }}));
-  }} else {{
-    console.log(JSON.stringify({{ found: false }}));
-  }}
+        transactions = await self.indexer.get_transaction(tx_id, search_type)
+        if transactions:
+            return {"found": True, "transaction": transactions}
+        return {"found": False}
+
+    async def query_transactions(
+        self, tx_ids: List[str], search_type: str = "hash"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Query many transactions in as few indexer requests as possible
 
-  process.exit(0);
-}}
+        Args:
+            tx_ids: Transaction hashes or identifiers
+            search_type: "hash" or "identifier"
 
-queryTransaction().catch(error => {{
-  console.error(JSON.stringify({{ error: error.message }}));
-  process.exit(1);
-}});
-"""
-        return await self._run_ts_script(script)
+        Returns:
+            Mapping of each ID to the same shape as query_transaction
+        """
+        results = await self.indexer.get_transactions(tx_ids, search_type)
+        return {
+            tx_id: {"found": True, "transaction": transactions} if transactions else {"found": False}
+            for tx_id, transactions in results.items()
+        }
 
     async def get_address(self) -> str:
         """
@@ -187,6 +279,9 @@ queryTransaction().catch(error => {{
         Returns:
             Midnight address string
         """
+        if self.service:
+            result = await self._call_service("get_address")
+            return result["address"]
         result = await self._run_ts_script("ts/scripts/get-address.ts")
         return result["address"]
 
@@ -0,0 +1,195 @@
+#!/usr/bin/env tsx
+/**
+ * Long-running wallet service for the Python API
+ *
+ * Builds the wallet once, keeps it syncing in the background and answers
+ * line-delimited JSON-RPC 2.0 requests on stdin/stdout from the latest wallet
+ * state. Every result carries `updated_at` (epoch seconds of the state it was
+ * built from).
+ *
+ * Methods: ping, get_address, get_balance, get_transaction_history,
+ *          get_history_since ({offset}: history entries from that position on)
+ */
+import "dotenv/config";
+import { createInterface } from "readline";
+import type { WalletState } from "@midnight-ntwrk/wallet-api";
+import { createWalletProviders, getWalletCredentials } from "../src/wallet-provider.js";
+import { getConfig } from "../src/config.js";
+
+// stdout carries JSON-RPC responses only
+console.log = console.error;
+console.info = console.error;
+
+interface WalletSnapshot {
+  balances: Record<string, string>;
+  available_coins: number;
+  pending_coins: number;
+  total_coins: number;
+  synced: boolean;
+  transactions: any[];
+  history: HistoryEntry[];
+  updated_at: number;
+}
+
+interface HistoryEntry {
+  transaction_hash: string;
+  apply_stage: string;
+  identifiers: string[];
+  deltas: Record<string, string>;
+}
+
+function historyEntry(entry: any): HistoryEntry {
+  const deltas: Record<string, string> = {};
+  if (entry.deltas instanceof Map) {
+    for (const [token, amount] of entry.deltas.entries()) {
+      deltas[token] = String(amount);
+    }
+  }
+  return {
+    transaction_hash: String(entry.transactionHash ?? ""),
+    apply_stage: String(entry.applyStage ?? ""),
+    identifiers: (entry.identifiers ?? []).map(String),
+    deltas,
+  };
+}
+
+let address = "";
+let latest: WalletSnapshot | null = null;
+let resolveFirstState: () => void;
+const firstState = new Promise<void>((resolve) => (resolveFirstState = resolve));
+
+function toJson(value: any): any {
+  return JSON.parse(
+    JSON.stringify(value, (k, v) => (typeof v === "bigint" ? v.toString() : v))
+  );
+}
+
+function snapshot(state: WalletState): WalletSnapshot {
+  const balances: Record<string, string> = {};
+  if (state.balances instanceof Map) {
+    for (const [token, amount] of state.balances.entries()) {
+      balances[token] = String(amount);
+    }
+  } else if (state.balances && typeof state.balances === "object") {
+    for (const [token, amount] of Object.entries(state.balances)) {
+      balances[token] = String(amount);
+    }
+  }
+  const syncProgress = (state as any).syncProgress;
+
+  return {
+    balances,
+    available_coins: state.availableCoins.length,
+    pending_coins: state.pendingCoins.length,
+    total_coins: state.coins.length,
+    // Same rule as get-balance.ts: usable once balances arrive, even mid-sync
+    synced: Boolean(syncProgress?.synced) || Object.keys(balances).length > 0,
+    transactions: toJson(state.transactionHistory),
+    // The wallet appends to its history, so positions are stable sync cursors
+    history: state.transactionHistory.map(historyEntry),
+    updated_at: Date.now() / 1000,
+  };
+}
+
+async function startWallet(): Promise<void> {
+  const config = getConfig("testnet");
+  config.setNetworkId();
+
+  const { wallet, address: walletAddress } = await createWalletProviders(
+    {
+      indexer: config.indexer,
+      indexerWS: config.indexerWS,
+      node: config.node,
+      proofServer: config.proofServer,
+      networkId: config.networkId,
+    },
+    getWalletCredentials()
+  );
+  address = walletAddress;
+
+  wallet.state().subscribe({
+    next: (state) => {
+      latest = snapshot(state);
+      resolveFirstState();
+    },
+    error: (error) => {
+      console.error(`Wallet state stream failed: ${error}`);
+      process.exit(1);
+    },
+  });
+}
+
+async function handle(method: string, params: any): Promise<any> {
+  if (method === "ping") {
+    return { success: true, ready: latest !== null, pid: process.pid };
+  }
+
+  await firstState;
+  const state = latest!;
+  switch (method) {
+    case "get_address":
+      return { address, updated_at: state.updated_at };
+    case "get_balance":
+      return {
+        address,
+        balances: state.balances,
+        available_coins: state.available_coins,
+        pending_coins: state.pending_coins,
+        total_coins: state.total_coins,
+        synced: state.synced,
+        updated_at: state.updated_at,
+      };
+    case "get_transaction_history":
+      return {
+        address,
+        transaction_count: state.transactions.length,
+        transactions: state.transactions,
+        updated_at: state.updated_at,
+      };
+    case "get_history_since": {
+      const offset = Math.max(0, Number(params?.offset ?? 0));
+      return {
+        offset,
+        total: state.history.length,
+        entries: state.history.slice(offset),
+        updated_at: state.updated_at,
+      };
+    }
+    default:
+      throw new Error(`Unknown method: ${method}`);
+  }
+}
+
+async function serve() {
+  const lines = createInterface({ input: process.stdin, terminal: false });
+  // Requests only read the in-memory snapshot, so they are answered concurrently
+  for await (const line of lines) {
+    if (!line.trim()) {
+      continue;
+    }
+    let request: any;
+    try {
+      request = JSON.parse(line);
+    } catch {
+      process.stdout.write(
+        JSON.stringify({ jsonrpc: "2.0", id: null, error: { code: -32700, message: "Parse error" } }) + "\n"
+      );
+      continue;
+    }
+    handle(request.method, request.params)
+      .then((result) => ({ jsonrpc: "2.0", id: request.id, result }))
+      .catch((error) => ({
+        jsonrpc: "2.0",
+        id: request.id,
+        error: { code: -32000, message: error instanceof Error ? error.message : String(error) },
+      }))
+      .then((response) => process.stdout.write(JSON.stringify(response) + "\n"));
+  }
+  process.exit(0);
+}
+
+startWallet().catch((error) => {
+  console.error(JSON.stringify({ error: error instanceof Error ? error.message : String(error) }));
+  process.exit(1);
+});
+serve();
@@ -11,7 +11,7 @@ import { httpClientProofProvider } from "@midnight-ntwrk/midnight-js-http-client
 import { NodeZkConfigProvider } from "@midnight-ntwrk/midnight-js-node-zk-config-provider";
 import { getLedgerNetworkId, getZswapNetworkId } from "@midnight-ntwrk/midnight-js-network-id";
 import { createBalancedTx } from "@midnight-ntwrk/midnight-js-types";
-import { Transaction } from "@midnight-ntwrk/ledger";
+import { Transaction, nativeToken } from "@midnight-ntwrk/ledger";
 import { Transaction as ZswapTransaction } from "@midnight-ntwrk/zswap";
 import type { Logger } from "pino";
 import type { Config } from "./config.js";
@@ -20,8 +20,11 @@ import * as Rx from "rxjs";
 import type {
   SubmitAuditRequest,
   SubmitAuditResponse,
+  SubmitAuditsResponse,
+  AuditSubmissionResult,
   QueryAuditRequest,
   QueryAuditResponse,
+  WalletStatus,
 } from "./types.js";
 
 
@@ -31,6 +34,8 @@ export class AuditVerifierAPI {
   private providers: any;
   private logger: Logger;
   private _contractAddress: string = "";
+  private wallet: any = null;
+  private walletAddress: string = "";
 
   private constructor(providers: any, logger: Logger) {
     this.contract = new Contract<AuditPrivateState>(witnesses);
@@ -130,6 +135,7 @@ export class AuditVerifierAPI {
     logger.info({ contractAddress }, "Setting up providers...");
 
     let walletProvider: any;
+    let joinedWallet: { wallet: any; address: string } | null = null;
 
     if (useWallet) {
       const credentials = getWalletCredentials();
@@ -144,6 +150,7 @@ export class AuditVerifierAPI {
         credentials
       );
       const wallet = result.wallet;
+      joinedWallet = { wallet, address: result.address };
 
       // Create proper wallet provider with transaction serialization
       const walletState = await Rx.firstValueFrom(wallet.state());
@@ -187,6 +194,10 @@ export class AuditVerifierAPI {
     };
 
     const api = new AuditVerifierAPI(providers, logger);
+    if (joinedWallet) {
+      api.wallet = joinedWallet.wallet;
+      api.walletAddress = joinedWallet.address;
+    }
 
     logger.info("Finding contract...");
 
@@ -210,6 +221,35 @@ export class AuditVerifierAPI {
   }
 
   async submitAudit(request: SubmitAuditRequest): Promise<SubmitAuditResponse> {
+    const result = await this.callSubmitAudit(request);
+    const state = await this.providers.publicDataProvider.queryContractState(this._contractAddress);
+    const ledgerState = ledger(state.data);
+
+    return {
+      success: result.success,
+      transactionId: result.transactionId,
+      blockHeight: result.blockHeight,
+      error: result.error,
+      ledgerState,
+    };
+  }
+
+  /**
+   * Submit several audits with the same providers, proving keys and wallet.
+   * The circuit records one audit per call, so each audit is its own
+   * transaction; they are sent in order and the ledger is read once at the end.
+   */
+  async submitAudits(requests: SubmitAuditRequest[]): Promise<SubmitAuditsResponse> {
+    const results: AuditSubmissionResult[] = [];
+    for (const request of requests) {
+      results.push(await this.callSubmitAudit(request));
+    }
+
+    const state = await this.providers.publicDataProvider.queryContractState(this._contractAddress);
+    return { results, ledgerState: ledger(state.data) };
+  }
+
+  private async callSubmitAudit(request: SubmitAuditRequest): Promise<AuditSubmissionResult> {
     try {
       this.logger.info({ auditId: request.auditId }, "Submitting audit with ZK proof...");
 
@@ -250,14 +290,11 @@ export class AuditVerifierAPI {
         "Audit submitted with ZK proof"
       );
 
-      const state = await this.providers.publicDataProvider.queryContractState(this._contractAddress);
-      const ledgerState = ledger(state.data);
-
       return {
+        auditId: request.auditId,
         success: true,
         transactionId: txData.public.txHash,
         blockHeight: txData.public.blockHeight,
-        ledgerState,
       };
     } catch (error) {
       this.logger.error({
@@ -267,13 +304,10 @@ export class AuditVerifierAPI {
         errorType: error?.constructor?.name
       }, "Failed to submit audit");
 
-      const state = await this.providers.publicDataProvider.queryContractState(this._contractAddress);
-      const ledgerState = ledger(state.data);
-
       return {
+        auditId: request.auditId,
         success: false,
         error: error instanceof Error ? error.message : String(error),
-        ledgerState,
       };
     }
   }
@@ -306,6 +340,37 @@ export class AuditVerifierAPI {
     }
   }
 
+  /**
+   * Balance and coin state of the wallet this API submits with (joined with useWallet)
+   */
+  async walletStatus(): Promise<WalletStatus> {
+    if (!this.wallet) {
+      throw new Error("API was joined without a wallet");
+    }
+    const state: any = await Rx.firstValueFrom(this.wallet.state());
+    const balance = state.balances?.[nativeToken()] ?? 0n;
+    return {
+      address: this.walletAddress,
+      availableBalance: BigInt(balance),
+      availableCoins: state.availableCoins.length,
+      pendingCoins: state.pendingCoins.length,
+    };
+  }
+
+  /**
+   * Send native tokens from this API's wallet to another address (wallet pool rebalancing)
+   */
+  async transfer(receiverAddress: string, amount: bigint): Promise<string> {
+    if (!this.wallet) {
+      throw new Error("API was joined without a wallet");
+    }
+    const recipe = await this.wallet.transferTransaction([
+      { amount, receiverAddress, type: nativeToken() },
+    ]);
+    const tx = await this.wallet.proveTransaction(recipe);
+    return this.wallet.submitTransaction(tx);
+  }
+
   async getLedgerState(): Promise<Ledger> {
     const state = await this.providers.publicDataProvider.queryContractState(this._contractAddress);
     return ledger(state.data);
@@ -3,6 +3,12 @@
  *
  * This script is called by the Python FastAPI to perform contract operations
  * Usage: tsx bridge.ts <operation> <json-data>
+ *        tsx bridge.ts serve
+ *
+ * In serve mode the bridge stays alive and reads line-delimited JSON-RPC 2.0
+ * requests ({"jsonrpc": "2.0", "id", "method", "params"}) from stdin, writing one
+ * response line per request to stdout. Joined contract APIs are reused between
+ * requests, so providers and the wallet are only set up once per worker.
  */
 
 import "dotenv/config";
@@ -11,6 +17,7 @@ import { promises as fs } from "fs";
 import { join } from "path";
 import { fileURLToPath } from "url";
 import { dirname } from "path";
+import { createInterface } from "readline";
 import { AuditVerifierAPI } from "./api.js";
 import { getConfig } from "./config.js";
 import type { Ledger } from "../../../build/contract/index.cjs";
@@ -27,6 +34,13 @@ interface BridgeResponse {
   [key: string]: any;
 }
 
+interface RpcRequest {
+  jsonrpc?: string;
+  id: string | number | null;
+  method: string;
+  params?: any;
+}
+
 interface ContractState {
   contract_address: string;
   environment: string;
@@ -45,6 +59,23 @@ async function loadContractState(): Promise<Partial<ContractState>> {
   }
 }
 
+// Joined contract APIs, keyed by contract address and wallet mode
+const joinedApis = new Map<string, Promise<AuditVerifierAPI>>();
+
+function joinContract(contractAddress: string, withWallet: boolean): Promise<AuditVerifierAPI> {
+  const key = `${contractAddress}:${withWallet}`;
+  let api = joinedApis.get(key);
+  if (!api) {
+    const config = getConfig("testnet");
+    config.setNetworkId();
+    api = AuditVerifierAPI.join(config, contractAddress, logger, withWallet);
+    // Forget failed joins so the next request retries
+    api.catch(() => joinedApis.delete(key));
+    joinedApis.set(key, api);
+  }
+  return api;
+}
+
 function serializeLedger(ledger: Ledger): any {
   return JSON.parse(
     JSON.stringify(ledger, (key, value) => {
@@ -56,9 +87,16 @@ function serializeLedger(ledger: Ledger): any {
           .map((b) => b.toString(16).padStart(2, "0"))
           .join("");
       }
-      if (value instanceof Map) {
+      // Compact ledger maps are not Maps but iterate as [key, value] pairs
+      if (
+        value instanceof Map ||
+        (value !== null &&
+          typeof value === "object" &&
+          !Array.isArray(value) &&
+          typeof value[Symbol.iterator] === "function")
+      ) {
         const obj: any = {};
-        for (const [k, v] of value.entries()) {
+        for (const [k, v] of value) {
           const keyStr =
             k instanceof Uint8Array
               ? Array.from(k)
@@ -79,6 +117,7 @@ async function handleInit(data: any): Promise<BridgeResponse> {
 
   const config = getConfig(environment || "testnet");
   config.setNetworkId();
+  joinedApis.clear();
 
   if (mode === "deploy") {
     const api = await AuditVerifierAPI.deploy(config, logger);
@@ -118,6 +157,19 @@ async function handleInit(data: any): Promise<BridgeResponse> {
   }
 }
 
+function toSubmitRequest(audit: any) {
+  // Python API uses snake_case, convert to camelCase for TypeScript
+  return {
+    auditId: audit.audit_id,
+    auditorAddr: audit.auditor_addr,
+    threshold: BigInt(audit.threshold),
+    witness: {
+      exploitString: audit.witness.exploit_string,
+      riskScore: BigInt(audit.witness.risk_score),
+    },
+  };
+}
+
 async function handleSubmitAudit(data: any): Promise<BridgeResponse> {
   try {
     const { contract_address, environment } = await loadContractState();
@@ -129,23 +181,9 @@ async function handleSubmitAudit(data: any): Promise<BridgeResponse> {
       };
     }
 
-    const config = getConfig("testnet");
-    config.setNetworkId();
+    const api = await joinContract(contract_address, true);
 
-    const api = await AuditVerifierAPI.join(config, contract_address, logger, true);
-
-    const { audit_id, auditor_addr, threshold, witness } = data;
-
-    // Python API uses snake_case, convert to camelCase for TypeScript
-    const result = await api.submitAudit({
-      auditId: audit_id,
-      auditorAddr: auditor_addr,
-      threshold: BigInt(threshold),
-      witness: {
-        exploitString: witness.exploit_string,  
-        riskScore: BigInt(witness.risk_score),  
-      },
-    });
+    const result = await api.submitAudit(toSubmitRequest(data));
 
     return {
       success: result.success,
@@ -163,6 +201,97 @@ async function handleSubmitAudit(data: any): Promise<BridgeResponse> {
   }
 }
 
+async function handleSubmitAudits(data: any): Promise<BridgeResponse> {
+  try {
+    const { contract_address } = await loadContractState();
+    if (!contract_address) {
+      return {
+        success: false,
+        error: "No contract initialized. Call init first.",
+        results: [],
+        ledger_state: {},
+      };
+    }
+
+    const api = await joinContract(contract_address, true);
+    const { results, ledgerState } = await api.submitAudits(
+      (data.audits || []).map(toSubmitRequest)
+    );
+
+    return {
+      success: true,
+      results: results.map((result) => ({
+        audit_id: result.auditId,
+        success: result.success,
+        transaction_id: result.transactionId,
+        block_height: result.blockHeight ? Number(result.blockHeight) : undefined,
+        error: result.error,
+      })),
+      ledger_state: serializeLedger(ledgerState),
+    };
+  } catch (error) {
+    return {
+      success: false,
+      error: error instanceof Error ? error.message : String(error),
+      results: [],
+      ledger_state: {},
+    };
+  }
+}
+
+async function handleWalletStatus(data: any): Promise<BridgeResponse> {
+  try {
+    const { contract_address } = await loadContractState();
+    if (!contract_address) {
+      return {
+        success: false,
+        error: "No contract initialized. Call init first.",
+      };
+    }
+
+    const api = await joinContract(contract_address, true);
+    const status = await api.walletStatus();
+
+    return {
+      success: true,
+      address: status.address,
+      available_balance: status.availableBalance.toString(),
+      available_coins: status.availableCoins,
+      pending_coins: status.pendingCoins,
+    };
+  } catch (error) {
+    return {
+      success: false,
+      error: error instanceof Error ? error.message : String(error),
+    };
+  }
+}
+
+async function handleTransfer(data: any): Promise<BridgeResponse> {
+  try {
+    const { contract_address } = await loadContractState();
+    if (!contract_address) {
+      return {
+        success: false,
+        error: "No contract initialized. Call init first.",
+      };
+    }
+
+    const api = await joinContract(contract_address, true);
+    const transactionId = await api.transfer(data.receiver_address, BigInt(data.amount));
+
+    return {
+      success: true,
+      transaction_id: transactionId,
+    };
+  } catch (error) {
+    return {
+      success: false,
+      error: error instanceof Error ? error.message : String(error),
+    };
+  }
+}
+
 async function handleQueryAudit(data: any): Promise<BridgeResponse> {
   try {
     const { contract_address, environment } = await loadContractState();
@@ -173,10 +302,7 @@ async function handleQueryAudit(data: any): Promise<BridgeResponse> {
       };
     }
 
-    const config = getConfig("testnet");
-    config.setNetworkId();
-
-    const api = await AuditVerifierAPI.join(config, contract_address, logger, false);
+    const api = await joinContract(contract_address, false);
 
     const result = await api.queryAudit({ auditId: data.audit_id });
 
@@ -203,10 +329,7 @@ async function handleGetLedger(data: any): Promise<BridgeResponse> {
       };
     }
 
-    const config = getConfig("testnet");
-    config.setNetworkId();
-
-    const api = await AuditVerifierAPI.join(config, contract_address, logger, false);
+    const api = await joinContract(contract_address, false);
 
     const ledgerState = await api.getLedgerState();
 
@@ -222,33 +345,73 @@ async function handleGetLedger(data: any): Promise<BridgeResponse> {
   }
 }
 
+async function dispatch(operation: string, data: any): Promise<BridgeResponse> {
+  switch (operation) {
+    case "init":
+      return handleInit(data);
+    case "submit_audit":
+      return handleSubmitAudit(data);
+    case "submit_audits":
+      return handleSubmitAudits(data);
+    case "query_audit":
+      return handleQueryAudit(data);
+    case "get_ledger":
+      return handleGetLedger(data);
+    case "wallet_status":
+      return handleWalletStatus(data);
+    case "transfer":
+      return handleTransfer(data);
+    default:
+      return {
+        success: false,
+        error: `Unknown operation: ${operation}`,
+      };
+  }
+}
+
+async function handleRpc(line: string): Promise<any> {
+  let request: RpcRequest;
+  try {
+    request = JSON.parse(line);
+  } catch {
+    return { jsonrpc: "2.0", id: null, error: { code: -32700, message: "Parse error" } };
+  }
+
+  try {
+    if (request.method === "ping") {
+      return { jsonrpc: "2.0", id: request.id, result: { success: true, pid: process.pid } };
+    }
+    const result = await dispatch(request.method, request.params || {});
+    return { jsonrpc: "2.0", id: request.id, result };
+  } catch (error) {
+    return {
+      jsonrpc: "2.0",
+      id: request.id,
+      error: { code: -32000, message: error instanceof Error ? error.message : String(error) },
+    };
+  }
+}
+
+async function serve() {
+  const lines = createInterface({ input: process.stdin, terminal: false });
+  // Requests are handled one at a time; the Python pool never pipelines a worker
+  for await (const line of lines) {
+    if (!line.trim()) {
+      continue;
+    }
+    const response = await handleRpc(line);
+    process.stdout.write(JSON.stringify(response) + "\n");
+  }
+  process.exit(0);
+}
+
 async function main() {
   try {
     const operation = process.argv[2];
     const dataJson = process.argv[3] || "{}";
     const data = JSON.parse(dataJson);
 
-    let result: BridgeResponse;
-
-    switch (operation) {
-      case "init":
-        result = await handleInit(data);
-        break;
-      case "submit_audit":
-        result = await handleSubmitAudit(data);
-        break;
-      case "query_audit":
-        result = await handleQueryAudit(data);
-        break;
-      case "get_ledger":
-        result = await handleGetLedger(data);
-        break;
-      default:
-        result = {
-          success: false,
-          error: `Unknown operation: ${operation}`,
-        };
-    }
+    const result = await dispatch(operation, data);
 
     console.log(JSON.stringify(result));
     process.exit(0);
@@ -262,4 +425,8 @@ async function main() {
   }
 }
 
-main();
+if (process.argv[2] === "serve") {
+  serve();
+} else {
+  main();
+}
@@ -55,6 +55,20 @@ export interface SubmitAuditResponse {
   ledgerState: Ledger;
 }
 
+export interface AuditSubmissionResult {
+  auditId: string;
+  success: boolean;
+  transactionId?: string;
+  blockHeight?: bigint;
+  error?: string;
+}
+
+
+export interface SubmitAuditsResponse {
+  results: AuditSubmissionResult[];
+  ledgerState: Ledger;
+}
+
 export interface QueryAuditRequest {
   auditId: string;
 }
@@ -66,3 +80,11 @@ export interface QueryAuditResponse {
   proofHash?: string;
   isVerified?: boolean;
 }
+
+
+export interface WalletStatus {
+  address: string;
+  availableBalance: bigint;  // Native token
+  availableCoins: number;
+  pendingCoins: number;
+}
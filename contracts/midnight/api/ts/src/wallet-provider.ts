@@ -24,6 +24,7 @@ const bip32 = BIP32Factory(ecc);
  *
  * @param config - Network configuration
  * @param mnemonicOrSeed - 24-word mnemonic phrase or 64-char hex seed
+ * @param accountIndex - BIP44 account derived from a mnemonic (one wallet per pool member)
  */
 export async function createWalletProviders(
   config: {
@@ -33,7 +34,8 @@ export async function createWalletProviders(
     proofServer: string;
     networkId: NetworkId; 
   },
-  mnemonicOrSeed?: string
+  mnemonicOrSeed?: string,
+  accountIndex: number = walletAccountIndex()
 ): Promise<{
   wallet: Wallet;
   provider: any;
@@ -50,7 +52,7 @@ export async function createWalletProviders(
     const seed = mnemonicToSeedSync(mnemonicOrSeed!);
     const root = bip32.fromSeed(seed);
 
-    const path = "m/44'/2400'/0'/0/0";
+    const path = `m/44'/2400'/${accountIndex}'/0/0`;
     const child = root.derivePath(path);
 
     if (!child.privateKey) {
@@ -121,12 +123,30 @@ function generateRandomSeed(): string {
     .join("");
 }
 
+/**
+ * Index of this process's wallet in the API's wallet pool (MIDNIGHT_WALLET_INDEX, default 0)
+ */
+export function walletAccountIndex(): number {
+  return Number(process.env.MIDNIGHT_WALLET_INDEX || 0);
+}
+
 /**
  * Get wallet mnemonic or seed from environment
- * Priority: MNEMONIC > SEED > throw error
+ * Priority: SEEDS (wallet pool) > MNEMONIC > SEED > throw error
  */
 export function getWalletCredentials(): string {
 
+  if (process.env.MIDNIGHT_WALLET_SEEDS) {
+    // One hex seed per pooled wallet, comma-separated
+    const seeds = process.env.MIDNIGHT_WALLET_SEEDS.split(",").map((seed) => seed.trim());
+    const index = walletAccountIndex();
+    if (!seeds[index]) {
+      throw new Error(`MIDNIGHT_WALLET_SEEDS has no seed for wallet ${index}`);
+    }
+    console.error(`Using pooled wallet seed ${index} from MIDNIGHT_WALLET_SEEDS`);
+    return seeds[index];
+  }
+
   if (process.env.MIDNIGHT_MNEMONIC) {
     console.error("Using mnemonic from MIDNIGHT_MNEMONIC env var");
     return process.env.MIDNIGHT_MNEMONIC;